@@ -12,6 +12,10 @@ MODEL_ID=gemini-2.5-flash-002
 # BigQuery Datasets
 METADATA_DATASET=unity_catalog_metadata
 ML_DATASET=ml_models
+# Read compliance counts from materialized views (create with `make compliance-views`)
+USE_COMPLIANCE_VIEWS=false
+# Match /discover keywords against a search index (create with `make search-index`)
+USE_SEARCH_INDEX=false
 
 # Unity Catalog Configuration
 UNITY_CATALOG_HOST=your-unity-catalog-host
@@ -24,11 +28,16 @@ API_BASE_URL=http://localhost:8080
 # Application Configuration
 LOG_LEVEL=INFO
 DEBUG=false
+CACHE_TTL_SECONDS=300
+# Token for POST /admin/flush-cache; leave empty to disable the endpoint
+ADMIN_TOKEN=
 
 # Backend Server Configuration
 UVICORN_HOST=0.0.0.0
 UVICORN_PORT=8080
 UVICORN_RELOAD=true
+# Uvicorn worker processes in the container image
+WEB_CONCURRENCY=1
 
 # Streamlit Configuration
 STREAMLIT_BROWSER_GATHER_USAGE_STATS=false
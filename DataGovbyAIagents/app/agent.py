@@ -14,19 +14,48 @@
 
 """AI Agents for data governance powered by Gemini 2.5 Flash."""
 
+import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import re
+import string
+import threading
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
-import pandas as pd
-import vertexai
-from vertexai.generative_models import GenerativeModel
+from cachetools import TTLCache
 
 from app.governance_engine import GovernanceEngine
 from app.unity_catalog_client import UnityCatalogClient
 
 logger = logging.getLogger(__name__)
 
+# First word long enough to be a meaningful search keyword
+_KEYWORD_RE = re.compile(r"\b\w{4,}\b")
+
+_DESCRIPTION_PROMPT = string.Template(
+    """
+Generate a clear, concise description for this database table:
+
+Table: $table
+Total Columns: $column_count
+
+Columns:
+$columns
+
+Analyze the column names and types to infer:
+1. What business entity or concept this table represents
+2. The table's purpose in the data architecture
+3. Key information stored
+
+Provide a 2-3 sentence description that would be helpful for:
+- Data analysts searching for data
+- Business users understanding available data
+- Data governance documentation
+
+Format: Professional, clear, and business-focused.
+"""
+)
+
 
 class DataGovernanceAgent:
     """Main AI agent for data governance combining discovery, compliance, and documentation.
@@ -41,6 +70,9 @@ class DataGovernanceAgent:
         metadata_dataset: str = "unity_catalog_metadata",
         ml_dataset: Optional[str] = None,
         model_id: str = "gemini-2.5-flash-002",
+        cache_ttl: int = 300,
+        use_materialized_views: bool = False,
+        use_search_index: bool = False,
     ) -> None:
         """Initialize the data governance agent.
 
@@ -50,6 +82,12 @@ class DataGovernanceAgent:
             metadata_dataset: BigQuery dataset with UC metadata
             ml_dataset: BigQuery dataset with ML results (optional)
             model_id: Gemini model ID to use
+            cache_ttl: Seconds to reuse compliance, PII and metadata health
+                results before querying BigQuery again
+            use_materialized_views: Read compliance counts from the
+                materialized views instead of scanning the base tables
+            use_search_index: Match discovery keywords against the tables
+                search index instead of scanning with LIKE
         """
         if project_id is None:
             project_id = os.getenv("PROJECT_ID")
@@ -63,9 +101,25 @@ class DataGovernanceAgent:
         self.metadata_dataset = metadata_dataset
         self.ml_dataset = ml_dataset
         self.model_id = model_id
-
-        # Initialize Vertex AI
+        self.cache_ttl = cache_ttl
+
+        # Fivetran syncs land on the order of hours, so the read-only
+        # governance views can be served from memory between syncs.
+        self._response_cache: TTLCache = TTLCache(maxsize=32, ttl=cache_ttl)
+        # Descriptions depend only on a table's columns, keyed accordingly
+        self._description_cache: TTLCache = TTLCache(maxsize=1024, ttl=3600)
+        # query_with_ai: the summary context is shared by every question,
+        # answers are reused for repeated questions against the same context
+        self._context_cache: TTLCache = TTLCache(maxsize=1, ttl=cache_ttl)
+        self._answer_cache: TTLCache = TTLCache(maxsize=512, ttl=600)
+        self._cache_lock = threading.Lock()
+
+        # Initialize Vertex AI; imported here so the SDK's import cost is only
+        # paid when an agent is actually constructed.
         try:
+            import vertexai
+            from vertexai.generative_models import GenerativeModel
+
             vertexai.init(project=project_id, location=location)
             self.model = GenerativeModel(model_id)
             logger.info(f"Initialized Gemini model {model_id}")
@@ -78,12 +132,15 @@ class DataGovernanceAgent:
             project_id=project_id,
             metadata_dataset=metadata_dataset,
             ml_dataset=ml_dataset,
+            use_search_index=use_search_index,
+            use_materialized_views=use_materialized_views,
         )
 
         self.governance = GovernanceEngine(
             project_id=project_id,
             metadata_dataset=metadata_dataset,
             ml_dataset=ml_dataset,
+            use_materialized_views=use_materialized_views,
         )
 
         logger.info(
@@ -91,11 +148,12 @@ class DataGovernanceAgent:
             f"with model {model_id}"
         )
 
-    def discover_data(self, query: str) -> Dict[str, Any]:
+    def discover_data(self, query: str, limit: int = 20) -> Dict[str, Any]:
         """Discover data in Unity Catalog using natural language.
 
         Args:
             query: Natural language query about data
+            limit: Maximum number of tables to return
 
         Returns:
             Dictionary with discovery results
@@ -104,12 +162,12 @@ class DataGovernanceAgent:
             logger.info(f"Processing discovery query: {query}")
 
             # Use keyword search for now
-            keywords = [w for w in query.split() if len(w) > 3]
-            if not keywords:
+            match = _KEYWORD_RE.search(query)
+            if match is None:
                 return {"results": [], "message": "No meaningful keywords found"}
 
-            keyword = keywords[0].lower()
-            tables = self.uc_client.search_tables_by_keyword(keyword, limit=20)
+            keyword = match.group(0).lower()
+            tables = self.uc_client.search_tables_by_keyword(keyword, limit=limit)
 
             return {
                 "query": query,
@@ -128,6 +186,10 @@ class DataGovernanceAgent:
         Returns:
             Dictionary with compliance metrics
         """
+        cached = self._cache_get("compliance")
+        if cached is not None:
+            return cached
+
         try:
             logger.info("Checking governance compliance")
 
@@ -136,22 +198,110 @@ class DataGovernanceAgent:
             undocumented = self.governance.get_undocumented_tables(limit=20)
             freshness = self.uc_client.get_metadata_freshness()
 
-            return {
-                "compliance_score": score,
-                "high_risk_tables": high_risk,
-                "undocumented_tables": undocumented,
-                "metadata_freshness": freshness,
-                "summary": {
-                    "overall_score": score.get("overall_compliance_score", 0),
-                    "high_risk_count": len(high_risk),
-                    "undocumented_count": len(undocumented),
-                },
-            }
+            return self._cache_put(
+                "compliance",
+                self._compliance_report(score, high_risk, undocumented, freshness),
+            )
 
         except Exception as e:
             logger.error(f"Error checking compliance: {e}")
             return {"error": str(e)}
 
+    async def acheck_compliance(self) -> Dict[str, Any]:
+        """Check overall data governance compliance concurrently.
+
+        Issues the four independent BigQuery lookups at once, so wall time
+        is bounded by the slowest query rather than their sum.
+
+        Returns:
+            Dictionary with compliance metrics
+        """
+        cached = self._cache_get("compliance")
+        if cached is not None:
+            return cached
+
+        try:
+            logger.info("Checking governance compliance")
+
+            score, high_risk, undocumented, freshness = await asyncio.gather(
+                self.governance.aget_compliance_score(),
+                self.governance.aget_high_risk_tables(),
+                self.governance.aget_undocumented_tables(limit=20),
+                self.uc_client.aget_metadata_freshness(),
+            )
+
+            return self._cache_put(
+                "compliance",
+                self._compliance_report(score, high_risk, undocumented, freshness),
+            )
+
+        except Exception as e:
+            logger.error(f"Error checking compliance: {e}")
+            return {"error": str(e)}
+
+    @staticmethod
+    def _compliance_report(
+        score: Dict[str, Any],
+        high_risk: List[Dict[str, Any]],
+        undocumented: List[Dict[str, Any]],
+        freshness: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Assemble the compliance response from its component lookups."""
+        return {
+            "compliance_score": score,
+            "high_risk_tables": high_risk,
+            "undocumented_tables": undocumented,
+            "metadata_freshness": freshness,
+            "summary": {
+                "overall_score": score.get("overall_compliance_score", 0),
+                "high_risk_count": len(high_risk),
+                "undocumented_count": len(undocumented),
+            },
+        }
+
+    def get_overview(self) -> Dict[str, Any]:
+        """Get the headline governance metrics for the overview page.
+
+        Freshness, documentation and PII figures come from a single
+        BigQuery query rather than the full compliance report.
+
+        Returns:
+            Dictionary with metadata health, summary scores and the
+            highest risk tables
+        """
+        cached = self._cache_get("overview")
+        if cached is not None:
+            return cached
+
+        try:
+            bundle = self.uc_client.get_overview_bundle()
+            if "error" in bundle:
+                return bundle
+
+            documentation = bundle["documentation"]
+            pii = bundle["pii"]
+            return self._cache_put(
+                "overview",
+                {
+                    "metadata_health": bundle["freshness"],
+                    "summary": {
+                        "overall_score": self.governance.score(
+                            documentation["documentation_pct"], pii["high_risk_pct"]
+                        ),
+                        "documentation_pct": documentation["documentation_pct"],
+                        # HIGH and MEDIUM, matching /compliance
+                        "high_risk_count": pii["risk_tables_count"],
+                        "undocumented_count": documentation["total_tables"]
+                        - documentation["documented_tables"],
+                    },
+                    "high_risk_tables": pii["risk_tables"],
+                },
+            )
+
+        except Exception as e:
+            logger.error(f"Error getting overview: {e}")
+            return {"error": str(e)}
+
     def get_table_details(self, table_name: str) -> Dict[str, Any]:
         """Get detailed information about a table.
 
@@ -180,49 +330,122 @@ class DataGovernanceAgent:
         try:
             logger.info(f"Generating description for {table_name}")
 
-            # Get table details
-            details = self.get_table_details(table_name)
-            if "error" in details:
-                return f"Error: {details['error']}"
+            prompt, cache_key = self._build_description_prompt(table_name)
+            with self._cache_lock:
+                cached = self._description_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
-            # Build column information
-            columns = details.get("columns", [])
-            column_info = "\n".join(
-                [f"- {col['column_name']} ({col['data_type']})" for col in columns]
-            )
+            response = self.model.generate_content(prompt)
+            description = response.text
+            with self._cache_lock:
+                self._description_cache[cache_key] = description
 
-            # Create prompt for Gemini
-            prompt = f"""
-            Generate a clear, concise description for this database table:
+            logger.info(f"Generated description for {table_name}")
+            return description
 
-            Table: {table_name}
-            Total Columns: {len(columns)}
+        except Exception as e:
+            logger.error(f"Error generating description: {e}")
+            return f"Error generating description: {str(e)}"
 
-            Columns:
-            {column_info}
+    def stream_table_description(self, table_name: str) -> Iterator[str]:
+        """Stream an AI description for a table as Gemini produces it.
 
-            Analyze the column names and types to infer:
-            1. What business entity or concept this table represents
-            2. The table's purpose in the data architecture
-            3. Key information stored
+        Args:
+            table_name: Fully qualified table name
 
-            Provide a 2-3 sentence description that would be helpful for:
-            - Data analysts searching for data
-            - Business users understanding available data
-            - Data governance documentation
+        Yields:
+            Chunks of the AI-generated description
+        """
+        try:
+            logger.info(f"Streaming description for {table_name}")
 
-            Format: Professional, clear, and business-focused.
-            """
+            prompt, cache_key = self._build_description_prompt(table_name)
+            with self._cache_lock:
+                cached = self._description_cache.get(cache_key)
+            if cached is not None:
+                yield cached
+                return
 
-            response = self.model.generate_content(prompt)
-            description = response.text
+            chunks = []
+            for chunk in self.model.generate_content(prompt, stream=True):
+                chunks.append(chunk.text)
+                yield chunk.text
+            with self._cache_lock:
+                self._description_cache[cache_key] = "".join(chunks)
 
-            logger.info(f"Generated description for {table_name}")
-            return description
+            logger.info(f"Streamed description for {table_name}")
 
         except Exception as e:
-            logger.error(f"Error generating description: {e}")
-            return f"Error generating description: {str(e)}"
+            logger.error(f"Error streaming description: {e}")
+            yield f"Error generating description: {str(e)}"
+
+    async def generate_descriptions_batch(
+        self, table_names: List[str], max_concurrency: int = 8
+    ) -> Dict[str, str]:
+        """Generate AI descriptions for several tables concurrently.
+
+        Args:
+            table_names: Fully qualified table names
+            max_concurrency: Maximum Gemini requests in flight at once
+
+        Returns:
+            Mapping of table name to AI-generated description
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def describe(table_name: str) -> str:
+            async with semaphore:
+                return await asyncio.to_thread(
+                    self.generate_table_description, table_name
+                )
+
+        descriptions = await asyncio.gather(
+            *(describe(table_name) for table_name in table_names)
+        )
+        return dict(zip(table_names, descriptions, strict=True))
+
+    def _build_description_prompt(
+        self, table_name: str
+    ) -> Tuple[str, Tuple[str, int]]:
+        """Build the Gemini prompt describing a table's columns.
+
+        Args:
+            table_name: Fully qualified table name
+
+        Returns:
+            Prompt text and a cache key identifying the table's column layout
+
+        Raises:
+            ValueError: If the table details cannot be retrieved
+        """
+        details = self.get_table_details(table_name)
+        if "error" in details:
+            raise ValueError(details["error"])
+
+        columns = [
+            (col["column_name"], col["data_type"])
+            for col in details.get("columns", [])
+        ]
+        prompt = _DESCRIPTION_PROMPT.substitute(
+            table=table_name,
+            column_count=len(columns),
+            columns="\n".join(f"- {name} ({data_type})" for name, data_type in columns),
+        )
+        return prompt, (table_name, hash(tuple(columns)))
+
+    def get_pii_for_tables(
+        self, table_names: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get PII status for several tables with a single lookup.
+
+        Args:
+            table_names: Fully qualified table names
+
+        Returns:
+            Mapping of table name to its PII summary
+        """
+        return self.uc_client.get_pii_for_tables(table_names)
 
     def analyze_pii_risk(self) -> Dict[str, Any]:
         """Analyze PII risk across the catalog.
@@ -230,20 +453,29 @@ class DataGovernanceAgent:
         Returns:
             Dictionary with PII risk analysis
         """
+        cached = self._cache_get("pii_risk")
+        if cached is not None:
+            return cached
+
         try:
             logger.info("Analyzing PII risk")
 
-            pii_tables = self.uc_client.get_pii_status()
-            high_risk = [t for t in pii_tables if t.get("risk_level") == "HIGH"]
-            medium_risk = [t for t in pii_tables if t.get("risk_level") == "MEDIUM"]
-
-            return {
-                "total_tables_with_pii": len(pii_tables),
-                "high_risk_count": len(high_risk),
-                "medium_risk_count": len(medium_risk),
-                "high_risk_tables": high_risk[:10],
-                "medium_risk_tables": medium_risk[:10],
-            }
+            summary = self.uc_client.get_pii_risk_summary(sample_size=10)
+            high_risk = summary.get("HIGH", {})
+            medium_risk = summary.get("MEDIUM", {})
+
+            return self._cache_put(
+                "pii_risk",
+                {
+                    "total_tables_with_pii": sum(
+                        level["table_count"] for level in summary.values()
+                    ),
+                    "high_risk_count": high_risk.get("table_count", 0),
+                    "medium_risk_count": medium_risk.get("table_count", 0),
+                    "high_risk_tables": high_risk.get("tables", []),
+                    "medium_risk_tables": medium_risk.get("tables", []),
+                },
+            )
 
         except Exception as e:
             logger.error(f"Error analyzing PII risk: {e}")
@@ -255,13 +487,40 @@ class DataGovernanceAgent:
         Returns:
             Dictionary with metadata health metrics
         """
+        cached = self._cache_get("metadata_health")
+        if cached is not None:
+            return cached
+
         try:
             logger.info("Checking metadata health")
-            return self.uc_client.get_metadata_freshness()
+            return self._cache_put(
+                "metadata_health", self.uc_client.get_metadata_freshness()
+            )
         except Exception as e:
             logger.error(f"Error checking metadata health: {e}")
             return {"error": str(e)}
 
+    def clear_cache(self) -> None:
+        """Drop all cached compliance, PII and metadata health results."""
+        with self._cache_lock:
+            self._response_cache.clear()
+            self._context_cache.clear()
+            self._answer_cache.clear()
+        self.uc_client.invalidate()
+        logger.info("Response cache cleared")
+
+    def _cache_get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return a cached response if it has not expired."""
+        with self._cache_lock:
+            return self._response_cache.get(key)
+
+    def _cache_put(self, key: str, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a response unless it reports an error, then return it."""
+        if "error" not in result:
+            with self._cache_lock:
+                self._response_cache[key] = result
+        return result
+
     def query_with_ai(self, question: str) -> str:
         """Answer questions about data using AI.
 
@@ -274,10 +533,14 @@ class DataGovernanceAgent:
         try:
             logger.info(f"Processing AI query: {question}")
 
-            # Create context from available information
-            compliance = self.check_compliance()
-            metadata_health = self.get_metadata_health()
+            context = self._get_context()
+            cache_key = (question, context)
+            with self._cache_lock:
+                cached = self._answer_cache.get(cache_key)
+            if cached is not None:
+                return cached
 
+            score, high_risk_count, freshness_status = context
             prompt = f"""
             You are a data governance expert. Answer the following question about
             a data catalog based on the provided metadata:
@@ -285,15 +548,17 @@ class DataGovernanceAgent:
             Question: {question}
 
             Context:
-            - Compliance Score: {compliance.get('summary', {}).get('overall_score', 0)}/100
-            - High Risk Tables: {compliance.get('summary', {}).get('high_risk_count', 0)}
-            - Metadata Status: {metadata_health.get('freshness_status', 'UNKNOWN')}
+            - Compliance Score: {score}/100
+            - High Risk Tables: {high_risk_count}
+            - Metadata Status: {freshness_status}
 
             Provide a helpful, professional answer based on the context.
             """
 
             response = self.model.generate_content(prompt)
             answer = response.text
+            with self._cache_lock:
+                self._answer_cache[cache_key] = answer
 
             logger.info("AI query processed successfully")
             return answer
@@ -301,3 +566,26 @@ class DataGovernanceAgent:
         except Exception as e:
             logger.error(f"Error in AI query: {e}")
             return f"Error processing query: {str(e)}"
+
+    def _get_context(self) -> Tuple[Any, Any, str]:
+        """Return the summary figures that ground :meth:`query_with_ai`.
+
+        Returns:
+            Tuple of (compliance score, high risk table count, freshness status)
+        """
+        with self._cache_lock:
+            cached = self._context_cache.get("context")
+        if cached is not None:
+            return cached
+
+        compliance = self.check_compliance()
+        metadata_health = self.get_metadata_health()
+        context = (
+            compliance.get("summary", {}).get("overall_score", 0),
+            compliance.get("summary", {}).get("high_risk_count", 0),
+            metadata_health.get("freshness_status", "UNKNOWN"),
+        )
+        if "error" not in compliance and "error" not in metadata_health:
+            with self._cache_lock:
+                self._context_cache["context"] = context
+        return context
@@ -14,13 +14,19 @@
 
 """Data governance engine for compliance monitoring and scoring."""
 
+import asyncio
 import logging
 from typing import Any, Dict, List, Optional
 
-from google.cloud import bigquery
+from cachetools import LRUCache
+
+from app.utils.bigquery import get_bq_client, query_config, rows_to_dicts
 
 logger = logging.getLogger(__name__)
 
+# Clustered copy of pii_summary_by_table created by create_compliance_views
+PII_SUMMARY_VIEW = "pii_summary_by_risk"
+
 
 class GovernanceEngine:
     """Engine for data governance, compliance monitoring, and PII detection.
@@ -34,6 +40,7 @@ class GovernanceEngine:
         project_id: str,
         metadata_dataset: str,
         ml_dataset: Optional[str] = None,
+        use_materialized_views: bool = False,
     ) -> None:
         """Initialize governance engine.
 
@@ -41,13 +48,26 @@ class GovernanceEngine:
             project_id: GCP project ID
             metadata_dataset: BigQuery dataset with UC metadata
             ml_dataset: BigQuery dataset with ML results (optional)
+            use_materialized_views: Read compliance counts from the views
+                created by :meth:`create_compliance_views`
         """
         self.project_id = project_id
         self.metadata_dataset = metadata_dataset
         self.ml_dataset = ml_dataset
-        self.bq_client = bigquery.Client(project=project_id)
+        self.use_materialized_views = use_materialized_views
+        self.bq_client = get_bq_client(project_id)
+        # Only confirmed tables are remembered, so newly synced tables are
+        # still found on their next lookup.
+        self._known_tables: LRUCache = LRUCache(maxsize=1024)
         logger.info(f"Initialized GovernanceEngine for project {project_id}")
 
+    @property
+    def _pii_table(self) -> str:
+        """Name of the table to read per-table PII summaries from."""
+        if self.use_materialized_views:
+            return PII_SUMMARY_VIEW
+        return "pii_summary_by_table"
+
     def get_compliance_score(self) -> Dict[str, Any]:
         """Calculate overall compliance score.
 
@@ -55,45 +75,59 @@ class GovernanceEngine:
             Dictionary with compliance metrics and overall score
         """
         try:
-            if self.ml_dataset:
-                query = f"""
-                WITH metrics AS (
-                    SELECT
-                        (SELECT COUNT(*) FROM `{self.project_id}.{self.metadata_dataset}.tables`) as total_tables,
-                        (SELECT COUNT(*) FROM `{self.project_id}.{self.ml_dataset}.pii_summary_by_table`
-                         WHERE pii_columns_count > 0) as tables_with_pii,
-                        (SELECT COUNT(*) FROM `{self.project_id}.{self.ml_dataset}.pii_summary_by_table`
-                         WHERE risk_level = 'HIGH') as high_risk_tables,
-                        (SELECT COUNT(*) FROM `{self.project_id}.{self.metadata_dataset}.tables`
-                         WHERE comment IS NOT NULL) as documented_tables
-                )
-
+            # One scan per base table (or materialized view); both jobs are
+            # submitted before either is awaited so BigQuery runs them
+            # concurrently.
+            if self.use_materialized_views:
+                tables_query = f"""
                 SELECT
-                    *,
-                    ROUND(100.0 * documented_tables / NULLIF(total_tables, 0), 2) as documentation_pct,
-                    ROUND(100.0 * high_risk_tables / NULLIF(tables_with_pii, 0), 2) as high_risk_pct
-                FROM metrics
+                    total_tables,
+                    documented_tables,
+                    ROUND(100.0 * documented_tables / NULLIF(total_tables, 0), 2) as documentation_pct
+                FROM `{self.project_id}.{self.metadata_dataset}.compliance_metrics`
                 """
             else:
-                query = f"""
+                tables_query = f"""
                 SELECT
                     COUNT(*) as total_tables,
-                    0 as tables_with_pii,
-                    0 as high_risk_tables,
-                    SUM(CASE WHEN comment IS NOT NULL THEN 1 ELSE 0 END) as documented_tables,
-                    ROUND(100.0 * SUM(CASE WHEN comment IS NOT NULL THEN 1 ELSE 0 END) / NULLIF(COUNT(*), 0), 2) as documentation_pct,
-                    0.0 as high_risk_pct
+                    COUNTIF(comment IS NOT NULL) as documented_tables,
+                    ROUND(100.0 * COUNTIF(comment IS NOT NULL) / NULLIF(COUNT(*), 0), 2) as documentation_pct
                 FROM `{self.project_id}.{self.metadata_dataset}.tables`
                 """
+            tables_job = self.bq_client.query(tables_query)
 
-            result = self.bq_client.query(query).to_dataframe().to_dict("records")[0]
-
-            # Calculate overall score (0-100)
-            doc_score = result["documentation_pct"] * 0.4
-            risk_score = max(0, 100 - result.get("high_risk_pct", 0)) * 0.6
-            overall_score = doc_score + risk_score
+            pii_job = None
+            if self.ml_dataset:
+                if self.use_materialized_views:
+                    pii_query = f"""
+                    SELECT
+                        tables_with_pii,
+                        high_risk_tables,
+                        ROUND(100.0 * high_risk_tables / NULLIF(tables_with_pii, 0), 2) as high_risk_pct
+                    FROM `{self.project_id}.{self.ml_dataset}.pii_compliance_metrics`
+                    """
+                else:
+                    pii_query = f"""
+                    SELECT
+                        COUNTIF(pii_columns_count > 0) as tables_with_pii,
+                        COUNTIF(risk_level = 'HIGH') as high_risk_tables,
+                        ROUND(100.0 * COUNTIF(risk_level = 'HIGH') / NULLIF(COUNTIF(pii_columns_count > 0), 0), 2) as high_risk_pct
+                    FROM `{self.project_id}.{self.ml_dataset}.pii_summary_by_table`
+                    """
+                pii_job = self.bq_client.query(pii_query)
+
+            result = rows_to_dicts(tables_job.result())[0]
+            if pii_job is not None:
+                result.update(rows_to_dicts(pii_job.result())[0])
+            else:
+                result.update(
+                    tables_with_pii=0, high_risk_tables=0, high_risk_pct=0.0
+                )
 
-            result["overall_compliance_score"] = round(overall_score, 2)
+            overall_score = self.score(
+                result["documentation_pct"], result.get("high_risk_pct")
+            )
+            result["overall_compliance_score"] = overall_score
 
             logger.info(f"Compliance score calculated: {overall_score}")
             return result
@@ -107,6 +141,83 @@ class GovernanceEngine:
                 "total_tables": 0,
             }
 
+    @staticmethod
+    def score(
+        documentation_pct: Optional[float], high_risk_pct: Optional[float]
+    ) -> float:
+        """Combine documentation and PII risk rates into a 0-100 score.
+
+        Args:
+            documentation_pct: Percentage of tables with a comment
+            high_risk_pct: Percentage of PII tables rated high risk
+
+        Returns:
+            Overall compliance score
+        """
+        doc_score = (documentation_pct or 0) * 0.4
+        risk_score = max(0, 100 - (high_risk_pct or 0)) * 0.6
+        return round(doc_score + risk_score, 2)
+
+    def create_compliance_views(self) -> None:
+        """Create materialized views holding the compliance counts.
+
+        BigQuery keeps the views up to date as Fivetran writes to the base
+        tables, so :meth:`get_compliance_score` reads a single
+        pre-aggregated row instead of scanning the tables.
+        """
+        statements = [
+            f"""
+            CREATE MATERIALIZED VIEW IF NOT EXISTS
+                `{self.project_id}.{self.metadata_dataset}.compliance_metrics` AS
+            SELECT
+                COUNT(*) as total_tables,
+                COUNTIF(comment IS NOT NULL) as documented_tables
+            FROM `{self.project_id}.{self.metadata_dataset}.tables`
+            """
+        ]
+        if self.ml_dataset:
+            statements.append(
+                f"""
+                CREATE MATERIALIZED VIEW IF NOT EXISTS
+                    `{self.project_id}.{self.ml_dataset}.pii_compliance_metrics` AS
+                SELECT
+                    COUNTIF(pii_columns_count > 0) as tables_with_pii,
+                    COUNTIF(risk_level = 'HIGH') as high_risk_tables
+                FROM `{self.project_id}.{self.ml_dataset}.pii_summary_by_table`
+                """
+            )
+            # Clustering lets risk level and schema filters skip the blocks
+            # of other levels/schemas instead of scanning every PII row.
+            statements.append(
+                f"""
+                CREATE MATERIALIZED VIEW IF NOT EXISTS
+                    `{self.project_id}.{self.ml_dataset}.{PII_SUMMARY_VIEW}`
+                CLUSTER BY risk_level, table_schema, table_catalog AS
+                SELECT
+                    table_catalog,
+                    table_schema,
+                    table_name,
+                    full_table_name,
+                    pii_columns_count,
+                    pii_columns,
+                    risk_level,
+                    avg_pii_score_pct
+                FROM `{self.project_id}.{self.ml_dataset}.pii_summary_by_table`
+                """
+            )
+
+        for statement in statements:
+            self.bq_client.query(statement).result()
+        logger.info(f"Created {len(statements)} compliance materialized views")
+
+    async def aget_compliance_score(self) -> Dict[str, Any]:
+        """Async variant of :meth:`get_compliance_score`.
+
+        Runs the blocking BigQuery call in a worker thread so several
+        queries can be awaited concurrently.
+        """
+        return await asyncio.to_thread(self.get_compliance_score)
+
     def get_high_risk_tables(self) -> List[Dict[str, Any]]:
         """Get list of high-risk tables requiring attention.
 
@@ -130,7 +241,7 @@ class GovernanceEngine:
                 t.avg_pii_score_pct,
                 CASE WHEN tm.comment IS NULL THEN TRUE ELSE FALSE END as undocumented,
                 tm._fivetran_synced as last_synced
-            FROM `{self.project_id}.{self.ml_dataset}.pii_summary_by_table` t
+            FROM `{self.project_id}.{self.ml_dataset}.{self._pii_table}` t
             LEFT JOIN `{self.project_id}.{self.metadata_dataset}.tables` tm
                 ON t.table_catalog = tm.catalog_name
                 AND t.table_schema = tm.schema_name
@@ -141,14 +252,18 @@ class GovernanceEngine:
                 t.pii_columns_count DESC
             """
 
-            results = self.bq_client.query(query).to_dataframe()
+            results = rows_to_dicts(self.bq_client.query(query).result())
             logger.info(f"Found {len(results)} high-risk tables")
-            return results.to_dict("records")
+            return results
 
         except Exception as e:
             logger.error(f"Error getting high-risk tables: {e}")
             return []
 
+    async def aget_high_risk_tables(self) -> List[Dict[str, Any]]:
+        """Async variant of :meth:`get_high_risk_tables`."""
+        return await asyncio.to_thread(self.get_high_risk_tables)
+
     def get_undocumented_tables(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Find tables without documentation.
 
@@ -174,14 +289,18 @@ class GovernanceEngine:
             LIMIT {limit}
             """
 
-            results = self.bq_client.query(query).to_dataframe()
+            results = rows_to_dicts(self.bq_client.query(query).result())
             logger.info(f"Found {len(results)} undocumented tables")
-            return results.to_dict("records")
+            return results
 
         except Exception as e:
             logger.error(f"Error getting undocumented tables: {e}")
             return []
 
+    async def aget_undocumented_tables(self, limit: int = 50) -> List[Dict[str, Any]]:
+        """Async variant of :meth:`get_undocumented_tables`."""
+        return await asyncio.to_thread(self.get_undocumented_tables, limit)
+
     def get_documentation_rate_by_schema(self) -> List[Dict[str, Any]]:
         """Get documentation rate statistics by schema.
 
@@ -193,16 +312,16 @@ class GovernanceEngine:
             SELECT
                 schema_name,
                 COUNT(*) as total_tables,
-                SUM(CASE WHEN comment IS NOT NULL THEN 1 ELSE 0 END) as documented_tables,
-                ROUND(100.0 * SUM(CASE WHEN comment IS NOT NULL THEN 1 ELSE 0 END) / COUNT(*), 1) as documentation_pct
+                COUNTIF(comment IS NOT NULL) as documented_tables,
+                ROUND(100.0 * COUNTIF(comment IS NOT NULL) / COUNT(*), 1) as documentation_pct
             FROM `{self.project_id}.{self.metadata_dataset}.tables`
             GROUP BY schema_name
             ORDER BY documentation_pct DESC
             """
 
-            results = self.bq_client.query(query).to_dataframe()
+            results = rows_to_dicts(self.bq_client.query(query).result())
             logger.info(f"Retrieved documentation rates for {len(results)} schemas")
-            return results.to_dict("records")
+            return results
 
         except Exception as e:
             logger.error(f"Error getting documentation rates: {e}")
@@ -217,23 +336,38 @@ class GovernanceEngine:
         Returns:
             True if table exists, False otherwise
         """
-        parts = full_table_name.split(".")
-        if len(parts) != 3:
+        # Reject malformed names (wrong part count or an empty part) and
+        # serve cache hits before splitting
+        if (
+            full_table_name.count(".") != 2
+            or ".." in full_table_name
+            or full_table_name.startswith(".")
+            or full_table_name.endswith(".")
+        ):
             return False
+        if full_table_name in self._known_tables:
+            return True
 
-        catalog, schema, table = parts
+        catalog, schema, table = full_table_name.split(".")
 
         try:
             query = f"""
-            SELECT COUNT(*) as cnt
-            FROM `{self.project_id}.{self.metadata_dataset}.tables`
-            WHERE catalog_name = '{catalog}'
-              AND schema_name = '{schema}'
-              AND table_name = '{table}'
+            SELECT EXISTS(
+                SELECT 1
+                FROM `{self.project_id}.{self.metadata_dataset}.tables`
+                WHERE catalog_name = @catalog
+                  AND schema_name = @schema
+                  AND table_name = @table
+            ) as table_exists
             """
-
-            result = self.bq_client.query(query).to_dataframe()
-            exists = result["cnt"].iloc[0] > 0
+            job_config = query_config(catalog=catalog, schema=schema, table=table)
+
+            result = rows_to_dicts(
+                self.bq_client.query(query, job_config=job_config).result()
+            )
+            exists = bool(result[0]["table_exists"])
+            if exists:
+                self._known_tables[full_table_name] = True
             logger.debug(f"Table {full_table_name} exists: {exists}")
             return exists
 
@@ -14,21 +14,30 @@
 
 """FastAPI server for SyncFlow data governance platform."""
 
+import asyncio
 import logging
 import os
-from typing import Any, Dict
-
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse, RedirectResponse
+import secrets
+from typing import Any, Dict, List, Optional
+
+from fastapi import FastAPI, Header, HTTPException, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import (
+    JSONResponse,
+    RedirectResponse,
+    StreamingResponse,
+)
 from google.cloud import logging as google_cloud_logging
+from pydantic import ValidationError
 
 from app.agent import DataGovernanceAgent
-from app.utils.typing import Feedback, Request, dumps
+from app.utils.typing import BulkCall, BulkRequest, Feedback, Request, dumpb
 
 # Configure logging
 logging_client = google_cloud_logging.Client()
-logger = logging_client.logger(__name__)
+feedback_logger = logging_client.logger(__name__)
 logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
 
 # Initialize FastAPI app
 app = FastAPI(
@@ -39,6 +48,28 @@ app = FastAPI(
     redoc_url="/redoc",
 )
 
+# Seconds that cached governance responses stay valid, in process and downstream
+CACHE_TTL_SECONDS = int(os.getenv("CACHE_TTL_SECONDS", "300"))
+CACHE_CONTROL = f"max-age={CACHE_TTL_SECONDS}"
+
+# Token required by /admin endpoints; unset keeps them disabled
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN", "")
+
+
+def _cacheable(response: Response, result: Dict[str, Any]) -> Dict[str, Any]:
+    """Let clients cache a governance response, unless it reports an error.
+
+    Args:
+        response: Outgoing response to set the caching header on
+        result: Agent result about to be returned
+
+    Returns:
+        The result, unchanged
+    """
+    if "error" not in result:
+        response.headers["Cache-Control"] = CACHE_CONTROL
+    return result
+
 # Initialize agent
 try:
     agent = DataGovernanceAgent(
@@ -47,12 +78,27 @@ try:
         metadata_dataset=os.getenv("METADATA_DATASET", "unity_catalog_metadata"),
         ml_dataset=os.getenv("ML_DATASET"),
         model_id=os.getenv("MODEL_ID", "gemini-2.5-flash-002"),
+        cache_ttl=CACHE_TTL_SECONDS,
+        use_materialized_views=os.getenv("USE_COMPLIANCE_VIEWS", "false").lower()
+        == "true",
+        use_search_index=os.getenv("USE_SEARCH_INDEX", "false").lower() == "true",
     )
     logger.info("DataGovernanceAgent initialized successfully")
 except Exception as e:
     logger.error(f"Failed to initialize agent: {e}")
     agent = None
 
+# Agent state is fixed at startup, so the health payload is serialized once
+HEALTH = {
+    "status": "healthy" if agent is not None else "unhealthy",
+    "service": "SyncFlow Data Governance API",
+    "version": "0.1.0",
+}
+HEALTH_BODY = dumpb(HEALTH)
+
+# Largest result count /discover may ask for
+MAX_DISCOVER_LIMIT = 1000
+
 
 # Routes
 
@@ -64,26 +110,21 @@ def redirect_root_to_docs() -> RedirectResponse:
 
 
 @app.get("/health")
-def health_check() -> Dict[str, Any]:
+async def health_check() -> Response:
     """Health check endpoint.
 
     Returns:
         Health status
     """
-    status = "healthy" if agent is not None else "unhealthy"
-    return {
-        "status": status,
-        "service": "SyncFlow Data Governance API",
-        "version": "0.1.0",
-    }
+    return Response(content=HEALTH_BODY, media_type="application/json")
 
 
 @app.post("/discover")
-def discover_data(request: Dict[str, Any]) -> Dict[str, Any]:
+async def discover_data(request: Dict[str, Any]) -> Dict[str, Any]:
     """Discover data in Unity Catalog.
 
     Args:
-        request: Request with query field
+        request: Request with query field and optional limit
 
     Returns:
         Discovery results
@@ -98,7 +139,10 @@ def discover_data(request: Dict[str, Any]) -> Dict[str, Any]:
         if not query:
             raise ValueError("Query parameter required")
 
-        result = agent.discover_data(query)
+        limit = int(request.get("limit", 20))
+        if not 1 <= limit <= MAX_DISCOVER_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_DISCOVER_LIMIT}")
+        result = await run_in_threadpool(agent.discover_data, query, limit=limit)
         return result
 
     except Exception as e:
@@ -107,9 +151,12 @@ def discover_data(request: Dict[str, Any]) -> Dict[str, Any]:
 
 
 @app.get("/compliance")
-def get_compliance() -> Dict[str, Any]:
+async def get_compliance(response: Response) -> Dict[str, Any]:
     """Get compliance metrics.
 
+    Args:
+        response: Outgoing response, used to set caching headers
+
     Returns:
         Compliance information
     """
@@ -119,14 +166,36 @@ def get_compliance() -> Dict[str, Any]:
         )
 
     try:
-        return agent.check_compliance()
+        return _cacheable(response, await agent.acheck_compliance())
     except Exception as e:
         logger.error(f"Compliance check error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.get("/overview")
+async def get_overview(response: Response) -> Dict[str, Any]:
+    """Get headline governance metrics for the overview page.
+
+    Args:
+        response: Outgoing response, used to set caching headers
+
+    Returns:
+        Metadata health, summary scores and highest risk tables
+    """
+    if agent is None:
+        raise HTTPException(
+            status_code=500, detail="Agent not initialized"
+        )
+
+    try:
+        return _cacheable(response, await run_in_threadpool(agent.get_overview))
+    except Exception as e:
+        logger.error(f"Overview error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/table-details/{table_name:path}")
-def get_table_details(table_name: str) -> Dict[str, Any]:
+async def get_table_details(table_name: str) -> Dict[str, Any]:
     """Get detailed information about a table.
 
     Args:
@@ -141,14 +210,14 @@ def get_table_details(table_name: str) -> Dict[str, Any]:
         )
 
     try:
-        return agent.get_table_details(table_name)
+        return await run_in_threadpool(agent.get_table_details, table_name)
     except Exception as e:
         logger.error(f"Error getting table details: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.post("/generate-description")
-def generate_description(request: Dict[str, Any]) -> Dict[str, str]:
+async def generate_description(request: Dict[str, Any]) -> Dict[str, str]:
     """Generate AI description for a table.
 
     Args:
@@ -167,7 +236,9 @@ def generate_description(request: Dict[str, Any]) -> Dict[str, str]:
         if not table_name:
             raise ValueError("table_name parameter required")
 
-        description = agent.generate_table_description(table_name)
+        description = await run_in_threadpool(
+            agent.generate_table_description, table_name
+        )
         return {"table_name": table_name, "description": description}
 
     except Exception as e:
@@ -175,10 +246,93 @@ def generate_description(request: Dict[str, Any]) -> Dict[str, str]:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+@app.post("/generate-description/stream")
+async def stream_description(request: Dict[str, Any]) -> StreamingResponse:
+    """Stream an AI description for a table as it is generated.
+
+    Args:
+        request: Request with table_name field
+
+    Returns:
+        Plain-text stream of the generated description
+    """
+    if agent is None:
+        raise HTTPException(
+            status_code=500, detail="Agent not initialized"
+        )
+
+    table_name = request.get("table_name", "")
+    if not table_name:
+        raise HTTPException(status_code=400, detail="table_name parameter required")
+
+    return StreamingResponse(
+        agent.stream_table_description(table_name), media_type="text/plain"
+    )
+
+
+@app.post("/generate-descriptions")
+async def generate_descriptions(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Generate AI descriptions for several tables concurrently.
+
+    Args:
+        request: Request with table_names field
+
+    Returns:
+        Generated descriptions keyed by table name
+    """
+    if agent is None:
+        raise HTTPException(
+            status_code=500, detail="Agent not initialized"
+        )
+
+    try:
+        table_names = request.get("table_names", [])
+        if not table_names:
+            raise ValueError("table_names parameter required")
+
+        descriptions = await agent.generate_descriptions_batch(table_names)
+        return {"descriptions": descriptions}
+
+    except Exception as e:
+        logger.error(f"Batch description generation error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+@app.post("/pii-status")
+async def get_pii_status(request: Dict[str, Any]) -> Dict[str, Any]:
+    """Get PII status for several tables at once.
+
+    Args:
+        request: Request with table_names field
+
+    Returns:
+        PII summaries keyed by table name
+    """
+    if agent is None:
+        raise HTTPException(
+            status_code=500, detail="Agent not initialized"
+        )
+
+    try:
+        table_names = request.get("table_names", [])
+        if not table_names:
+            raise ValueError("table_names parameter required")
+
+        pii_status = await run_in_threadpool(agent.get_pii_for_tables, table_names)
+        return {"pii_status": pii_status}
+
+    except Exception as e:
+        logger.error(f"PII status error: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
+
+
 @app.get("/pii-analysis")
-def analyze_pii() -> Dict[str, Any]:
+async def analyze_pii(response: Response) -> Dict[str, Any]:
     """Analyze PII risk across catalog.
 
+    Args:
+        response: Outgoing response, used to set caching headers
+
     Returns:
         PII risk analysis
     """
@@ -188,16 +342,19 @@ def analyze_pii() -> Dict[str, Any]:
         )
 
     try:
-        return agent.analyze_pii_risk()
+        return _cacheable(response, await run_in_threadpool(agent.analyze_pii_risk))
     except Exception as e:
         logger.error(f"PII analysis error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.get("/metadata-health")
-def get_metadata_health() -> Dict[str, Any]:
+async def get_metadata_health(response: Response) -> Dict[str, Any]:
     """Check metadata health.
 
+    Args:
+        response: Outgoing response, used to set caching headers
+
     Returns:
         Metadata health metrics
     """
@@ -207,14 +364,14 @@ def get_metadata_health() -> Dict[str, Any]:
         )
 
     try:
-        return agent.get_metadata_health()
+        return _cacheable(response, await run_in_threadpool(agent.get_metadata_health))
     except Exception as e:
         logger.error(f"Metadata health check error: {e}")
         raise HTTPException(status_code=400, detail=str(e))
 
 
 @app.post("/query")
-def query_with_ai(request: Dict[str, Any]) -> Dict[str, str]:
+async def query_with_ai(request: Dict[str, Any]) -> Dict[str, str]:
     """Query the AI agent with a natural language question.
 
     Args:
@@ -233,7 +390,7 @@ def query_with_ai(request: Dict[str, Any]) -> Dict[str, str]:
         if not question:
             raise ValueError("question parameter required")
 
-        answer = agent.query_with_ai(question)
+        answer = await run_in_threadpool(agent.query_with_ai, question)
         return {"question": question, "answer": answer}
 
     except Exception as e:
@@ -241,8 +398,91 @@ def query_with_ai(request: Dict[str, Any]) -> Dict[str, str]:
         raise HTTPException(status_code=400, detail=str(e))
 
 
+# Endpoints that may be combined in a single /bulk request
+BULK_GET_ROUTES = {
+    "/compliance": get_compliance,
+    "/overview": get_overview,
+    "/pii-analysis": analyze_pii,
+    "/metadata-health": get_metadata_health,
+}
+BULK_POST_ROUTES = {
+    "/discover": discover_data,
+    "/pii-status": get_pii_status,
+    "/query": query_with_ai,
+}
+
+
+async def _bulk_call(spec: Any) -> Dict[str, Any]:
+    """Run one sub-request of a /bulk call.
+
+    Args:
+        spec: Sub-request with method, path and optional body fields
+
+    Returns:
+        Sub-response with status and body fields
+    """
+    try:
+        call = BulkCall.model_validate(spec)
+    except ValidationError as e:
+        return {"status": 422, "body": {"detail": e.errors(include_url=False, include_context=False)}}
+
+    method = call.method.upper()
+    path = call.path
+    try:
+        if method == "GET" and path == "/health":
+            return {"status": 200, "body": HEALTH}
+        if method == "GET" and path in BULK_GET_ROUTES:
+            return {"status": 200, "body": await BULK_GET_ROUTES[path](Response())}
+        if method == "POST" and path in BULK_POST_ROUTES:
+            body = await BULK_POST_ROUTES[path](call.body or {})
+            return {"status": 200, "body": body}
+        return {"status": 404, "body": {"detail": f"{method} {path} not supported"}}
+    except HTTPException as e:
+        return {"status": e.status_code, "body": {"detail": e.detail}}
+
+
+@app.post("/bulk")
+async def bulk(requests: BulkRequest) -> List[Dict[str, Any]]:
+    """Run several API calls in one round trip.
+
+    Args:
+        requests: Sub-requests, each with method, path and optional body
+
+    Returns:
+        Sub-responses with status and body, in request order
+    """
+    return list(await asyncio.gather(*(_bulk_call(spec) for spec in requests.root)))
+
+
+@app.post("/admin/flush-cache")
+def flush_cache(x_admin_token: Optional[str] = Header(None)) -> Dict[str, str]:
+    """Invalidate cached compliance, PII and metadata health responses.
+
+    Args:
+        x_admin_token: Value of the X-Admin-Token header, checked against
+            ADMIN_TOKEN
+
+    Returns:
+        Success response
+    """
+    if not ADMIN_TOKEN:
+        raise HTTPException(
+            status_code=403, detail="Cache administration is disabled"
+        )
+    if not secrets.compare_digest(x_admin_token or "", ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+    if agent is None:
+        raise HTTPException(
+            status_code=500, detail="Agent not initialized"
+        )
+
+    agent.clear_cache()
+    return {"status": "success", "message": "Cache flushed"}
+
+
 @app.post("/feedback")
-def collect_feedback(feedback: Feedback) -> Dict[str, str]:
+async def collect_feedback(feedback: Feedback) -> Dict[str, str]:
     """Collect user feedback.
 
     Args:
@@ -252,8 +492,8 @@ def collect_feedback(feedback: Feedback) -> Dict[str, str]:
         Success response
     """
     try:
-        logger.log_struct(
-            feedback.model_dump(), severity="INFO"
+        await run_in_threadpool(
+            feedback_logger.log_struct, feedback.model_dump(), severity="INFO"
         )
         return {"status": "success", "message": "Feedback recorded"}
     except Exception as e:
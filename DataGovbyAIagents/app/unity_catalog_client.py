@@ -14,13 +14,103 @@
 
 """Unity Catalog client for metadata querying."""
 
+import asyncio
+import functools
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Dict, Hashable, List, Optional
 
-from google.cloud import bigquery
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+
+from app.governance_engine import PII_SUMMARY_VIEW
+from app.utils.bigquery import (
+    get_bq_client,
+    get_bqstorage_client,
+    query_config,
+    rows_to_dicts,
+    rows_to_pylist,
+)
+
+if TYPE_CHECKING:
+    import pyarrow
 
 logger = logging.getLogger(__name__)
 
+# Catalogs up to this many tables are searched in memory rather than in SQL
+IN_MEMORY_SEARCH_MAX_ROWS = 100_000
+
+# Snapshot column holding the lower-cased text that keywords are matched against
+SEARCH_TEXT_COLUMN = "_search_text"
+
+
+def _method_key(name: str) -> Callable[..., Hashable]:
+    """Build a cache key function that namespaces entries by method name."""
+
+    def key(self: Any, *args: Any, **kwargs: Any) -> Hashable:
+        return hashkey(name, *args, **kwargs)
+
+    return key
+
+
+def _cached(
+    cache: str,
+    name: str,
+    error: str,
+    fallback: Callable[[Exception], Any],
+    level: int = logging.ERROR,
+) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Cache a lookup's results in the ``cache`` attribute, but not its failures.
+
+    The wrapped method raises when its query fails. The error is logged
+    with ``error`` at ``level`` and ``fallback(exc)`` is returned without
+    being cached, so the next call queries BigQuery again instead of
+    serving the failure for the whole TTL.
+    """
+    key = _method_key(name)
+
+    def decorator(method: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(method)
+        def wrapper(self: Any, *args: Any, **kwargs: Any) -> Any:
+            entries = getattr(self, cache)
+            k = key(self, *args, **kwargs)
+            with self._lock:
+                try:
+                    return entries[k]
+                except KeyError:
+                    pass
+            try:
+                result = method(self, *args, **kwargs)
+            except Exception as e:
+                logger.log(level, error, e)
+                return fallback(e)
+            with self._lock:
+                entries[k] = result
+            return result
+
+        return wrapper
+
+    return decorator
+
+
+def _add_freshness(result: Dict[str, Any]) -> Dict[str, Any]:
+    """Add minutes since ``latest_sync`` and the resulting freshness status.
+
+    The age is computed here rather than with ``CURRENT_TIMESTAMP()`` in
+    SQL, which would stop BigQuery from serving the query from its cache.
+    """
+    age = datetime.now(timezone.utc) - result["latest_sync"]
+    minutes = int(age.total_seconds() // 60)
+    result["minutes_since_sync"] = minutes
+    if minutes < 20:
+        result["freshness_status"] = "FRESH"
+    elif minutes < 60:
+        result["freshness_status"] = "ACCEPTABLE"
+    else:
+        result["freshness_status"] = "STALE"
+    return result
+
 
 class UnityCatalogClient:
     """Client for querying Unity Catalog metadata from BigQuery.
@@ -34,6 +124,8 @@ class UnityCatalogClient:
         project_id: str,
         metadata_dataset: str,
         ml_dataset: Optional[str] = None,
+        use_search_index: bool = False,
+        use_materialized_views: bool = False,
     ) -> None:
         """Initialize Unity Catalog client.
 
@@ -41,21 +133,49 @@ class UnityCatalogClient:
             project_id: GCP project ID
             metadata_dataset: BigQuery dataset containing UC metadata
             ml_dataset: BigQuery dataset containing ML results (optional)
+            use_search_index: Match keywords with ``SEARCH()`` against the
+                index created by :meth:`create_search_index`
+            use_materialized_views: Read per-table PII summaries from the
+                clustered view created by
+                :meth:`GovernanceEngine.create_compliance_views`
         """
         self.project_id = project_id
         self.metadata_dataset = metadata_dataset
         self.ml_dataset = ml_dataset
-        self.bq_client = bigquery.Client(project=project_id)
+        self.use_search_index = use_search_index
+        self.use_materialized_views = use_materialized_views
+        self.bq_client = get_bq_client(project_id)
+        # Metadata only changes when Fivetran syncs, so lookups are served
+        # from memory between syncs. Freshness gets a shorter TTL since it
+        # reports on the sync itself.
+        self._cache: TTLCache = TTLCache(maxsize=1024, ttl=300)
+        self._freshness_cache: TTLCache = TTLCache(maxsize=1, ttl=30)
+        self._lock = threading.RLock()
         logger.info(
-            f"Initialized UnityCatalogClient for project {project_id}, "
-            f"metadata_dataset {metadata_dataset}"
+            "Initialized UnityCatalogClient for project %s, metadata_dataset %s",
+            project_id,
+            metadata_dataset,
         )
 
+    @property
+    def _pii_table(self) -> str:
+        """Name of the table to read per-table PII summaries from."""
+        if self.use_materialized_views:
+            return PII_SUMMARY_VIEW
+        return "pii_summary_by_table"
+
+    @_cached(
+        "_cache", "search_tables_by_keyword", "Error searching tables: %s", lambda e: []
+    )
     def search_tables_by_keyword(
         self, keyword: str, limit: int = 10
     ) -> List[Dict[str, Any]]:
         """Search for tables matching a keyword.
 
+        With the search index enabled, the keyword must match a whole token
+        of the table name or comment (e.g. ``customer`` in ``dim_customer``);
+        otherwise any substring matches.
+
         Args:
             keyword: Search keyword
             limit: Maximum number of results
@@ -63,6 +183,28 @@ class UnityCatalogClient:
         Returns:
             List of matching tables
         """
+        if not self.use_search_index:
+            snapshot = self._tables_snapshot()
+            if snapshot is not None:
+                results = self._filter_tables(snapshot, keyword, limit)
+                logger.info("Found %d tables matching '%s'", len(results), keyword)
+                return results
+
+        if self.use_search_index:
+            where_clause = (
+                "WHERE SEARCH(table_name, @keyword) OR SEARCH(comment, @keyword)"
+            )
+            # Backticks make SEARCH treat the keyword as a literal phrase
+            phrase = keyword.replace("`", "")
+            job_config = query_config(keyword=f"`{phrase}`", limit=limit)
+        else:
+            where_clause = (
+                "WHERE LOWER(table_name) LIKE @pattern\n"
+                "   OR LOWER(COALESCE(comment, '')) LIKE @pattern"
+            )
+            pattern = f"%{keyword.lower()}%"
+            job_config = query_config(pattern=pattern, limit=limit)
+
         query = f"""
         SELECT
             catalog_name,
@@ -73,19 +215,89 @@ class UnityCatalogClient:
             comment,
             _fivetran_synced as last_synced
         FROM `{self.project_id}.{self.metadata_dataset}.tables`
-        WHERE LOWER(table_name) LIKE '%{keyword.lower()}%'
-           OR LOWER(COALESCE(comment, '')) LIKE '%{keyword.lower()}%'
-        LIMIT {limit}
+        {where_clause}
+        LIMIT @limit
         """
 
-        try:
-            results = self.bq_client.query(query).to_dataframe()
-            logger.info(f"Found {len(results)} tables matching '{keyword}'")
-            return results.to_dict("records")
-        except Exception as e:
-            logger.error(f"Error searching tables: {e}")
-            return []
+        results = rows_to_pylist(
+            self.bq_client.query_and_wait(query, job_config=job_config)
+        )
+        logger.info("Found %d tables matching '%s'", len(results), keyword)
+        return results
+
+    @_cached(
+        "_cache",
+        "tables_snapshot",
+        "Falling back to SQL keyword search: %s",
+        lambda e: None,
+        level=logging.WARNING,
+    )
+    def _tables_snapshot(self) -> Optional["pyarrow.Table"]:
+        """Load the searchable columns of small catalogs into memory.
 
+        Returns:
+            Arrow table of all tables, or None if the catalog is larger
+            than ``IN_MEMORY_SEARCH_MAX_ROWS`` or could not be loaded
+        """
+        table_id = f"{self.project_id}.{self.metadata_dataset}.tables"
+        num_rows = self.bq_client.get_table(table_id).num_rows
+        if num_rows is None or num_rows > IN_MEMORY_SEARCH_MAX_ROWS:
+            return None
+
+        query = f"""
+        SELECT
+            catalog_name,
+            schema_name,
+            table_name,
+            full_name,
+            table_type,
+            comment,
+            _fivetran_synced as last_synced
+        FROM `{table_id}`
+        """
+        snapshot = self.bq_client.query_and_wait(query).to_arrow(
+            bqstorage_client=get_bqstorage_client()
+        )
+        snapshot = self._with_search_text(snapshot)
+        logger.info("Loaded %d tables for in-memory search", snapshot.num_rows)
+        return snapshot
+
+    @staticmethod
+    def _with_search_text(snapshot: "pyarrow.Table") -> "pyarrow.Table":
+        """Add a lower-cased name and comment column to match keywords against.
+
+        Lower-casing once per snapshot load keeps each search to a single
+        substring scan instead of re-lowering every row for every keyword.
+        The NUL separator keeps a keyword from matching across the two
+        fields.
+        """
+        import pyarrow.compute as pc
+
+        search_text = pc.utf8_lower(
+            pc.binary_join_element_wise(
+                snapshot["table_name"], pc.fill_null(snapshot["comment"], ""), "\x00"
+            )
+        )
+        return snapshot.append_column(SEARCH_TEXT_COLUMN, search_text)
+
+    @staticmethod
+    def _filter_tables(
+        snapshot: "pyarrow.Table", keyword: str, limit: int
+    ) -> List[Dict[str, Any]]:
+        """Match a keyword against table names and comments in memory."""
+        import pyarrow.compute as pc
+
+        mask = pc.match_substring(snapshot[SEARCH_TEXT_COLUMN], keyword.lower())
+        return (
+            snapshot.filter(mask)
+            .slice(0, limit)
+            .drop_columns([SEARCH_TEXT_COLUMN])
+            .to_pylist()
+        )
+
+    @_cached(
+        "_cache", "search_tables_by_schema", "Error searching schema: %s", lambda e: []
+    )
     def search_tables_by_schema(self, schema_name: str) -> List[Dict[str, Any]]:
         """Get all tables in a specific schema.
 
@@ -104,18 +316,23 @@ class UnityCatalogClient:
             table_type,
             comment
         FROM `{self.project_id}.{self.metadata_dataset}.tables`
-        WHERE schema_name = '{schema_name}'
+        WHERE schema_name = @schema
         ORDER BY table_name
         """
+        job_config = query_config(schema=schema_name)
 
-        try:
-            results = self.bq_client.query(query).to_dataframe()
-            logger.info(f"Found {len(results)} tables in schema '{schema_name}'")
-            return results.to_dict("records")
-        except Exception as e:
-            logger.error(f"Error searching schema: {e}")
-            return []
-
+        results = rows_to_pylist(
+            self.bq_client.query_and_wait(query, job_config=job_config)
+        )
+        logger.info("Found %d tables in schema '%s'", len(results), schema_name)
+        return results
+
+    @_cached(
+        "_cache",
+        "get_table_details",
+        "Error getting table details: %s",
+        lambda e: {"error": str(e)},
+    )
     def get_table_details(self, full_table_name: str) -> Dict[str, Any]:
         """Get detailed information about a table.
 
@@ -131,77 +348,86 @@ class UnityCatalogClient:
             return {"error": "Invalid table name format. Use: catalog.schema.table"}
 
         catalog, schema, table = parts
+        table_params = query_config(catalog=catalog, schema=schema, table=table)
 
-        try:
-            # Get table metadata
-            table_query = f"""
-            SELECT
-                catalog_name,
-                schema_name,
-                table_name,
-                table_type,
-                comment,
-                created_at as created,
-                _fivetran_synced as last_synced
-            FROM `{self.project_id}.{self.metadata_dataset}.tables`
-            WHERE catalog_name = '{catalog}'
-              AND schema_name = '{schema}'
-              AND table_name = '{table}'
-            """
-
-            table_info = self.bq_client.query(table_query).to_dataframe()
-            if table_info.empty:
-                return {"error": f"Table {full_table_name} not found"}
-
-            # Get columns
-            columns_query = f"""
-            SELECT
-                column_name,
-                data_type,
-                nullable as is_nullable,
-                position as ordinal_position,
-                comment
-            FROM `{self.project_id}.{self.metadata_dataset}.columns`
-            WHERE table_full_name = '{full_table_name}'
-            ORDER BY position
-            """
-
-            columns = self.bq_client.query(columns_query).to_dataframe()
-
-            result = {
-                "table": table_info.to_dict("records")[0],
-                "columns": columns.to_dict("records"),
-                "column_count": len(columns),
-            }
-
-            # Get PII status if ML dataset available
-            if self.ml_dataset:
-                pii_query = f"""
-                SELECT
-                    pii_columns_count,
-                    pii_columns,
-                    risk_level,
-                    avg_pii_score_pct
-                FROM `{self.project_id}.{self.ml_dataset}.pii_summary_by_table`
-                WHERE table_catalog = '{catalog}'
-                  AND table_schema = '{schema}'
-                  AND table_name = '{table}'
-                """
-
-                try:
-                    pii_info = self.bq_client.query(pii_query).to_dataframe()
-                    if not pii_info.empty:
-                        result["pii_info"] = pii_info.to_dict("records")[0]
-                except Exception as e:
-                    logger.debug(f"Could not fetch PII info: {e}")
+        table_query = f"""
+        SELECT
+            catalog_name,
+            schema_name,
+            table_name,
+            table_type,
+            comment,
+            created_at as created,
+            _fivetran_synced as last_synced
+        FROM `{self.project_id}.{self.metadata_dataset}.tables`
+        WHERE catalog_name = @catalog
+          AND schema_name = @schema
+          AND table_name = @table
+        """
 
-            logger.info(f"Retrieved details for table {full_table_name}")
-            return result
+        columns_query = f"""
+        SELECT
+            column_name,
+            data_type,
+            nullable as is_nullable,
+            position as ordinal_position,
+            comment
+        FROM `{self.project_id}.{self.metadata_dataset}.columns`
+        WHERE table_full_name = @full_name
+        ORDER BY position
+        """
 
-        except Exception as e:
-            logger.error(f"Error getting table details: {e}")
-            return {"error": str(e)}
+        pii_query = f"""
+        SELECT
+            pii_columns_count,
+            pii_columns,
+            risk_level,
+            avg_pii_score_pct
+        FROM `{self.project_id}.{self.ml_dataset}.{self._pii_table}`
+        WHERE table_catalog = @catalog
+          AND table_schema = @schema
+          AND table_name = @table
+        """
 
+        # The lookups are independent, so all jobs are submitted before
+        # any result is awaited and BigQuery runs them concurrently.
+        table_job = self.bq_client.query(table_query, job_config=table_params)
+        columns_job = self.bq_client.query(
+            columns_query, job_config=query_config(full_name=full_table_name)
+        )
+        pii_job = None
+        if self.ml_dataset:
+            try:
+                pii_job = self.bq_client.query(pii_query, job_config=table_params)
+            except Exception as e:
+                logger.debug("Could not fetch PII info: %s", e)
+
+        table_info = rows_to_dicts(table_job.result())
+        if not table_info:
+            for job in (columns_job, pii_job):
+                if job is not None:
+                    job.cancel()
+            return {"error": f"Table {full_table_name} not found"}
+
+        columns = rows_to_pylist(columns_job.result())
+        result = {
+            "table": table_info[0],
+            "columns": columns,
+            "column_count": len(columns),
+        }
+
+        if pii_job is not None:
+            try:
+                pii_info = rows_to_dicts(pii_job.result())
+                if pii_info:
+                    result["pii_info"] = pii_info[0]
+            except Exception as e:
+                logger.debug("Could not fetch PII info: %s", e)
+
+        logger.info("Retrieved details for table %s", full_table_name)
+        return result
+
+    @_cached("_cache", "get_pii_status", "Error getting PII status: %s", lambda e: [])
     def get_pii_status(
         self, schema_name: Optional[str] = None
     ) -> List[Dict[str, Any]]:
@@ -217,62 +443,270 @@ class UnityCatalogClient:
             logger.warning("ML dataset not configured - cannot retrieve PII status")
             return []
 
+        params = {"schema": schema_name} if schema_name else {}
+        where_clause = "WHERE table_schema = @schema" if schema_name else ""
+        job_config = query_config(**params)
+
+        query = f"""
+        SELECT
+            full_table_name,
+            pii_columns_count,
+            pii_columns,
+            risk_level,
+            avg_pii_score_pct
+        FROM `{self.project_id}.{self.ml_dataset}.{self._pii_table}`
+        {where_clause}
+        ORDER BY pii_columns_count DESC
+        LIMIT 20
+        """
+
+        results = rows_to_pylist(
+            self.bq_client.query_and_wait(query, job_config=job_config)
+        )
+        logger.info("Found %d tables with PII information", len(results))
+        return results
+
+    def get_pii_for_tables(
+        self, full_table_names: List[str]
+    ) -> Dict[str, Dict[str, Any]]:
+        """Get PII status for several tables in one query.
+
+        Args:
+            full_table_names: Fully qualified table names
+
+        Returns:
+            Mapping of full table name to its PII summary; tables without
+            a PII summary are omitted
+        """
+        if not self.ml_dataset or not full_table_names:
+            return {}
+
+        query = f"""
+        SELECT
+            full_table_name,
+            pii_columns_count,
+            pii_columns,
+            risk_level,
+            avg_pii_score_pct
+        FROM `{self.project_id}.{self.ml_dataset}.{self._pii_table}`
+        WHERE full_table_name IN UNNEST(@names)
+        """
+        job_config = query_config(names=list(full_table_names))
+
         try:
-            where_clause = (
-                f"WHERE table_schema = '{schema_name}'" if schema_name else ""
+            rows = rows_to_pylist(
+                self.bq_client.query_and_wait(query, job_config=job_config)
             )
-
-            query = f"""
-            SELECT
-                full_table_name,
-                pii_columns_count,
-                pii_columns,
-                risk_level,
-                avg_pii_score_pct
-            FROM `{self.project_id}.{self.ml_dataset}.pii_summary_by_table`
-            {where_clause}
-            ORDER BY pii_columns_count DESC
-            LIMIT 20
-            """
-
-            results = self.bq_client.query(query).to_dataframe()
-            logger.info(f"Found {len(results)} tables with PII information")
-            return results.to_dict("records")
+            logger.info("Found PII status for %d tables", len(rows))
+            return {row["full_table_name"]: row for row in rows}
         except Exception as e:
-            logger.error(f"Error getting PII status: {e}")
-            return []
+            logger.error("Error getting PII status for tables: %s", e)
+            return {}
+
+    @_cached(
+        "_cache",
+        "get_pii_risk_summary",
+        "Error getting PII risk summary: %s",
+        lambda e: {},
+    )
+    def get_pii_risk_summary(self, sample_size: int = 10) -> Dict[str, Dict[str, Any]]:
+        """Get PII table counts and top tables per risk level.
+
+        Bucketing happens in BigQuery, so only one row per risk level is
+        returned instead of every PII table.
+
+        Args:
+            sample_size: Number of tables to return per risk level, ordered
+                by PII column count
+
+        Returns:
+            Mapping of risk level to its table count and sample tables
+        """
+        if not self.ml_dataset:
+            logger.warning("ML dataset not configured - cannot retrieve PII status")
+            return {}
 
+        query = f"""
+        SELECT
+            risk_level,
+            COUNT(*) as table_count,
+            ARRAY_AGG(
+                STRUCT(
+                    full_table_name,
+                    pii_columns_count,
+                    pii_columns,
+                    risk_level,
+                    avg_pii_score_pct
+                )
+                ORDER BY pii_columns_count DESC
+                LIMIT {int(sample_size)}
+            ) as tables
+        FROM `{self.project_id}.{self.ml_dataset}.pii_summary_by_table`
+        WHERE pii_columns_count > 0
+        GROUP BY risk_level
+        """
+
+        rows = rows_to_pylist(self.bq_client.query_and_wait(query))
+        logger.info("Retrieved PII summary for %d risk levels", len(rows))
+        return {
+            row["risk_level"]: {
+                "table_count": row["table_count"],
+                "tables": row["tables"],
+            }
+            for row in rows
+        }
+
+    @_cached(
+        "_freshness_cache",
+        "get_metadata_freshness",
+        "Error checking metadata freshness: %s",
+        lambda e: {
+            "freshness_status": "UNKNOWN",
+            "minutes_since_sync": -1,
+            "error": str(e),
+        },
+    )
     def get_metadata_freshness(self) -> Dict[str, Any]:
         """Check freshness of synced metadata.
 
+        The connector only re-upserts changed tables, so sync times come
+        from ``sync_status``, which gets one row per catalog every sync.
+
         Returns:
             Dictionary with freshness information
         """
-        try:
-            query = f"""
-            SELECT
-                MIN(_fivetran_synced) as oldest_sync,
-                MAX(_fivetran_synced) as latest_sync,
-                TIMESTAMP_DIFF(CURRENT_TIMESTAMP(), MAX(_fivetran_synced), MINUTE) as minutes_since_sync,
-                COUNT(DISTINCT catalog_name) as catalogs_synced,
-                COUNT(*) as tables_synced
-            FROM `{self.project_id}.{self.metadata_dataset}.tables`
-            """
-
-            result = self.bq_client.query(query).to_dataframe().to_dict("records")[0]
-
-            # Add freshness status
-            minutes = result["minutes_since_sync"]
-            if minutes < 20:
-                result["freshness_status"] = "FRESH"
-            elif minutes < 60:
-                result["freshness_status"] = "ACCEPTABLE"
-            else:
-                result["freshness_status"] = "STALE"
-
-            logger.info(f"Metadata freshness: {result['freshness_status']}")
-            return result
+        query = f"""
+        SELECT
+            MIN(_fivetran_synced) as oldest_sync,
+            MAX(_fivetran_synced) as latest_sync,
+            COUNT(*) as catalogs_synced,
+            SUM(table_count) as tables_synced
+        FROM `{self.project_id}.{self.metadata_dataset}.sync_status`
+        """
 
-        except Exception as e:
-            logger.error(f"Error checking metadata freshness: {e}")
-            return {"freshness_status": "UNKNOWN", "minutes_since_sync": -1}
+        rows = self.bq_client.query_and_wait(query, job_config=query_config())
+        result = _add_freshness(dict(next(iter(rows)).items()))
+
+        logger.info("Metadata freshness: %s", result["freshness_status"])
+        return result
+
+    @_cached(
+        "_cache",
+        "get_overview_bundle",
+        "Error getting overview bundle: %s",
+        lambda e: {"error": str(e)},
+    )
+    def get_overview_bundle(self, sample_size: int = 10) -> Dict[str, Any]:
+        """Get freshness, documentation and PII counts in one query.
+
+        The overview needs aggregates from both metadata and ML tables;
+        fusing them into a single statement costs one job instead of one
+        per lookup.
+
+        Args:
+            sample_size: Number of high and medium risk tables to include,
+                highest risk first
+
+        Returns:
+            Dictionary with ``freshness``, ``documentation`` and ``pii``
+            sections
+        """
+        pii_cte = ""
+        pii_select = ""
+        if self.ml_dataset:
+            pii_cte = f""",
+            pii AS (
+                SELECT
+                    COUNTIF(pii_columns_count > 0) as tables_with_pii,
+                    COUNTIF(risk_level = 'HIGH') as high_risk_tables,
+                    COUNTIF(risk_level IN ('HIGH', 'MEDIUM')) as risk_tables_count,
+                    ROUND(100.0 * COUNTIF(risk_level = 'HIGH') / NULLIF(COUNTIF(pii_columns_count > 0), 0), 2) as high_risk_pct,
+                    ARRAY_AGG(
+                        IF(
+                            risk_level IN ('HIGH', 'MEDIUM'),
+                            STRUCT(full_table_name, risk_level, pii_columns_count),
+                            NULL
+                        )
+                        IGNORE NULLS
+                        ORDER BY
+                            IF(risk_level = 'HIGH', 1, 2),
+                            pii_columns_count DESC
+                        LIMIT {int(sample_size)}
+                    ) as risk_tables
+                FROM `{self.project_id}.{self.ml_dataset}.pii_summary_by_table`
+            )"""
+            pii_select = ", (SELECT AS STRUCT * FROM pii) as pii"
+
+        query = f"""
+        WITH
+            sync AS (
+                SELECT
+                    MIN(_fivetran_synced) as oldest_sync,
+                    MAX(_fivetran_synced) as latest_sync
+                FROM `{self.project_id}.{self.metadata_dataset}.sync_status`
+            ),
+            counts AS (
+                SELECT
+                    COUNT(DISTINCT catalog_name) as catalogs_synced,
+                    COUNT(*) as tables_synced,
+                    COUNTIF(comment IS NOT NULL) as documented_tables
+                FROM `{self.project_id}.{self.metadata_dataset}.tables`
+            ),
+            metadata AS (SELECT * FROM sync CROSS JOIN counts){pii_cte}
+        SELECT (SELECT AS STRUCT * FROM metadata) as metadata{pii_select}
+        """
+
+        rows = self.bq_client.query_and_wait(query, job_config=query_config())
+        row = dict(next(iter(rows)).items())
+        metadata = _add_freshness(dict(row["metadata"]))
+        total = metadata["tables_synced"]
+        documented = metadata.pop("documented_tables")
+
+        pii = dict(row.get("pii") or {})
+        logger.info("Retrieved overview bundle")
+        return {
+            "freshness": metadata,
+            "documentation": {
+                "total_tables": total,
+                "documented_tables": documented,
+                "documentation_pct": (
+                    round(100.0 * documented / total, 2) if total else 0.0
+                ),
+            },
+            "pii": {
+                "tables_with_pii": pii.get("tables_with_pii", 0),
+                "high_risk_tables": pii.get("high_risk_tables", 0),
+                "risk_tables_count": pii.get("risk_tables_count", 0),
+                "high_risk_pct": pii.get("high_risk_pct") or 0.0,
+                "risk_tables": list(pii.get("risk_tables") or []),
+            },
+        }
+
+    def create_search_index(self) -> None:
+        """Create the search index used for keyword lookups.
+
+        BigQuery maintains the index as Fivetran writes to ``tables``, so
+        :meth:`search_tables_by_keyword` probes it instead of scanning the
+        whole table.
+        """
+        statement = f"""
+        CREATE SEARCH INDEX IF NOT EXISTS tables_search_idx
+        ON `{self.project_id}.{self.metadata_dataset}.tables`(table_name, comment)
+        """
+        self.bq_client.query(statement).result()
+        logger.info("Created search index on tables")
+
+    def invalidate(self) -> None:
+        """Drop all cached metadata lookups."""
+        with self._lock:
+            self._cache.clear()
+            self._freshness_cache.clear()
+        logger.info("Unity Catalog metadata cache cleared")
+
+    async def aget_metadata_freshness(self) -> Dict[str, Any]:
+        """Async variant of :meth:`get_metadata_freshness`.
+
+        Runs the blocking BigQuery call in a worker thread so it can be
+        awaited alongside other queries.
+        """
+        return await asyncio.to_thread(self.get_metadata_freshness)
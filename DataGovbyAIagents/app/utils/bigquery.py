@@ -0,0 +1,143 @@
+# Copyright 2025 SyncFlow Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""BigQuery helpers shared by the SyncFlow backend."""
+
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from google.cloud import bigquery, bigquery_storage
+
+# Connections kept open per client; sized for concurrent request fan-out
+BQ_POOL_SIZE = 32
+
+_clients: Dict[str, "bigquery.Client"] = {}
+_clients_lock = threading.Lock()
+_read_client: Optional["bigquery_storage.BigQueryReadClient"] = None
+
+
+def get_bq_client(project_id: str) -> "bigquery.Client":
+    """Return the process-wide BigQuery client for a project.
+
+    Reusing one client keeps its authorized session, credentials and
+    pooled HTTPS connections warm across engines and requests.
+
+    Args:
+        project_id: GCP project ID
+
+    Returns:
+        Shared BigQuery client
+    """
+    # Deferred so importing the app does not pay the BigQuery SDK import cost
+    from google.cloud import bigquery
+    from requests.adapters import HTTPAdapter
+
+    with _clients_lock:
+        client = _clients.get(project_id)
+        if client is None:
+            client = bigquery.Client(project=project_id)
+            client._http.mount(
+                "https://",
+                HTTPAdapter(pool_connections=BQ_POOL_SIZE, pool_maxsize=BQ_POOL_SIZE),
+            )
+            _clients[project_id] = client
+        return client
+
+
+def get_bqstorage_client() -> "bigquery_storage.BigQueryReadClient":
+    """Return the process-wide BigQuery Storage Read API client.
+
+    Returns:
+        Shared BigQuery Storage read client
+    """
+    global _read_client
+
+    from google.cloud import bigquery_storage
+
+    with _clients_lock:
+        if _read_client is None:
+            _read_client = bigquery_storage.BigQueryReadClient()
+        return _read_client
+
+
+def query_config(**params: Any) -> "bigquery.QueryJobConfig":
+    """Build a job config binding named scalar query parameters.
+
+    Bound parameters keep user input out of the SQL text, so every call
+    shares the same statement and can be answered from BigQuery's query
+    result cache.
+
+    Args:
+        **params: Parameter values by name; ``int`` values are bound as
+            ``INT64`` and everything else as ``STRING``. Lists and tuples
+            are bound as arrays of their element type.
+
+    Returns:
+        Query job config with the parameters and query cache enabled
+    """
+    from google.cloud import bigquery
+
+    def param_type(value: Any) -> str:
+        return "INT64" if isinstance(value, int) else "STRING"
+
+    query_parameters: List[Any] = []
+    for name, value in params.items():
+        if isinstance(value, (list, tuple)):
+            element_type = param_type(value[0]) if value else "STRING"
+            query_parameters.append(
+                bigquery.ArrayQueryParameter(name, element_type, list(value))
+            )
+        else:
+            query_parameters.append(
+                bigquery.ScalarQueryParameter(name, param_type(value), value)
+            )
+
+    return bigquery.QueryJobConfig(
+        query_parameters=query_parameters, use_query_cache=True
+    )
+
+
+def rows_to_dicts(rows: Iterable[Any]) -> List[Dict[str, Any]]:
+    """Convert BigQuery result rows to plain dictionaries.
+
+    Iterating a ``RowIterator`` directly avoids materializing a pandas
+    DataFrame only to convert it back into records.
+
+    Args:
+        rows: BigQuery rows, e.g. from ``QueryJob.result()`` or
+            ``Client.query_and_wait()``
+
+    Returns:
+        List of column-name to value dictionaries
+    """
+    return [dict(row.items()) for row in rows]
+
+
+def rows_to_pylist(rows: "bigquery.table.RowIterator") -> List[Dict[str, Any]]:
+    """Convert a query's result rows to dictionaries through Arrow.
+
+    Results larger than the first page are streamed with the Storage Read
+    API, and ``pyarrow.Table.to_pylist`` builds the dictionaries in a
+    single native pass. Prefer this over :func:`rows_to_dicts` for queries
+    that may return many rows.
+
+    Args:
+        rows: Result of ``QueryJob.result()`` or ``Client.query_and_wait()``
+
+    Returns:
+        List of column-name to value dictionaries
+    """
+    return rows.to_arrow(bqstorage_client=get_bqstorage_client()).to_pylist()
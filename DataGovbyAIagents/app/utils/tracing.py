@@ -14,8 +14,9 @@
 
 """OpenTelemetry tracing utilities for SyncFlow."""
 
+import json
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -37,12 +38,23 @@ class CloudTraceLoggingSpanExporter:
         Args:
             spans: List of spans to export
         """
-        for span in spans:
-            try:
-                span_dict = self._span_to_dict(span)
-                self.logger.info(f"Trace span: {span_dict}")
-            except Exception as e:
-                self.logger.error(f"Failed to export span: {e}")
+        try:
+            # One record per batch; spans are ReadableSpans, so their
+            # attributes are read directly. The payload is JSON in the message
+            # itself, since the log formatter does not print extra fields.
+            payload = [
+                {
+                    "name": span.name,
+                    "context": str(span.context),
+                    "start_time": span.start_time,
+                    "end_time": span.end_time,
+                    "status": str(span.status),
+                }
+                for span in spans
+            ]
+            self.logger.info("Trace batch: %s", json.dumps(payload))
+        except Exception as e:
+            self.logger.error(f"Failed to export {len(spans)} spans: {e}")
 
     def shutdown(self) -> None:
         """Shutdown the exporter."""
@@ -59,24 +71,6 @@ class CloudTraceLoggingSpanExporter:
         """
         return True
 
-    @staticmethod
-    def _span_to_dict(span: Any) -> Dict[str, Any]:
-        """Convert span to dictionary.
-
-        Args:
-            span: OpenTelemetry span
-
-        Returns:
-            Dictionary representation of span
-        """
-        return {
-            "name": getattr(span, "name", "unknown"),
-            "context": str(getattr(span, "context", "unknown")),
-            "start_time": getattr(span, "start_time", None),
-            "end_time": getattr(span, "end_time", None),
-            "status": str(getattr(span, "status", "unknown")),
-        }
-
 
 def setup_tracing(
     app_name: str, service_name: Optional[str] = None
@@ -14,10 +14,15 @@
 
 """Type definitions and Pydantic models for SyncFlow API."""
 
-import json
-from typing import Any, Dict, List, Optional
+from typing import Any, Optional
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, ConfigDict, Field, RootModel
+
+_ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+# Most sub-requests a single /bulk call may carry
+MAX_BULK_CALLS = 20
 
 
 def dumps(obj: Any) -> str:
@@ -29,56 +34,92 @@ def dumps(obj: Any) -> str:
     Returns:
         JSON string representation
     """
-    return json.dumps(obj)
+    return dumpb(obj).decode()
+
+
+def dumpb(obj: Any) -> bytes:
+    """Serialize object to JSON bytes, ready to write to a response.
+
+    Args:
+        obj: Object to serialize
+
+    Returns:
+        UTF-8 encoded JSON
+    """
+    return orjson.dumps(obj, option=_ORJSON_OPTIONS)
+
 
+class _FrozenModel(BaseModel):
+    """Base for API models, which are never mutated after validation."""
 
-class Message(BaseModel):
+    model_config = ConfigDict(frozen=True)
+
+
+class Message(_FrozenModel):
     """Chat message model."""
 
     role: str = Field(..., description="Message role: 'user' or 'assistant'")
     content: str = Field(..., description="Message content")
 
 
-class InputChat(BaseModel):
+class InputChat(_FrozenModel):
     """Input chat request model."""
 
-    messages: List[Message] = Field(
+    messages: list[Message] = Field(
         default_factory=list, description="List of messages in conversation"
     )
 
 
-class Metadata(BaseModel):
+class Metadata(_FrozenModel):
     """Request metadata model."""
 
     user_id: Optional[str] = Field(None, description="User identifier")
     session_id: Optional[str] = Field(None, description="Session identifier")
 
 
-class Request(BaseModel):
+class Request(_FrozenModel):
     """API request model for streaming messages."""
 
     input: InputChat = Field(..., description="Input chat messages")
-    config: Optional[Dict[str, Any]] = Field(None, description="Configuration dict")
+    config: Optional[dict[str, Any]] = Field(None, description="Configuration dict")
 
 
-class Feedback(BaseModel):
+class Feedback(_FrozenModel):
     """Feedback model for collecting user feedback."""
 
     run_id: Optional[str] = Field(None, description="Run identifier")
     feedback_type: str = Field(..., description="Type of feedback")
     feedback_text: str = Field(..., description="Feedback text")
-    metadata: Optional[Dict[str, Any]] = Field(None, description="Additional metadata")
+    metadata: Optional[dict[str, Any]] = Field(None, description="Additional metadata")
+
+
+class BulkCall(_FrozenModel):
+    """One sub-request of a /bulk call."""
+
+    method: str = Field("GET", description="HTTP method: 'GET' or 'POST'")
+    path: str = Field(..., description="Endpoint path, e.g. '/compliance'")
+    body: Optional[dict[str, Any]] = Field(None, description="JSON body for POST calls")
+
+
+class BulkRequest(RootModel[list[Any]]):
+    """Body of a /bulk call.
+
+    Items are validated one by one as BulkCall, so a malformed item fails on
+    its own instead of rejecting the whole batch.
+    """
+
+    root: list[Any] = Field(..., max_length=MAX_BULK_CALLS)
 
 
-class DataDiscoveryResult(BaseModel):
+class DataDiscoveryResult(_FrozenModel):
     """Result from data discovery query."""
 
-    tables: List[Dict[str, Any]] = Field(..., description="Found tables")
+    tables: list[dict[str, Any]] = Field(..., description="Found tables")
     query: str = Field(..., description="Original query")
     total_results: int = Field(..., description="Total number of results")
 
 
-class ComplianceScoreResult(BaseModel):
+class ComplianceScoreResult(_FrozenModel):
     """Compliance score result."""
 
     overall_score: float = Field(..., description="Overall compliance score (0-100)")
@@ -87,11 +128,11 @@ class ComplianceScoreResult(BaseModel):
     tables_with_pii: int = Field(..., description="Count of tables with PII")
 
 
-class PIIDetectionResult(BaseModel):
+class PIIDetectionResult(_FrozenModel):
     """PII detection result."""
 
     table_name: str = Field(..., description="Table name")
     risk_level: str = Field(..., description="Risk level: HIGH, MEDIUM, LOW, NONE")
     pii_columns_count: int = Field(..., description="Number of PII columns detected")
-    pii_columns: List[str] = Field(..., description="List of PII column names")
+    pii_columns: list[str] = Field(..., description="List of PII column names")
     confidence: float = Field(..., description="Confidence score (0-100)")
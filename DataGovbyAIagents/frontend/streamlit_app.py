@@ -16,9 +16,8 @@
 
 import logging
 import os
+from typing import Any, Dict, List
 
-import pandas as pd
-import plotly.express as px
 import streamlit as st
 
 from frontend.utils.api_client import APIClient
@@ -35,14 +34,11 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Initialize API client
 api_base_url = os.getenv("API_BASE_URL", "http://localhost:8080")
-api_client = APIClient(base_url=api_base_url)
 
-
-# Page styling
-st.markdown(
-    """
+# Static page chrome. Streamlit rebuilds the page on every rerun, so these
+# are still emitted each time, but the markup itself is never rebuilt.
+PAGE_CSS = """
     <style>
     .main-header {
         text-align: center;
@@ -55,9 +51,17 @@ st.markdown(
         background-color: #f0f4f8;
     }
     </style>
-    """,
-    unsafe_allow_html=True,
-)
+    """
+
+FOOTER_HTML = """
+        <div style='text-align: center; color: #888; padding: 20px;'>
+            <p><strong>🌊 SyncFlow - Data Governance Excellence</strong></p>
+            <p>Powered by Fivetran • Databricks Unity Catalog • Google Cloud</p>
+            <p style='font-size: 0.9em; margin-top: 10px;'>
+                🤖 Google Gemini 2.5 Flash
+            </p>
+        </div>
+        """
 
 
 @st.cache_resource
@@ -66,6 +70,68 @@ def get_api_client() -> APIClient:
     return APIClient(base_url=api_base_url)
 
 
+class _FailedResponse(Exception):
+    """A failed backend response raised out of a ``st.cache_data`` function.
+
+    Streamlit does not cache exceptions, so the next rerun retries instead of
+    showing the error until the TTL expires.
+    """
+
+    def __init__(self, result: Any) -> None:
+        super().__init__(result)
+        self.result = result
+
+
+def _health() -> Dict[str, Any]:
+    """Get backend health; APIClient caches it between reruns."""
+    return get_api_client().health_check()
+
+
+def _compliance() -> Dict[str, Any]:
+    """Get the compliance report; APIClient caches it between reruns."""
+    return get_api_client().get_compliance()
+
+
+# Overview and discovery responses are not cached by APIClient, so they are
+# reused across script reruns here; failures are raised, never cached.
+@st.cache_data(ttl=30, show_spinner=False)
+def _health_and_overview() -> List[Dict[str, Any]]:
+    """Get cached backend health and overview metrics in one round trip."""
+    results = get_api_client().bulk(
+        [("GET", "/health", None), ("GET", "/overview", None)]
+    )
+    health, overview = results
+    if health.get("status") != "healthy" or "error" in overview:
+        raise _FailedResponse(results)
+    return results
+
+
+def _analyze_pii() -> Dict[str, Any]:
+    """Get the PII risk analysis; APIClient caches it between reruns."""
+    return get_api_client().analyze_pii()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _discover(query: str) -> Dict[str, Any]:
+    """Get cached discovery results for a query."""
+    result = get_api_client().discover_data(query)
+    if "error" in result:
+        raise _FailedResponse(result)
+    return result
+
+
+def _select_columns(
+    rows: List[Dict[str, Any]], columns: List[str]
+) -> List[Dict[str, Any]]:
+    """Project rows onto the display columns present in the data.
+
+    ``st.dataframe`` renders lists of dicts directly, so tables are shown
+    without building a pandas DataFrame on every rerun.
+    """
+    present = [col for col in columns if any(col in row for row in rows)]
+    return [{col: row.get(col) for col in present} for row in rows]
+
+
 def render_sidebar() -> str:
     """Render sidebar navigation.
 
@@ -102,33 +168,24 @@ def render_sidebar() -> str:
     return page
 
 
-def render_overview() -> None:
-    """Render overview page."""
+def render_overview(overview: Dict[str, Any]) -> None:
+    """Render overview page.
+
+    Args:
+        overview: Overview metrics fetched alongside the health check
+    """
     st.title("📊 SyncFlow Overview")
     st.markdown("*Real-time insights from your data governance platform*")
 
-    # Check API health
-    health = api_client.health_check()
-
-    if health.get("status") != "healthy":
-        st.error(
-            "⚠️ Backend API is not responding. Make sure the backend server is running."
-        )
-        st.info("Run `make backend` to start the backend server.")
-        return
-
     st.success("✓ Backend connected")
 
-    # Get compliance data
-    with st.spinner("Loading compliance metrics..."):
-        compliance = api_client.get_compliance()
-        health_info = api_client.get_metadata_health()
-
     # Display error if any
-    if "error" in compliance:
-        st.error(f"Error loading compliance data: {compliance['error']}")
+    if "error" in overview:
+        st.error(f"Error loading compliance data: {overview['error']}")
         return
 
+    health_info = overview.get("metadata_health", {})
+
     # Metadata health
     st.subheader("📡 Metadata Health")
     col1, col2, col3 = st.columns(3)
@@ -153,7 +210,7 @@ def render_overview() -> None:
     # Compliance metrics
     st.subheader("✅ Compliance Metrics")
 
-    summary = compliance.get("summary", {})
+    summary = overview.get("summary", {})
 
     col1, col2, col3, col4 = st.columns(4)
 
@@ -163,8 +220,7 @@ def render_overview() -> None:
         st.progress(score / 100)
 
     with col2:
-        score_data = compliance.get("compliance_score", {})
-        st.metric("Documentation Rate", f"{score_data.get('documentation_pct', 0):.1f}%")
+        st.metric("Documentation Rate", f"{summary.get('documentation_pct', 0):.1f}%")
 
     with col3:
         st.metric("High Risk Tables", summary.get("high_risk_count", 0))
@@ -176,18 +232,16 @@ def render_overview() -> None:
 
     # High risk tables
     st.subheader("🔴 High Risk Tables")
-    high_risk = compliance.get("high_risk_tables", [])
+    high_risk = overview.get("high_risk_tables", [])
 
     if high_risk:
-        risk_df = pd.DataFrame(high_risk[:10])
-        if "risk_level" in risk_df.columns:
-            display_cols = ["full_table_name", "risk_level", "pii_columns_count"]
-            if all(col in risk_df.columns for col in display_cols):
-                st.dataframe(
-                    risk_df[display_cols],
-                    use_container_width=True,
-                    hide_index=True,
-                )
+        display_cols = ["full_table_name", "risk_level", "pii_columns_count"]
+        if all(col in high_risk[0] for col in display_cols):
+            st.dataframe(
+                _select_columns(high_risk, display_cols),
+                use_container_width=True,
+                hide_index=True,
+            )
     else:
         st.info("✓ No high-risk tables detected")
 
@@ -197,12 +251,6 @@ def render_discover() -> None:
     st.title("🔎 AI-Powered Data Discovery")
     st.markdown("Search for tables using natural language")
 
-    # Check API health
-    health = api_client.health_check()
-    if health.get("status") != "healthy":
-        st.error("Backend API is not available")
-        return
-
     col1, col2 = st.columns([3, 1])
 
     with col1:
@@ -216,7 +264,10 @@ def render_discover() -> None:
 
     if search_btn and query:
         with st.spinner("Searching..."):
-            results = api_client.discover_data(query)
+            try:
+                results = _discover(query)
+            except _FailedResponse as e:
+                results = e.result
 
         if "error" in results:
             st.error(f"Error: {results['error']}")
@@ -225,8 +276,7 @@ def render_discover() -> None:
 
             results_list = results.get("results", [])
             if results_list:
-                results_df = pd.DataFrame(results_list)
-                st.dataframe(results_df, use_container_width=True, hide_index=True)
+                st.dataframe(results_list, use_container_width=True, hide_index=True)
 
                 # Allow selecting a table for details
                 st.subheader("Get Table Details")
@@ -239,7 +289,7 @@ def render_discover() -> None:
                 if st.button("Get Details"):
                     table_name = results_list[selected_idx].get("full_name")
                     with st.spinner(f"Loading details for {table_name}..."):
-                        details = api_client.get_table_details(table_name)
+                        details = get_api_client().get_table_details(table_name)
 
                     if "error" not in details:
                         st.markdown(f"### {table_name}")
@@ -262,11 +312,6 @@ def render_documentation() -> None:
     st.title("📝 AI Auto-Documentation")
     st.markdown("Generate descriptions for your tables using AI")
 
-    health = api_client.health_check()
-    if health.get("status") != "healthy":
-        st.error("Backend API is not available")
-        return
-
     col1, col2 = st.columns([3, 1])
 
     with col1:
@@ -280,7 +325,7 @@ def render_documentation() -> None:
 
     if gen_btn and table_name:
         with st.spinner("Generating description with AI..."):
-            result = api_client.generate_description(table_name)
+            result = get_api_client().generate_description(table_name)
 
         if "error" in result:
             st.error(f"Error: {result['error']}")
@@ -297,13 +342,8 @@ def render_compliance() -> None:
     st.title("✅ Compliance Monitoring")
     st.markdown("Track data governance compliance metrics")
 
-    health = api_client.health_check()
-    if health.get("status") != "healthy":
-        st.error("Backend API is not available")
-        return
-
     with st.spinner("Loading compliance data..."):
-        compliance = api_client.get_compliance()
+        compliance = _compliance()
 
     if "error" in compliance:
         st.error(f"Error: {compliance['error']}")
@@ -334,10 +374,9 @@ def render_compliance() -> None:
     undocumented = compliance.get("undocumented_tables", [])
 
     if undocumented:
-        undoc_df = pd.DataFrame(undocumented[:20])
-        display_cols = [col for col in ["full_name", "table_type", "created"] if col in undoc_df.columns]
-        if display_cols:
-            st.dataframe(undoc_df[display_cols], use_container_width=True, hide_index=True)
+        rows = _select_columns(undocumented[:20], ["full_name", "table_type", "created"])
+        if rows[0]:
+            st.dataframe(rows, use_container_width=True, hide_index=True)
     else:
         st.success("✓ All tables are documented!")
 
@@ -347,13 +386,8 @@ def render_pii_risk() -> None:
     st.title("🔒 PII Risk Analysis")
     st.markdown("Identify and manage data containing personally identifiable information")
 
-    health = api_client.health_check()
-    if health.get("status") != "healthy":
-        st.error("Backend API is not available")
-        return
-
     with st.spinner("Analyzing PII risk..."):
-        pii_data = api_client.analyze_pii()
+        pii_data = _analyze_pii()
 
     if "error" in pii_data:
         st.error(f"Error: {pii_data['error']}")
@@ -378,11 +412,11 @@ def render_pii_risk() -> None:
     high_risk = pii_data.get("high_risk_tables", [])
 
     if high_risk:
-        risk_df = pd.DataFrame(high_risk)
-        display_cols = [col for col in ["full_table_name", "risk_level", "pii_columns_count"]
-                       if col in risk_df.columns]
-        if display_cols:
-            st.dataframe(risk_df[display_cols], use_container_width=True, hide_index=True)
+        rows = _select_columns(
+            high_risk, ["full_table_name", "risk_level", "pii_columns_count"]
+        )
+        if rows[0]:
+            st.dataframe(rows, use_container_width=True, hide_index=True)
 
     st.markdown("---")
 
@@ -391,20 +425,38 @@ def render_pii_risk() -> None:
     medium_risk = pii_data.get("medium_risk_tables", [])
 
     if medium_risk:
-        risk_df = pd.DataFrame(medium_risk)
-        display_cols = [col for col in ["full_table_name", "risk_level", "pii_columns_count"]
-                       if col in risk_df.columns]
-        if display_cols:
-            st.dataframe(risk_df[display_cols], use_container_width=True, hide_index=True)
+        rows = _select_columns(
+            medium_risk, ["full_table_name", "risk_level", "pii_columns_count"]
+        )
+        if rows[0]:
+            st.dataframe(rows, use_container_width=True, hide_index=True)
 
 
 # Main app
 def main() -> None:
     """Main Streamlit app."""
+    st.markdown(PAGE_CSS, unsafe_allow_html=True)
     page = render_sidebar()
 
+    # One health check per rerun; the overview page gets its metrics from
+    # the same concurrent fetch.
+    overview: Dict[str, Any] = {}
     if page == "📊 Overview":
-        render_overview()
+        with st.spinner("Loading compliance metrics..."):
+            try:
+                health, overview = _health_and_overview()
+            except _FailedResponse as e:
+                health, overview = e.result
+    else:
+        health = _health()
+
+    if health.get("status") != "healthy":
+        st.error(
+            "⚠️ Backend API is not responding. Make sure the backend server is running."
+        )
+        st.info("Run `make backend` to start the backend server.")
+    elif page == "📊 Overview":
+        render_overview(overview)
     elif page == "🔎 Discover":
         render_discover()
     elif page == "📝 Documentation":
@@ -416,18 +468,7 @@ def main() -> None:
 
     # Footer
     st.markdown("---")
-    st.markdown(
-        """
-        <div style='text-align: center; color: #888; padding: 20px;'>
-            <p><strong>🌊 SyncFlow - Data Governance Excellence</strong></p>
-            <p>Powered by Fivetran • Databricks Unity Catalog • Google Cloud</p>
-            <p style='font-size: 0.9em; margin-top: 10px;'>
-                🤖 Google Gemini 2.5 Flash
-            </p>
-        </div>
-        """,
-        unsafe_allow_html=True,
-    )
+    st.markdown(FOOTER_HTML, unsafe_allow_html=True)
 
 
 if __name__ == "__main__":
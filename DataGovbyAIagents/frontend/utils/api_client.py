@@ -14,13 +14,39 @@
 
 """HTTP client for communicating with SyncFlow backend API."""
 
+import copy
 import logging
-from typing import Any, Dict, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import TracebackType
+from typing import Any, Dict, List, Optional, Set, Tuple, Type
 
+import cachetools
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import Retry
 
 logger = logging.getLogger(__name__)
 
+# Seconds a GET response is served from the client cache, per endpoint
+CACHE_TTLS: Dict[str, int] = {
+    "health": 5,
+    "compliance": 30,
+    "pii-analysis": 120,
+    "metadata-health": 60,
+    "table-details": 300,
+}
+
+# Seconds past the TTL a dashboard response is still served while it is
+# refreshed in the background (stale-while-revalidate)
+STALE_TTLS: Dict[str, int] = {
+    "compliance": 300,
+    "pii-analysis": 900,
+    "metadata-health": 300,
+}
+
 
 class APIClient:
     """Client for communicating with SyncFlow backend API."""
@@ -32,7 +58,142 @@ class APIClient:
             base_url: Base URL of backend API
         """
         self.base_url = base_url.rstrip("/")
+        # Keep-alive connections are reused across calls and reruns, and
+        # transient gateway errors are retried on the same pool.
         self.session = requests.Session()
+        self.session.headers.update(
+            {"Connection": "keep-alive", "Accept": "application/json"}
+        )
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.2,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "POST"]),
+            ),
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Decoded GET responses as (value, fetched_at), LRU-bounded
+        self._cache: cachetools.TTLCache = cachetools.TTLCache(
+            maxsize=256, ttl=max(*CACHE_TTLS.values(), *STALE_TTLS.values())
+        )
+        self._cache_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._executor = ThreadPoolExecutor(max_workers=2)
+        self._refreshing: Set[tuple] = set()
+
+    @property
+    def cache_stats(self) -> Dict[str, int]:
+        """Hit and miss counts of the GET response cache."""
+        return {"hits": self._hits, "misses": self._misses}
+
+    def invalidate(self, prefix: str = "") -> None:
+        """Drop cached responses whose endpoint starts with ``prefix``.
+
+        Args:
+            prefix: Endpoint name prefix, e.g. ``"table-details"``; empty
+                clears the whole cache
+        """
+        with self._cache_lock:
+            for key in [k for k in self._cache if k[0].startswith(prefix)]:
+                del self._cache[key]
+
+    def _cached_get(self, path: str, key: tuple) -> Dict[str, Any]:
+        """GET ``path``, serving the decoded body from cache while fresh.
+
+        Args:
+            path: Endpoint path
+            key: Cache key; ``key[0]`` names the endpoint in ``CACHE_TTLS``
+
+        Returns:
+            A copy of the decoded JSON body
+
+        Raises:
+            requests.RequestException: If the request fails on a miss
+        """
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            age = time.monotonic() - entry[1] if entry is not None else None
+            if age is not None and age < CACHE_TTLS[key[0]]:
+                self._hits += 1
+                return copy.deepcopy(entry[0])
+            if age is not None and age < STALE_TTLS.get(key[0], 0):
+                self._hits += 1
+                if key not in self._refreshing:
+                    self._refreshing.add(key)
+                    self._executor.submit(self._refresh, path, key)
+                return copy.deepcopy(entry[0])
+            self._misses += 1
+
+        return copy.deepcopy(self._fetch(path, key))
+
+    def _fetch(self, path: str, key: tuple) -> Dict[str, Any]:
+        """GET ``path`` and store the decoded body under ``key``."""
+        response = self.session.get(f"{self.base_url}{path}")
+        response.raise_for_status()
+        value = orjson.loads(response.content)
+        with self._cache_lock:
+            self._cache[key] = (value, time.monotonic())
+        return value
+
+    def _refresh(self, path: str, key: tuple) -> None:
+        """Revalidate a stale cache entry in the background."""
+        try:
+            self._fetch(path, key)
+        except Exception as e:
+            logger.warning(f"Background refresh of {path} failed: {e}")
+        finally:
+            with self._cache_lock:
+                self._refreshing.discard(key)
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._executor.shutdown(wait=False)
+        self.session.close()
+
+    def _call(self, method: str, path: str, **kwargs: Any) -> Dict[str, Any]:
+        """Issue a request on the pooled session and decode the JSON body.
+
+        Args:
+            method: HTTP method
+            path: Endpoint path
+            **kwargs: Passed to ``requests.Session.request``
+
+        Returns:
+            Decoded JSON body, or ``{"error": ...}`` on failure
+        """
+        try:
+            response = self.session.request(method, f"{self.base_url}{path}", **kwargs)
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except Exception as e:
+            logger.error(f"{method} {path} failed: {e}")
+            return {"error": str(e)}
+
+    def _get(self, path: str, key: tuple) -> Dict[str, Any]:
+        """Cached GET of ``path``, returning ``{"error": ...}`` on failure."""
+        try:
+            return self._cached_get(path, key)
+        except Exception as e:
+            logger.error(f"GET {path} failed: {e}")
+            return {"error": str(e)}
+
+    def __enter__(self) -> "APIClient":
+        """Use the client as a context manager."""
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        """Close pooled connections on exit."""
+        self.close()
 
     def health_check(self) -> Dict[str, Any]:
         """Check API health.
@@ -40,13 +201,49 @@ class APIClient:
         Returns:
             Health status
         """
+        result = self._get("/health", ("health",))
+        if "error" in result:
+            return {"status": "unhealthy", "error": result["error"]}
+        return result
+
+    def bulk(
+        self, calls: List[Tuple[str, str, Optional[Dict[str, Any]]]]
+    ) -> List[Dict[str, Any]]:
+        """Run several API calls in one round trip.
+
+        Falls back to concurrent individual requests when the backend has
+        no ``/bulk`` endpoint.
+
+        Args:
+            calls: ``(method, path, body)`` tuples, e.g.
+                ``("GET", "/compliance", None)``
+
+        Returns:
+            JSON responses in the order of ``calls``; failed calls are
+            returned as ``{"error": ...}``
+        """
+        specs = [
+            {"method": method, "path": path, "body": body}
+            for method, path, body in calls
+        ]
         try:
-            response = self.session.get(f"{self.base_url}/health")
+            response = self.session.post(f"{self.base_url}/bulk", json=specs)
+            if response.status_code == 404:
+                futures = [
+                    self._executor.submit(self._call, method, path, json=body)
+                    for method, path, body in calls
+                ]
+                return [future.result() for future in futures]
             response.raise_for_status()
-            return response.json()
+            return [
+                item["body"]
+                if item["status"] == 200
+                else {"error": item["body"].get("detail", item["status"])}
+                for item in orjson.loads(response.content)
+            ]
         except Exception as e:
-            logger.error(f"Health check failed: {e}")
-            return {"status": "unhealthy", "error": str(e)}
+            logger.error(f"Bulk request error: {e}")
+            return [{"error": str(e)} for _ in calls]
 
     def discover_data(self, query: str) -> Dict[str, Any]:
         """Discover data using query.
@@ -57,15 +254,18 @@ class APIClient:
         Returns:
             Discovery results
         """
-        try:
-            response = self.session.post(
-                f"{self.base_url}/discover", json={"query": query}
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Discovery error: {e}")
-            return {"error": str(e)}
+        return self._call("POST", "/discover", json={"query": query})
+
+    def get_pii_status(self, table_names: List[str]) -> Dict[str, Any]:
+        """Get PII status for several tables in one request.
+
+        Args:
+            table_names: Fully qualified table names
+
+        Returns:
+            PII summaries keyed by table name
+        """
+        return self._call("POST", "/pii-status", json={"table_names": table_names})
 
     def get_compliance(self) -> Dict[str, Any]:
         """Get compliance metrics.
@@ -73,13 +273,15 @@ class APIClient:
         Returns:
             Compliance information
         """
-        try:
-            response = self.session.get(f"{self.base_url}/compliance")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Compliance check error: {e}")
-            return {"error": str(e)}
+        return self._get("/compliance", ("compliance",))
+
+    def get_overview(self) -> Dict[str, Any]:
+        """Get overview page metrics.
+
+        Returns:
+            Metadata health, summary scores and highest risk tables
+        """
+        return self._call("GET", "/overview")
 
     def get_table_details(self, table_name: str) -> Dict[str, Any]:
         """Get table details.
@@ -90,15 +292,9 @@ class APIClient:
         Returns:
             Table details
         """
-        try:
-            response = self.session.get(
-                f"{self.base_url}/table-details/{table_name}"
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Table details error: {e}")
-            return {"error": str(e)}
+        return self._get(
+            f"/table-details/{table_name}", ("table-details", table_name)
+        )
 
     def generate_description(self, table_name: str) -> Dict[str, str]:
         """Generate table description.
@@ -109,16 +305,12 @@ class APIClient:
         Returns:
             Generated description
         """
-        try:
-            response = self.session.post(
-                f"{self.base_url}/generate-description",
-                json={"table_name": table_name},
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Description generation error: {e}")
-            return {"error": str(e)}
+        result = self._call(
+            "POST", "/generate-description", json={"table_name": table_name}
+        )
+        if "error" not in result:
+            self.invalidate("table-details")
+        return result
 
     def analyze_pii(self) -> Dict[str, Any]:
         """Analyze PII risk.
@@ -126,13 +318,7 @@ class APIClient:
         Returns:
             PII risk analysis
         """
-        try:
-            response = self.session.get(f"{self.base_url}/pii-analysis")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"PII analysis error: {e}")
-            return {"error": str(e)}
+        return self._get("/pii-analysis", ("pii-analysis",))
 
     def get_metadata_health(self) -> Dict[str, Any]:
         """Get metadata health.
@@ -140,13 +326,7 @@ class APIClient:
         Returns:
             Metadata health metrics
         """
-        try:
-            response = self.session.get(f"{self.base_url}/metadata-health")
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Metadata health error: {e}")
-            return {"error": str(e)}
+        return self._get("/metadata-health", ("metadata-health",))
 
     def query_ai(self, question: str) -> Dict[str, str]:
         """Query AI agent.
@@ -157,15 +337,7 @@ class APIClient:
         Returns:
             AI response
         """
-        try:
-            response = self.session.post(
-                f"{self.base_url}/query", json={"question": question}
-            )
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"AI query error: {e}")
-            return {"error": str(e)}
+        return self._call("POST", "/query", json={"question": question})
 
     def send_feedback(
         self,
@@ -183,15 +355,9 @@ class APIClient:
         Returns:
             Success response
         """
-        try:
-            data = {
-                "feedback_type": feedback_type,
-                "feedback_text": feedback_text,
-                "metadata": metadata or {},
-            }
-            response = self.session.post(f"{self.base_url}/feedback", json=data)
-            response.raise_for_status()
-            return response.json()
-        except Exception as e:
-            logger.error(f"Feedback submission error: {e}")
-            return {"error": str(e)}
+        data = {
+            "feedback_type": feedback_type,
+            "feedback_text": feedback_text,
+            "metadata": metadata or {},
+        }
+        return self._call("POST", "/feedback", json=data)
@@ -9,12 +9,22 @@ This module implements AI agents using Google Gemini 2.5 Flash via Vertex AI for
 4. Compliance Monitoring - Governance scoring and reporting
 """
 
+import asyncio
+import hashlib
 import json
-from typing import List, Dict, Any, Optional
-from google.cloud import bigquery
+import operator
+import re
+import threading
+from typing import TYPE_CHECKING, List, Dict, Any, Iterator, Optional
+from cachetools import TTLCache, cached, cachedmethod
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery, bigquery_storage
+from requests.adapters import HTTPAdapter
 import vertexai
-from vertexai.generative_models import GenerativeModel
-import pandas as pd
+from vertexai.generative_models import GenerationConfig, GenerativeModel
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 
 # ============================================================================
@@ -26,14 +36,306 @@ LOCATION = "us-central1"  # or your preferred region
 METADATA_DATASET = "unity_catalog_metadata"
 ML_DATASET = "ml_models"
 
+# Words ignored when picking a search keyword from a question
+_STOPWORDS = frozenset({'table', 'tables', 'find', 'show', 'list', 'what', 'where'})
+
+# Gemini requests in flight at once when describing many tables, kept below
+# the model's rate limit
+DESCRIPTION_CONCURRENCY = 8
+
+# Catalog, schema and table names accepted from user input
+_IDENT_RE = re.compile(r"[A-Za-z0-9_]{1,128}")
+
+# Question patterns routed to DataDiscoveryAgent handlers, tried in order;
+# named groups are passed to the handler as keyword arguments
+_RULES = [
+    # PII questions, optionally naming a schema after "in"
+    (re.compile(r"^(?=.*\b(?:pii|sensitive)\b)(?:.*?\bin\s+(?P<schema>\w+))?", re.I | re.S),
+     '_handle_pii'),
+    # "similar to <table>" / "similar ... like <table>"
+    (re.compile(r"^(?=.*\bsimilar\b).*?\b(?:to|like)\s+(?P<table_name>\w+(?:\.\w+)*)", re.I | re.S),
+     '_handle_similar'),
+    # "details"/"about" with a catalog.schema.table name
+    (re.compile(r"^(?=.*\b(?:details|about)\b).*?\b(?P<full_table_name>\w+\.\w+\.\w+)\b", re.I | re.S),
+     '_handle_details'),
+]
+
+# Structured output schema for data quality reports
+QUALITY_REPORT_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "status": {"type": "string"},
+        "issues": {"type": "array", "items": {"type": "string"}},
+        "actions": {"type": "array", "items": {"type": "string"}},
+    },
+    "required": ["status", "issues", "actions"],
+}
+
+# Structured output schema for batched column descriptions
+COLUMN_DESCRIPTIONS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "columns": {
+            "type": "array",
+            "items": {
+                "type": "object",
+                "properties": {
+                    "name": {"type": "string"},
+                    "description": {"type": "string"},
+                },
+                "required": ["name", "description"],
+            },
+        },
+    },
+    "required": ["columns"],
+}
+
+# Generated compliance reports keyed by a hash of the metrics in the prompt,
+# shared by all agents in the process
+_report_cache = TTLCache(maxsize=64, ttl=600)
+_report_cache_lock = threading.Lock()
+
 # Initialize Vertex AI
 vertexai.init(project=PROJECT_ID, location=LOCATION)
 
 # Initialize Gemini 2.5 Flash model via Vertex AI
 model = GenerativeModel('gemini-2.5-flash-002')
 
-# Initialize BigQuery client
+
+class CachedGemini:
+    """Gemini model wrapper that reuses responses for identical prompts"""
+
+    def __init__(self, model: GenerativeModel, maxsize: int = 256, ttl: int = 3600):
+        self.model = model
+        self._cache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(prompt: str) -> str:
+        return hashlib.sha256(prompt.encode()).hexdigest()
+
+    def generate(self, prompt: str) -> str:
+        """Return Gemini's text response for prompt, calling Gemini only on a cache miss"""
+        key = self._key(prompt)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        text = self.model.generate_content(prompt).text
+        with self._lock:
+            self._cache[key] = text
+        return text
+
+    def stream(self, prompt: str) -> Iterator[str]:
+        """Yield Gemini's response as it is generated; a cached response is yielded whole"""
+        key = self._key(prompt)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            yield cached
+            return
+
+        chunks = []
+        for chunk in self.model.generate_content(prompt, stream=True):
+            chunks.append(chunk.text)
+            yield chunk.text
+        with self._lock:
+            self._cache[key] = "".join(chunks)
+
+    async def agenerate(self, prompt: str) -> str:
+        """Async variant of generate"""
+        key = self._key(prompt)
+        with self._lock:
+            cached = self._cache.get(key)
+        if cached is not None:
+            return cached
+
+        text = (await self.model.generate_content_async(prompt)).text
+        with self._lock:
+            self._cache[key] = text
+        return text
+
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._cache.clear()
+
+
+# Quality reports come back as JSON matching QUALITY_REPORT_SCHEMA; responses
+# are cached by prompt
+quality_report_model = CachedGemini(GenerativeModel(
+    'gemini-2.5-flash-002',
+    generation_config=GenerationConfig(
+        response_mime_type="application/json",
+        response_schema=QUALITY_REPORT_SCHEMA,
+    ),
+))
+
+# Documentation guidance shared by every table and column prompt; sent as the
+# documentation model's system instruction rather than repeated in each prompt
+DOCUMENTATION_INSTRUCTION = """
+You write descriptions of database tables and columns in a Unity Catalog
+data catalog, inferring their meaning from names, data types and the other
+columns of the table.
+
+A table description is 2-3 sentences covering the business entity or concept
+the table represents, its purpose in the data architecture and the key
+information it stores.
+
+A column description is 1-2 sentences covering what the column represents,
+how it might be used and any important characteristics.
+
+Write for data analysts searching for data, business users exploring the
+available data and data governance documentation. Be professional, clear,
+concise and business-focused.
+"""
+
+documentation_model = GenerativeModel('gemini-2.5-flash-002', system_instruction=DOCUMENTATION_INSTRUCTION)
+
+# Prompt-level response cache for the documentation agent
+cached_documentation_model = CachedGemini(documentation_model)
+
+# Initialize BigQuery client, shared by all agents; size its HTTPS pool so
+# concurrent agent queries don't queue for a connection
+BQ_POOL_SIZE = 20
 bq_client = bigquery.Client(project=PROJECT_ID)
+bq_client._http.mount(
+    "https://", HTTPAdapter(pool_connections=BQ_POOL_SIZE, pool_maxsize=BQ_POOL_SIZE)
+)
+
+# Storage Read API client for DataFrame results; streams Arrow instead of
+# paging JSON rows through the REST API
+bqstorage_client = bigquery_storage.BigQueryReadClient()
+
+
+@cached(TTLCache(maxsize=1, ttl=600), lock=threading.Lock())
+def ml_dataset_available() -> bool:
+    """Whether the ML dataset exists; re-checked every 10 minutes"""
+    try:
+        bq_client.get_dataset(f"{PROJECT_ID}.{ML_DATASET}")
+        return True
+    except NotFound:
+        return False
+
+
+def clear_response_caches():
+    """Drop cached Gemini responses and compliance reports shared by all agents"""
+    quality_report_model.clear()
+    cached_documentation_model.clear()
+    with _report_cache_lock:
+        _report_cache.clear()
+    ml_dataset_available.cache_clear()
+
+
+def create_dashboard_views() -> None:
+    """Create the pre-aggregated views read by the governance dashboard.
+
+    Two materialized views hold the metadata counts and one the PII counts
+    per risk level; BigQuery refreshes them as Fivetran syncs. The
+    governance_dashboard_summary view reshapes the counts into the
+    metric/value/unit rows the Overview page shows, so each render reads a
+    few pre-computed rows instead of scanning the base tables.
+    """
+    refresh = "OPTIONS (enable_refresh = true, refresh_interval_minutes = 30)"
+    statements = [
+        f"""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS
+            `{PROJECT_ID}.{ML_DATASET}.dashboard_table_metrics`
+        {refresh} AS
+        SELECT
+            COUNT(*) as total_tables,
+            COUNT(DISTINCT schema_name) as total_schemas,
+            COUNT(DISTINCT catalog_name) as total_catalogs
+        FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
+        """,
+        f"""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS
+            `{PROJECT_ID}.{ML_DATASET}.dashboard_column_metrics`
+        {refresh} AS
+        SELECT COUNT(*) as total_columns
+        FROM `{PROJECT_ID}.{METADATA_DATASET}.columns`
+        """,
+        f"""
+        CREATE OR REPLACE VIEW `{PROJECT_ID}.{ML_DATASET}.governance_dashboard_summary` AS
+        SELECT metric, value, unit
+        FROM `{PROJECT_ID}.{ML_DATASET}.dashboard_table_metrics`,
+            `{PROJECT_ID}.{ML_DATASET}.dashboard_column_metrics`,
+            UNNEST([
+                STRUCT('Total Tables' as metric, total_tables as value, 'tables' as unit),
+                STRUCT('Total Columns', total_columns, 'columns'),
+                STRUCT('Total Schemas', total_schemas, 'schemas'),
+                STRUCT('Total Catalogs', total_catalogs, 'catalogs')
+            ])
+        """,
+        f"""
+        CREATE MATERIALIZED VIEW IF NOT EXISTS
+            `{PROJECT_ID}.{ML_DATASET}.pii_summary_by_risk_level`
+        {refresh} AS
+        SELECT
+            risk_level,
+            COUNT(*) as table_count,
+            SUM(pii_columns_count) as total_pii_columns
+        FROM `{PROJECT_ID}.{ML_DATASET}.pii_summary_by_table`
+        GROUP BY risk_level
+        """,
+    ]
+    for statement in statements:
+        bq_client.query(statement).result()
+
+
+def query_config(**params) -> bigquery.QueryJobConfig:
+    """Bind keyword arguments as query parameters (ints as INT64, else STRING).
+
+    Keeping user input out of the SQL text keeps the query text stable, so
+    BigQuery's results cache can serve repeated queries.
+    """
+    return bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter(
+                name, "INT64" if isinstance(value, int) else "STRING", value
+            )
+            for name, value in params.items()
+        ],
+        use_query_cache=True,
+    )
+
+
+def _check_ident(name: str) -> str:
+    """Return name if it is a plain identifier, else raise ValueError"""
+    if not _IDENT_RE.fullmatch(name):
+        raise ValueError(f"Invalid identifier: {name!r}")
+    return name
+
+
+def rows_to_dicts(job: bigquery.QueryJob) -> List[Dict]:
+    """Wait for a query job and return its rows as plain dicts."""
+    return [dict(row.items()) for row in job.result()]
+
+
+def first_row(job: bigquery.QueryJob) -> Dict:
+    """Wait for a single-row query job and return that row as a plain dict."""
+    return dict(next(iter(job.result())).items())
+
+
+def add_compliance_score(result: Dict) -> Dict:
+    """Add the overall compliance score (0-100) from documentation and PII risk rates"""
+    doc_score = result['documentation_pct'] * 0.4
+    risk_score = max(0, 100 - (result.get('high_risk_pct') or 0)) * 0.6
+    result['overall_compliance_score'] = round(doc_score + risk_score, 2)
+    return result
+
+
+def add_freshness_status(result: Dict) -> Dict:
+    """Add FRESH/ACCEPTABLE/STALE from the minutes since the last sync"""
+    minutes = result['minutes_since_sync']
+    if minutes < 20:
+        result['freshness_status'] = 'FRESH'
+    elif minutes < 60:
+        result['freshness_status'] = 'ACCEPTABLE'
+    else:
+        result['freshness_status'] = 'STALE'
+    return result
 
 
 # ============================================================================
@@ -55,7 +357,7 @@ class DataDiscoveryAgent:
     """
 
     def __init__(self):
-        self.bq_client = bigquery.Client(project=PROJECT_ID)
+        self.bq_client = bq_client  # Shared BigQuery client
         self.model = model  # Gemini 2.5 Flash via Vertex AI
 
         # Define tools for the agent
@@ -79,13 +381,15 @@ class DataDiscoveryAgent:
             comment,
             _fivetran_synced as last_synced
         FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
-        WHERE LOWER(table_name) LIKE '%{keyword.lower()}%'
-           OR LOWER(COALESCE(comment, '')) LIKE '%{keyword.lower()}%'
-        LIMIT {limit}
+        WHERE CONTAINS_SUBSTR(table_name, @kw)
+           OR CONTAINS_SUBSTR(comment, @kw)
+        LIMIT @lim
         """
 
-        results = self.bq_client.query(query).to_dataframe()
-        return results.to_dict('records')
+        # CONTAINS_SUBSTR is case-insensitive and can use the tables search
+        # index (`make search-index`) instead of scanning every row
+        job_config = query_config(kw=keyword.lower(), lim=limit)
+        return rows_to_dicts(self.bq_client.query(query, job_config=job_config))
 
     def search_tables_by_schema(self, schema_name: str) -> List[Dict]:
         """Get all tables in a specific schema"""
@@ -98,12 +402,12 @@ class DataDiscoveryAgent:
             table_type,
             comment
         FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
-        WHERE schema_name = '{schema_name}'
+        WHERE schema_name = @schema_name
         ORDER BY table_name
         """
 
-        results = self.bq_client.query(query).to_dataframe()
-        return results.to_dict('records')
+        job_config = query_config(schema_name=_check_ident(schema_name))
+        return rows_to_dicts(self.bq_client.query(query, job_config=job_config))
 
     def get_table_details(self, full_table_name: str) -> Dict:
         """Get detailed information about a specific table including columns and PII status"""
@@ -115,60 +419,76 @@ class DataDiscoveryAgent:
 
         catalog, schema, table = parts
 
-        # Get table metadata
-        table_query = f"""
-        SELECT
-            catalog_name,
-            schema_name,
-            table_name,
-            table_type,
-            comment,
-            created_at as created,
-            _fivetran_synced as last_synced
-        FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
-        WHERE catalog_name = '{catalog}'
-          AND schema_name = '{schema}'
-          AND table_name = '{table}'
-        """
-
-        table_info = self.bq_client.query(table_query).to_dataframe()
-        if table_info.empty:
-            return {"error": f"Table {full_table_name} not found"}
-
-        # Get columns
-        columns_query = f"""
+        # Table metadata, columns and PII status in one job
+        pii_select = f"""(
+            SELECT AS STRUCT
+                pii_columns_count,
+                pii_columns,
+                risk_level,
+                avg_pii_score_pct
+            FROM `{PROJECT_ID}.{ML_DATASET}.pii_summary_by_table`
+            WHERE table_catalog = @catalog
+              AND table_schema = @schema
+              AND table_name = @table
+            LIMIT 1
+        )"""
+        details_query = """
         SELECT
-            column_name,
-            data_type,
-            nullable as is_nullable,
-            position as ordinal_position,
-            comment
-        FROM `{PROJECT_ID}.{METADATA_DATASET}.columns`
-        WHERE table_full_name = '{full_table_name}'
-        ORDER BY position
+            (
+                SELECT AS STRUCT
+                    catalog_name,
+                    schema_name,
+                    table_name,
+                    table_type,
+                    comment,
+                    created_at as created,
+                    _fivetran_synced as last_synced
+                FROM `{project}.{dataset}.tables`
+                WHERE catalog_name = @catalog
+                  AND schema_name = @schema
+                  AND table_name = @table
+                LIMIT 1
+            ) AS tbl,
+            ARRAY(
+                SELECT AS STRUCT
+                    column_name,
+                    data_type,
+                    nullable as is_nullable,
+                    position as ordinal_position,
+                    comment
+                FROM `{project}.{dataset}.columns`
+                WHERE table_full_name = @fqn
+                ORDER BY position
+            ) AS cols,
+            {pii} AS pii
         """
+        job_config = query_config(
+            catalog=catalog, schema=schema, table=table, fqn=full_table_name
+        )
 
-        columns = self.bq_client.query(columns_query).to_dataframe()
+        try:
+            query = details_query.format(
+                project=PROJECT_ID,
+                dataset=METADATA_DATASET,
+                pii=pii_select if ml_dataset_available() else "NULL",
+            )
+            row = first_row(self.bq_client.query(query, job_config=job_config))
+        except Exception:
+            # No PII info if ML dataset doesn't exist
+            query = details_query.format(
+                project=PROJECT_ID, dataset=METADATA_DATASET, pii="NULL"
+            )
+            row = first_row(self.bq_client.query(query, job_config=job_config))
 
-        # Get PII status
-        pii_query = f"""
-        SELECT
-            pii_columns_count,
-            pii_columns,
-            risk_level,
-            avg_pii_score_pct
-        FROM `{PROJECT_ID}.{ML_DATASET}.pii_summary_by_table`
-        WHERE table_catalog = '{catalog}'
-          AND table_schema = '{schema}'
-          AND table_name = '{table}'
-        """
+        if row["tbl"] is None:
+            return {"error": f"Table {full_table_name} not found"}
 
-        pii_info = self.bq_client.query(pii_query).to_dataframe()
+        columns = [dict(col) for col in row["cols"]]
 
         return {
-            "table": table_info.to_dict('records')[0],
-            "columns": columns.to_dict('records'),
-            "pii_info": pii_info.to_dict('records')[0] if not pii_info.empty else None,
+            "table": dict(row["tbl"]),
+            "columns": columns,
+            "pii_info": dict(row["pii"]) if row["pii"] is not None else None,
             "column_count": len(columns)
         }
 
@@ -176,11 +496,14 @@ class DataDiscoveryAgent:
         """Find tables with similar characteristics using ML clustering"""
 
         try:
+            if not ml_dataset_available():
+                return []
+
             query = f"""
             WITH target_cluster AS (
                 SELECT cluster_id
                 FROM `{PROJECT_ID}.{ML_DATASET}.table_clusters`
-                WHERE LOWER(table_name) = LOWER('{table_name}')
+                WHERE LOWER(table_name) = LOWER(@table_name)
                 LIMIT 1
             )
 
@@ -193,13 +516,13 @@ class DataDiscoveryAgent:
             FROM `{PROJECT_ID}.{ML_DATASET}.table_clusters` tc
             CROSS JOIN target_cluster t
             WHERE tc.cluster_id = t.cluster_id
-              AND LOWER(tc.table_name) != LOWER('{table_name}')
+              AND LOWER(tc.table_name) != LOWER(@table_name)
             ORDER BY tc.cluster_distance
-            LIMIT {limit}
+            LIMIT @lim
             """
 
-            results = self.bq_client.query(query).to_dataframe()
-            return results.to_dict('records')
+            job_config = query_config(table_name=_check_ident(table_name), lim=limit)
+            return rows_to_dicts(self.bq_client.query(query, job_config=job_config))
         except Exception:
             # Return empty list if ML dataset doesn't exist
             return []
@@ -208,7 +531,10 @@ class DataDiscoveryAgent:
         """Check PII status across tables, optionally filtered by schema"""
 
         try:
-            where_clause = f"WHERE table_schema = '{schema_name}'" if schema_name else ""
+            if not ml_dataset_available():
+                return []
+
+            where_clause = "WHERE table_schema = @schema_name" if schema_name else ""
 
             query = f"""
             SELECT
@@ -223,8 +549,8 @@ class DataDiscoveryAgent:
             LIMIT 20
             """
 
-            results = self.bq_client.query(query).to_dataframe()
-            return results.to_dict('records')
+            job_config = query_config(schema_name=_check_ident(schema_name)) if schema_name else query_config()
+            return rows_to_dicts(self.bq_client.query(query, job_config=job_config))
         except Exception:
             # Return empty list if ML dataset doesn't exist
             return []
@@ -270,86 +596,70 @@ class DataDiscoveryAgent:
         # For this implementation, we'll use simple keyword matching
         # In production, you'd use the Reasoning Engine with function calling
 
-        question_lower = user_question.lower()
-
-        if 'pii' in question_lower or 'sensitive' in question_lower:
-            schema = None
-            if 'in' in question_lower:
-                # Try to extract schema name
-                words = user_question.split()
-                if 'in' in words:
-                    idx = words.index('in')
-                    if idx + 1 < len(words):
-                        schema = words[idx + 1].strip('?.,')
-
-            results = self.check_pii_status(schema)
-            return self._format_pii_results(results)
-
-        elif 'similar' in question_lower:
-            # Extract table name
-            words = user_question.split()
-            for i, word in enumerate(words):
-                if word.lower() in ['to', 'like']:
-                    if i + 1 < len(words):
-                        table_name = words[i + 1].strip('?.,')
-                        results = self.find_similar_tables(table_name)
-                        return self._format_similar_tables(results, table_name)
-
-        elif 'details' in question_lower or 'about' in question_lower:
-            # Look for table name (format: catalog.schema.table)
-            words = user_question.split()
-            for word in words:
-                if '.' in word and word.count('.') == 2:
-                    table_name = word.strip('?.,')
-                    result = self.get_table_details(table_name)
-                    return self._format_table_details(result)
-
-        else:
-            # Default to keyword search
-            keywords = [w for w in user_question.split() if len(w) > 3 and w.lower() not in ['table', 'tables', 'find', 'show', 'list', 'what', 'where']]
-            if keywords:
-                keyword = keywords[0]
-                results = self.search_tables_by_keyword(keyword)
-                return self._format_search_results(results, keyword)
+        for pattern, handler in _RULES:
+            match = pattern.search(user_question)
+            if match:
+                return getattr(self, handler)(**match.groupdict())
+
+        # Default to keyword search
+        keywords = [w for w in user_question.split() if len(w) > 3 and w.lower() not in _STOPWORDS]
+        if keywords:
+            keyword = keywords[0]
+            results = self.search_tables_by_keyword(keyword)
+            return self._format_search_results(results, keyword)
 
         return "I'm not sure how to answer that question. Try asking about: table search, PII detection, similar tables, or table details."
 
+    def _handle_pii(self, schema: Optional[str] = None) -> str:
+        return self._format_pii_results(self.check_pii_status(schema))
+
+    def _handle_similar(self, table_name: str) -> str:
+        results = self.find_similar_tables(table_name)
+        return self._format_similar_tables(results, table_name)
+
+    def _handle_details(self, full_table_name: str) -> str:
+        return self._format_table_details(self.get_table_details(full_table_name))
+
     def _format_search_results(self, results: List[Dict], keyword: str) -> str:
         if not results:
             return f"No tables found matching '{keyword}'"
 
-        output = f"Found {len(results)} tables matching '{keyword}':\n\n"
+        parts = [f"Found {len(results)} tables matching '{keyword}':\n\n"]
         for r in results:
-            output += f"• {r['full_name']} ({r['table_type']})\n"
+            parts.append(f"• {r['full_name']} ({r['table_type']})\n")
             if r.get('comment'):
-                output += f"  Description: {r['comment']}\n"
+                parts.append(f"  Description: {r['comment']}\n")
 
-        return output
+        return "".join(parts)
 
     def _format_pii_results(self, results: List[Dict]) -> str:
         if not results:
             return "No tables with PII detected."
 
-        output = f"Found {len(results)} tables with PII:\n\n"
+        parts = [f"Found {len(results)} tables with PII:\n\n"]
         for r in results:
-            output += f"• {r['full_table_name']}\n"
-            output += f"  Risk Level: {r['risk_level']}\n"
-            output += f"  PII Columns ({r['pii_columns_count']}): {r['pii_columns']}\n"
-            output += f"  Confidence: {r['avg_pii_score_pct']}%\n\n"
+            parts.append(
+                f"• {r['full_table_name']}\n"
+                f"  Risk Level: {r['risk_level']}\n"
+                f"  PII Columns ({r['pii_columns_count']}): {r['pii_columns']}\n"
+                f"  Confidence: {r['avg_pii_score_pct']}%\n\n"
+            )
 
-        return output
+        return "".join(parts)
 
     def _format_similar_tables(self, results: List[Dict], original_table: str) -> str:
         if not results:
             return f"No similar tables found for '{original_table}'"
 
-        output = f"Tables similar to '{original_table}':\n\n"
+        parts = [f"Tables similar to '{original_table}':\n\n"]
         for r in results:
-            output += f"• {r['full_name']}\n"
-            output += f"  Cluster: {r['cluster_name']}\n"
-            output += f"  Columns: {r['column_count']}, PII Columns: {r['pii_columns']}\n\n"
+            parts.append(
+                f"• {r['full_name']}\n"
+                f"  Cluster: {r['cluster_name']}\n"
+                f"  Columns: {r['column_count']}, PII Columns: {r['pii_columns']}\n\n"
+            )
 
-        return output
+        return "".join(parts)
 
     def _format_table_details(self, result: Dict) -> str:
         if 'error' in result:
@@ -359,31 +669,36 @@ class DataDiscoveryAgent:
         columns = result['columns']
         pii = result.get('pii_info')
 
-        output = f"Table: {table['catalog_name']}.{table['schema_name']}.{table['table_name']}\n\n"
-        output += f"Type: {table['table_type']}\n"
+        parts = [
+            f"Table: {table['catalog_name']}.{table['schema_name']}.{table['table_name']}\n\n",
+            f"Type: {table['table_type']}\n",
+        ]
         if table.get('comment'):
-            output += f"Description: {table['comment']}\n"
-        output += f"Created: {table.get('created', 'N/A')}\n"
-        output += f"Columns: {result['column_count']}\n\n"
+            parts.append(f"Description: {table['comment']}\n")
+        parts.append(f"Created: {table.get('created', 'N/A')}\n")
+        parts.append(f"Columns: {result['column_count']}\n\n")
 
         if pii:
-            output += f"PII Detection:\n"
-            output += f"  Risk Level: {pii['risk_level']}\n"
-            output += f"  PII Columns: {pii['pii_columns_count']}\n"
-            output += f"  Affected: {pii['pii_columns']}\n\n"
+            parts.append(
+                f"PII Detection:\n"
+                f"  Risk Level: {pii['risk_level']}\n"
+                f"  PII Columns: {pii['pii_columns_count']}\n"
+                f"  Affected: {pii['pii_columns']}\n\n"
+            )
 
-        output += "Columns:\n"
+        parts.append("Columns:\n")
         for col in columns[:20]:  # Show first 20 columns
             nullable_flag = col['is_nullable']
-            output += f"  • {col['column_name']} ({col['data_type']})"
-            if nullable_flag == False or str(nullable_flag).upper() == 'NO':
-                output += " NOT NULL"
-            output += "\n"
+            not_null = nullable_flag == False or str(nullable_flag).upper() == 'NO'
+            parts.append(
+                f"  • {col['column_name']} ({col['data_type']})"
+                f"{' NOT NULL' if not_null else ''}\n"
+            )
 
         if len(columns) > 20:
-            output += f"  ... and {len(columns) - 20} more columns\n"
+            parts.append(f"  ... and {len(columns) - 20} more columns\n")
 
-        return output
+        return "".join(parts)
 
 
 # ============================================================================
@@ -404,13 +719,30 @@ class ComplianceGuardianAgent:
     """
 
     def __init__(self):
-        self.bq_client = bigquery.Client(project=PROJECT_ID)
+        self.bq_client = bq_client  # Shared BigQuery client
         self.model = model  # Gemini 2.5 Flash via Vertex AI
 
+        # Metadata only changes on Fivetran syncs, so short TTLs are safe
+        self._score_cache = TTLCache(maxsize=1, ttl=60)
+        self._high_risk_cache = TTLCache(maxsize=1, ttl=120)
+        self._undocumented_cache = TTLCache(maxsize=16, ttl=120)
+        self._lock = threading.RLock()
+
+    def invalidate(self):
+        """Drop cached metrics, e.g. after documenting or classifying tables"""
+        with self._lock:
+            self._score_cache.clear()
+            self._high_risk_cache.clear()
+            self._undocumented_cache.clear()
+
+    @cachedmethod(operator.attrgetter('_score_cache'), lock=operator.attrgetter('_lock'))
     def get_compliance_score(self) -> Dict:
         """Calculate overall compliance score"""
 
         try:
+            if not ml_dataset_available():
+                raise LookupError(f"Dataset {ML_DATASET} not found")
+
             query = f"""
             WITH metrics AS (
                 SELECT
@@ -437,7 +769,7 @@ class ComplianceGuardianAgent:
             FROM metrics
             """
 
-            result = self.bq_client.query(query).to_dataframe().to_dict('records')[0]
+            result = first_row(self.bq_client.query(query))
         except Exception:
             # Fallback query without ML dataset
             query = f"""
@@ -445,55 +777,115 @@ class ComplianceGuardianAgent:
                 COUNT(*) as total_tables,
                 0 as tables_with_pii,
                 0 as high_risk_tables,
-                SUM(CASE WHEN comment IS NOT NULL THEN 1 ELSE 0 END) as documented_tables,
-                ROUND(100.0 * SUM(CASE WHEN comment IS NOT NULL THEN 1 ELSE 0 END) / NULLIF(COUNT(*), 0), 2) as documentation_pct,
+                COUNTIF(comment IS NOT NULL) as documented_tables,
+                ROUND(100.0 * COUNTIF(comment IS NOT NULL) / NULLIF(COUNT(*), 0), 2) as documentation_pct,
                 0.0 as high_risk_pct
             FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
             """
-            result = self.bq_client.query(query).to_dataframe().to_dict('records')[0]
+            result = first_row(self.bq_client.query(query))
+
+        return add_compliance_score(result)
 
-        # Calculate overall score (0-100)
-        doc_score = result['documentation_pct'] * 0.4
-        risk_score = max(0, 100 - result.get('high_risk_pct', 0)) * 0.6
-        overall_score = doc_score + risk_score
+    def get_overview_bundle(self) -> Dict:
+        """Get metadata freshness and the compliance score in one query
 
-        result['overall_compliance_score'] = round(overall_score, 2)
+        The overview page needs both, and both aggregate the tables metadata;
+        one statement scans it once and costs a single job.
+        """
 
-        return result
+        pii_cte = ""
+        pii_select = ""
+        if ml_dataset_available():
+            pii_cte = f""",
+            pii AS (
+                SELECT
+                    COUNTIF(pii_columns_count > 0) as tables_with_pii,
+                    COUNTIF(risk_level = 'HIGH') as high_risk_tables
+                FROM `{PROJECT_ID}.{ML_DATASET}.pii_summary_by_table`
+            )"""
+            pii_select = ", (SELECT AS STRUCT * FROM pii) as pii"
+
+        query = f"""
+        WITH
+            sync AS (
+                SELECT
+                    MIN(_fivetran_synced) as oldest_sync,
+                    MAX(_fivetran_synced) as latest_sync,
+                    TIMESTAMP_DIFF(CURRENT_TIMESTAMP(), MAX(_fivetran_synced), MINUTE) as minutes_since_sync
+                FROM `{PROJECT_ID}.{METADATA_DATASET}.sync_status`
+            ),
+            counts AS (
+                SELECT
+                    COUNT(DISTINCT catalog_name) as catalogs_synced,
+                    COUNT(*) as tables_synced,
+                    COUNTIF(comment IS NOT NULL) as documented_tables
+                FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
+            ),
+            metadata AS (SELECT * FROM sync CROSS JOIN counts){pii_cte}
+        SELECT (SELECT AS STRUCT * FROM metadata) as metadata{pii_select}
+        """
+
+        row = first_row(self.bq_client.query(query))
+        freshness = dict(row['metadata'])
+        pii = dict(row.get('pii') or {})
+
+        total = freshness['tables_synced']
+        documented = freshness.pop('documented_tables')
+        tables_with_pii = pii.get('tables_with_pii', 0)
+        high_risk = pii.get('high_risk_tables', 0)
+
+        return {
+            'freshness': add_freshness_status(freshness),
+            'compliance': add_compliance_score({
+                'total_tables': total,
+                'tables_with_pii': tables_with_pii,
+                'high_risk_tables': high_risk,
+                'documented_tables': documented,
+                'documentation_pct': round(100.0 * documented / total, 2) if total else 0.0,
+                'high_risk_pct': round(100.0 * high_risk / tables_with_pii, 2) if tables_with_pii else 0.0,
+            }),
+        }
 
     def get_high_risk_tables(self) -> List[Dict]:
-        """Get list of high-risk tables requiring attention"""
+        """Get list of high-risk tables requiring attention
 
-        try:
-            query = f"""
-            SELECT
-                t.table_catalog,
-                t.table_schema,
-                t.table_name,
-                t.full_table_name,
-                t.pii_columns_count,
-                t.pii_columns,
-                t.risk_level,
-                t.avg_pii_score_pct,
-                CASE WHEN tm.comment IS NULL THEN TRUE ELSE FALSE END as undocumented,
-                tm._fivetran_synced as last_synced
-            FROM `{PROJECT_ID}.{ML_DATASET}.pii_summary_by_table` t
-            LEFT JOIN `{PROJECT_ID}.{METADATA_DATASET}.tables` tm
-                ON t.table_catalog = tm.catalog_name
-                AND t.table_schema = tm.schema_name
-                AND t.table_name = tm.table_name
-            WHERE t.risk_level IN ('HIGH', 'MEDIUM')
-            ORDER BY
-                CASE t.risk_level WHEN 'HIGH' THEN 1 WHEN 'MEDIUM' THEN 2 ELSE 3 END,
-                t.pii_columns_count DESC
-            """
+        Only the fields shown in the dashboard's high-risk table are selected.
+        """
 
-            results = self.bq_client.query(query).to_dataframe()
-            return results.to_dict('records')
+        try:
+            return self._fetch_high_risk_tables()
         except Exception:
-            # Return empty list if ML dataset doesn't exist
+            # Not cached, so a failed query is retried on the next call
+            # instead of reporting no high-risk tables until the TTL expires
+            return []
+
+    @cachedmethod(operator.attrgetter('_high_risk_cache'), lock=operator.attrgetter('_lock'))
+    def _fetch_high_risk_tables(self) -> List[Dict]:
+        """Query the high-risk tables; raises if the query fails"""
+
+        if not ml_dataset_available():
             return []
 
+        query = f"""
+        SELECT
+            t.full_table_name,
+            t.risk_level,
+            t.pii_columns_count,
+            tm.comment IS NULL as undocumented
+        FROM `{PROJECT_ID}.{ML_DATASET}.pii_summary_by_table` t
+        LEFT JOIN `{PROJECT_ID}.{METADATA_DATASET}.tables` tm
+            ON t.table_catalog = tm.catalog_name
+            AND t.table_schema = tm.schema_name
+            AND t.table_name = tm.table_name
+        WHERE t.risk_level IN ('HIGH', 'MEDIUM')
+        ORDER BY
+            CASE t.risk_level WHEN 'HIGH' THEN 1 WHEN 'MEDIUM' THEN 2 ELSE 3 END,
+            t.pii_columns_count DESC
+        """
+
+        return rows_to_dicts(self.bq_client.query(query))
+
+    @cachedmethod(operator.attrgetter('_undocumented_cache'), lock=operator.attrgetter('_lock'))
     def get_undocumented_tables(self, limit: int = 50) -> List[Dict]:
         """Find tables without documentation"""
 
@@ -512,16 +904,35 @@ class ComplianceGuardianAgent:
         LIMIT {limit}
         """
 
-        results = self.bq_client.query(query).to_dataframe()
-        return results.to_dict('records')
+        return rows_to_dicts(self.bq_client.query(query))
 
     def generate_compliance_report(self) -> str:
         """Generate a comprehensive compliance report"""
+        return "".join(self.stream_compliance_report())
+
+    def stream_compliance_report(self) -> Iterator[str]:
+        """Generate the compliance report, yielding text as Gemini produces it"""
 
         score_data = self.get_compliance_score()
         high_risk = self.get_high_risk_tables()
         undocumented = self.get_undocumented_tables(20)
 
+        # The prompt is fully determined by these metrics, so reuse the report
+        # generated for them within the reporting window
+        metrics = {
+            **score_data,
+            'high_risk_count': len(high_risk),
+            'undocumented_count': len(undocumented),
+        }
+        cache_key = hashlib.blake2b(
+            json.dumps(metrics, sort_keys=True, default=str).encode(), digest_size=16
+        ).hexdigest()
+        with _report_cache_lock:
+            cached = _report_cache.get(cache_key)
+        if cached is not None:
+            yield cached
+            return
+
         # Use Gemini to generate narrative report
         prompt = f"""
         Generate a compliance report based on this data governance analysis:
@@ -546,8 +957,12 @@ class ComplianceGuardianAgent:
         Use a professional, data-driven tone.
         """
 
-        response = self.model.generate_content(prompt)
-        return response.text
+        chunks = []
+        for chunk in self.model.generate_content(prompt, stream=True):
+            chunks.append(chunk.text)
+            yield chunk.text
+        with _report_cache_lock:
+            _report_cache[cache_key] = "".join(chunks)
 
 
 # ============================================================================
@@ -568,18 +983,22 @@ class AutoDocumentationAgent:
     """
 
     def __init__(self):
-        self.bq_client = bigquery.Client(project=PROJECT_ID)
-        self.model = model  # Gemini 2.5 Flash via Vertex AI
+        self.bq_client = bq_client  # Shared BigQuery client
+        self.bqstorage_client = bqstorage_client
+        self.model = documentation_model  # Gemini 2.5 Flash with documentation instructions
+        self.cache = cached_documentation_model
 
     def generate_table_description(self, full_table_name: str) -> str:
         """Generate AI description for a table based on its structure"""
+        return "".join(self.stream_table_description(full_table_name))
 
-        # Get table details
-        parts = full_table_name.split('.')
-        if len(parts) != 3:
-            return "Error: Invalid table name format"
+    def stream_table_description(self, full_table_name: str) -> Iterator[str]:
+        """Generate the table description, yielding text as Gemini produces it"""
 
-        catalog, schema, table = parts
+        # Validate the catalog.schema.table name
+        if full_table_name.count('.') != 2:
+            yield "Error: Invalid table name format"
+            return
 
         # Get column information
         query = f"""
@@ -588,45 +1007,48 @@ class AutoDocumentationAgent:
             data_type,
             comment
         FROM `{PROJECT_ID}.{METADATA_DATASET}.columns`
-        WHERE table_full_name = '{full_table_name}'
+        WHERE table_full_name = @fqn
         ORDER BY position
         """
 
-        columns = self.bq_client.query(query).to_dataframe()
+        columns = rows_to_dicts(self.bq_client.query(query, job_config=query_config(fqn=full_table_name)))
 
-        if columns.empty:
-            return "Error: Table not found"
+        if not columns:
+            yield "Error: Table not found"
+            return
+
+        yield from self.cache.stream(self._table_description_prompt(full_table_name, columns))
+
+    @staticmethod
+    def _table_description_prompt(full_table_name: str, columns: List[Dict]) -> str:
+        """Build the Gemini prompt describing a table from its columns"""
+        schema = full_table_name.split('.')[1]
 
         # Build context for Gemini
         column_info = "\n".join([
             f"- {row['column_name']} ({row['data_type']})"
-            for _, row in columns.iterrows()
+            for row in columns
         ])
 
-        prompt = f"""
-        Generate a clear, concise description for this database table:
+        return f"""
+        Describe this database table:
 
         Table: {full_table_name}
         Schema: {schema}
 
         Columns:
         {column_info}
+        """
 
-        Analyze the column names and types to infer:
-        1. What business entity or concept this table represents
-        2. The table's purpose in the data architecture
-        3. Key information stored
+    async def _generate_descriptions_async(self, prompts: List[str]) -> List[str]:
+        """Run Gemini on several prompts concurrently, at most DESCRIPTION_CONCURRENCY at a time"""
+        semaphore = asyncio.Semaphore(DESCRIPTION_CONCURRENCY)
 
-        Provide a 2-3 sentence description that would be helpful for:
-        - Data analysts searching for data
-        - Business users understanding available data
-        - Data governance documentation
+        async def generate(prompt: str) -> str:
+            async with semaphore:
+                return await self.cache.agenerate(prompt)
 
-        Format: Professional, clear, and business-focused.
-        """
-
-        response = self.model.generate_content(prompt)
-        return response.text
+        return list(await asyncio.gather(*(generate(prompt) for prompt in prompts)))
 
     def generate_column_description(self, full_table_name: str, column_name: str) -> str:
         """Generate AI description for a specific column"""
@@ -637,31 +1059,30 @@ class AutoDocumentationAgent:
 
         catalog, schema, table = parts
 
-        # Get column info and surrounding context
+        # Get the target column and its siblings' names in one row
         query = f"""
         SELECT
-            column_name,
-            data_type,
-            nullable as is_nullable,
-            comment
-        FROM `{PROJECT_ID}.{METADATA_DATASET}.columns`
-        WHERE table_full_name = '{full_table_name}'
-        ORDER BY position
+            (SELECT AS STRUCT data_type, nullable as is_nullable
+             FROM `{PROJECT_ID}.{METADATA_DATASET}.columns`
+             WHERE table_full_name = @fqn AND column_name = @column_name) as col_info,
+            ARRAY(SELECT column_name
+                  FROM `{PROJECT_ID}.{METADATA_DATASET}.columns`
+                  WHERE table_full_name = @fqn
+                  ORDER BY position) as siblings
         """
 
-        columns = self.bq_client.query(query).to_dataframe()
+        job_config = query_config(fqn=full_table_name, column_name=column_name)
+        row = first_row(self.bq_client.query(query, job_config=job_config))
 
-        if columns.empty:
+        if not row['siblings']:
             return "Error: Table not found"
 
-        target_column = columns[columns['column_name'] == column_name]
-        if target_column.empty:
+        col_info = row['col_info']
+        if col_info is None:
             return "Error: Column not found"
 
-        col_info = target_column.iloc[0]
-
         prompt = f"""
-        Generate a clear description for this database column:
+        Describe this database column:
 
         Table: {full_table_name}
         Column: {column_name}
@@ -669,65 +1090,99 @@ class AutoDocumentationAgent:
         Nullable: {col_info['is_nullable']}
 
         Context - Other columns in this table:
-        {', '.join(columns['column_name'].tolist())}
+        {', '.join(row['siblings'])}
+        """
+
+        return self.cache.generate(prompt)
 
-        Provide a 1-2 sentence description explaining:
-        - What this column represents
-        - How it might be used
-        - Any important characteristics
+    def generate_all_column_descriptions(self, full_table_name: str) -> Dict[str, str]:
+        """Generate AI descriptions for every column of a table in one Gemini call"""
 
-        Format: Clear, concise, business-focused.
+        if len(full_table_name.split('.')) != 3:
+            raise ValueError("Invalid table name format")
+
+        query = f"""
+        SELECT
+            column_name,
+            data_type,
+            nullable as is_nullable
+        FROM `{PROJECT_ID}.{METADATA_DATASET}.columns`
+        WHERE table_full_name = @fqn
+        ORDER BY position
         """
 
-        response = self.model.generate_content(prompt)
-        return response.text
+        columns = rows_to_dicts(self.bq_client.query(query, job_config=query_config(fqn=full_table_name)))
 
-    def generate_data_dictionary(self, schema_name: str) -> pd.DataFrame:
-        """Generate a complete data dictionary for a schema"""
+        if not columns:
+            return {}
 
-        # Get all tables in schema
-        tables_query = f"""
-        SELECT DISTINCT
-            catalog_name,
-            schema_name,
-            table_name,
-            full_name
-        FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
-        WHERE schema_name = '{schema_name}'
-        ORDER BY table_name
+        column_info = "\n".join(
+            f"- {c['column_name']} ({c['data_type']}, nullable: {c['is_nullable']})"
+            for c in columns
+        )
+
+        prompt = f"""
+        Describe every column of this database table:
+
+        Table: {full_table_name}
+
+        Columns:
+        {column_info}
         """
 
-        tables = self.bq_client.query(tables_query).to_dataframe()
+        response = self.model.generate_content(
+            prompt,
+            generation_config=GenerationConfig(
+                response_mime_type="application/json",
+                response_schema=COLUMN_DESCRIPTIONS_SCHEMA,
+            ),
+        )
 
-        dictionary_data = []
+        return {
+            c['name']: c['description']
+            for c in json.loads(response.text).get('columns', [])
+        }
+
+    def generate_data_dictionary(self, schema_name: str) -> "pd.DataFrame":
+        """Generate a complete data dictionary for a schema"""
 
-        for _, table_row in tables.iterrows():
-            full_name = table_row['full_name']
+        # Get every column of every table in the schema in one job
+        query = f"""
+        WITH schema_tables AS (
+            SELECT DISTINCT table_name, full_name
+            FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
+            WHERE schema_name = @schema_name
+        )
+        SELECT
+            t.table_name,
+            t.full_name,
+            c.column_name,
+            c.data_type,
+            c.nullable
+        FROM schema_tables t
+        JOIN `{PROJECT_ID}.{METADATA_DATASET}.columns` c
+            ON c.table_full_name = t.full_name
+        ORDER BY t.table_name, t.full_name, c.position
+        """
 
-            # Generate table description
-            table_desc = self.generate_table_description(full_name)
+        dictionary = self.bq_client.query(
+            query, job_config=query_config(schema_name=_check_ident(schema_name))
+        ).to_dataframe(bqstorage_client=self.bqstorage_client)
 
-            # Get columns
-            columns_query = f"""
-            SELECT column_name, data_type, nullable
-            FROM `{PROJECT_ID}.{METADATA_DATASET}.columns`
-            WHERE table_full_name = '{full_name}'
-            ORDER BY position
-            """
+        # Only the per-table prompts need Python rows; the frame stays columnar
+        full_names, prompts = [], []
+        for full_name, columns in dictionary.groupby('full_name', sort=False):
+            full_names.append(full_name)
+            prompts.append(self._table_description_prompt(full_name, columns.to_dict('records')))
 
-            columns = self.bq_client.query(columns_query).to_dataframe()
+        # Generate all table descriptions concurrently; Gemini calls are network-bound
+        descriptions = asyncio.run(self._generate_descriptions_async(prompts))
 
-            for _, col_row in columns.iterrows():
-                dictionary_data.append({
-                    'table_name': table_row['table_name'],
-                    'table_description': table_desc,
-                    'column_name': col_row['column_name'],
-                    'data_type': col_row['data_type'],
-                    'nullable': col_row['nullable'],
-                    'full_table_name': full_name
-                })
+        dictionary['table_description'] = dictionary['full_name'].map(dict(zip(full_names, descriptions, strict=True)))
 
-        return pd.DataFrame(dictionary_data)
+        return dictionary.rename(columns={'full_name': 'full_table_name'})[
+            ['table_name', 'table_description', 'column_name', 'data_type', 'nullable', 'full_table_name']
+        ]
 
 
 # ============================================================================
@@ -748,64 +1203,89 @@ class DataQualityMonitorAgent:
     """
 
     def __init__(self):
-        self.bq_client = bigquery.Client(project=PROJECT_ID)
+        self.bq_client = bq_client  # Shared BigQuery client
         self.model = model  # Gemini 2.5 Flash via Vertex AI
+        self.report_model = quality_report_model
+
+    def _submit_schema_anomalies(self) -> Optional[bigquery.QueryJob]:
+        """Start the schema anomalies query; None if the ML dataset is missing"""
+
+        if not ml_dataset_available():
+            return None
+
+        query = f"""
+        SELECT
+            table_catalog,
+            table_schema,
+            table_count,
+            total_columns,
+            anomaly_level,
+            anomaly_score,
+            CENTROID_ID as cluster_id
+        FROM `{PROJECT_ID}.{ML_DATASET}.schema_anomalies`
+        WHERE anomaly_level IN ('HIGH', 'MEDIUM')
+        ORDER BY anomaly_score DESC
+        """
+
+        return self.bq_client.query(query)
+
+    @staticmethod
+    def _schema_anomalies_result(job: Optional[bigquery.QueryJob]) -> List[Dict]:
+        """Wait for a schema anomalies job and return its rows"""
+        return rows_to_dicts(job) if job is not None else []
 
     def get_schema_anomalies(self) -> List[Dict]:
         """Get list of schemas with anomalous characteristics"""
 
         try:
-            query = f"""
-            SELECT
-                table_catalog,
-                table_schema,
-                table_count,
-                total_columns,
-                anomaly_level,
-                anomaly_score,
-                CENTROID_ID as cluster_id
-            FROM `{PROJECT_ID}.{ML_DATASET}.schema_anomalies`
-            WHERE anomaly_level IN ('HIGH', 'MEDIUM')
-            ORDER BY anomaly_score DESC
-            """
-
-            results = self.bq_client.query(query).to_dataframe()
-            return results.to_dict('records')
+            return self._schema_anomalies_result(self._submit_schema_anomalies())
         except Exception:
             # Return empty list if ML dataset doesn't exist
             return []
 
-    def check_metadata_freshness(self) -> Dict:
-        """Check how fresh the synced metadata is"""
+    def _submit_metadata_freshness(self) -> bigquery.QueryJob:
+        """Start the metadata freshness query
+
+        The connector only re-upserts changed tables, so sync times and
+        counts come from sync_status, which gets one row per catalog every
+        sync and stays small.
+        """
 
         query = f"""
         SELECT
             MIN(_fivetran_synced) as oldest_sync,
             MAX(_fivetran_synced) as latest_sync,
             TIMESTAMP_DIFF(CURRENT_TIMESTAMP(), MAX(_fivetran_synced), MINUTE) as minutes_since_sync,
-            COUNT(DISTINCT catalog_name) as catalogs_synced,
-            COUNT(*) as tables_synced
-        FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
+            COUNT(*) as catalogs_synced,
+            SUM(table_count) as tables_synced
+        FROM `{PROJECT_ID}.{METADATA_DATASET}.sync_status`
         """
 
-        result = self.bq_client.query(query).to_dataframe().to_dict('records')[0]
+        return self.bq_client.query(query, job_config=query_config())
 
-        # Add freshness status
-        minutes = result['minutes_since_sync']
-        if minutes < 20:
-            result['freshness_status'] = 'FRESH'
-        elif minutes < 60:
-            result['freshness_status'] = 'ACCEPTABLE'
-        else:
-            result['freshness_status'] = 'STALE'
+    def _metadata_freshness_result(self, job: bigquery.QueryJob) -> Dict:
+        """Wait for a freshness job and add its freshness status"""
+        return add_freshness_status(first_row(job))
 
-        return result
+    def check_metadata_freshness(self) -> Dict:
+        """Check how fresh the synced metadata is"""
+        return self._metadata_freshness_result(self._submit_metadata_freshness())
 
-    def generate_quality_report(self) -> str:
-        """Generate data quality monitoring report"""
+    def get_quality_findings(self) -> Dict:
+        """Generate the data quality report as {'status', 'issues', 'actions'}"""
+
+        # Start both jobs before waiting on either so they run in parallel
+        try:
+            anomalies_job = self._submit_schema_anomalies()
+        except Exception:
+            anomalies_job = None
+        freshness_job = self._submit_metadata_freshness()
 
-        anomalies = self.get_schema_anomalies()
-        freshness = self.check_metadata_freshness()
+        try:
+            anomalies = self._schema_anomalies_result(anomalies_job)
+        except Exception:
+            anomalies = []
+        freshness = self._metadata_freshness_result(freshness_job)
 
         prompt = f"""
         Generate a data quality monitoring report:
@@ -818,16 +1298,26 @@ class DataQualityMonitorAgent:
 
         Schema Anomalies Detected: {len(anomalies)}
 
-        Create a concise report with:
-        1. Overall Status
-        2. Issues Found
-        3. Recommended Actions
+        Give the overall status in a few words, the issues found and the
+        recommended actions, each as a short sentence.
 
         Use a monitoring/operational tone.
         """
 
-        response = self.model.generate_content(prompt)
-        return response.text
+        return json.loads(self.report_model.generate(prompt))
+
+    def generate_quality_report(self) -> str:
+        """Generate data quality monitoring report"""
+
+        findings = self.get_quality_findings()
+        issues = "".join(f"- {issue}\n" for issue in findings['issues']) or "- None\n"
+        actions = "".join(f"- {action}\n" for action in findings['actions']) or "- None\n"
+
+        return (
+            f"Overall Status: {findings['status']}\n\n"
+            f"Issues Found:\n{issues}\n"
+            f"Recommended Actions:\n{actions}"
+        )
 
 
 # ============================================================================
@@ -13,26 +13,57 @@ Features:
 """
 
 import streamlit as st
+import numpy as np
 import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from google.cloud import bigquery
-from datetime import datetime, timedelta
+import pyarrow as pa
+from datetime import date, timedelta
+from concurrent.futures import ThreadPoolExecutor
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+import importlib.util
 import sys
 import os
 
+
+def lazy_import(name):
+    """Return a module that is only loaded on first attribute access"""
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+# Plotly takes about a second to import; defer it until a page draws a chart
+px = lazy_import("plotly.express")
+go = lazy_import("plotly.graph_objects")
+
 # Add parent directory to path for agent imports
 sys.path.append(os.path.dirname(__file__))
 
-try:
-    # Import AI agents (renamed file)
-    import importlib.util
+@st.cache_resource(show_spinner=False)
+def load_agents_module():
+    """Load the AI agents module once per process
+
+    Streamlit re-executes this script on every rerun; caching the module
+    keeps its Vertex AI setup, BigQuery clients and response caches alive
+    instead of rebuilding them each time.
+    """
     spec = importlib.util.spec_from_file_location(
         "vertex_ai_agents",
         os.path.join(os.path.dirname(__file__), "gemini_ai_agents.py")
     )
-    vertex_ai_agents = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(vertex_ai_agents)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+try:
+    # Import AI agents (renamed file)
+    vertex_ai_agents = load_agents_module()
 
     DataDiscoveryAgent = vertex_ai_agents.DataDiscoveryAgent
     ComplianceGuardianAgent = vertex_ai_agents.ComplianceGuardianAgent
@@ -51,6 +82,22 @@ PROJECT_ID = "YOUR_GCP_PROJECT_ID"
 METADATA_DATASET = "unity_catalog_metadata"
 ML_DATASET = "ml_models"
 
+FOOTER_HTML = """
+    <div style='text-align: center; color: #888; padding: 20px;'>
+        <p><strong>🌊 SyncFlow - Data Engineering Excellence</strong></p>
+        <p>Powered by Fivetran • Databricks Unity Catalog • Google Cloud</p>
+        <p style='font-size: 0.9em; margin-top: 10px;'>
+            🤖 Google Gemini 2.5 Flash
+        </p>
+    </div>
+    """
+
+# Schemas plotted in the documentation statistics chart, largest first
+DOC_STATS_CHART_SCHEMAS = 50
+
+# CSV exports with at least this many rows are written with pyarrow
+ARROW_CSV_MIN_ROWS = 10_000
+
 # Page config
 st.set_page_config(
     page_title="SyncFlow AI Governance",
@@ -59,12 +106,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Initialize BigQuery client
-@st.cache_resource
-def get_bq_client():
-    return bigquery.Client(project=PROJECT_ID)
-
-bq = get_bq_client()
+# Share the agents' BigQuery clients rather than opening a second connection
+# pool and auth session for the dashboard's own queries
+bq = vertex_ai_agents.bq_client
+bqstorage = vertex_ai_agents.bqstorage_client
 
 # Initialize AI agents
 @st.cache_resource
@@ -84,9 +129,31 @@ agents = get_agents()
 # ============================================================================
 
 @st.cache_data(ttl=300)  # Cache for 5 minutes
-def run_query(query: str) -> pd.DataFrame:
-    """Execute BigQuery query and return DataFrame"""
-    return bq.query(query).to_dataframe()
+def run_query(query: str, params: tuple = ()) -> pd.DataFrame:
+    """Execute BigQuery query and return DataFrame
+
+    User-supplied values go in params as (name, value) pairs referenced as
+    @name in the SQL, never into the query text, so identical queries hit
+    BigQuery's results cache.
+    """
+    job_config = vertex_ai_agents.query_config(**dict(params))
+    return bq.query(query, job_config=job_config).to_dataframe(bqstorage_client=bqstorage)
+
+
+def to_csv_bytes(df: pd.DataFrame) -> bytes:
+    """Encode a DataFrame as CSV for download
+
+    Large exports go through Arrow's C++ CSV writer, which is much faster
+    than pandas' for wide frames and writes bytes directly.
+    """
+    if len(df) < ARROW_CSV_MIN_ROWS:
+        return df.to_csv(index=False).encode()
+
+    import pyarrow.csv as pacsv
+
+    buf = pa.BufferOutputStream()
+    pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), buf)
+    return buf.getvalue().to_pybytes()
 
 
 def get_summary_metrics():
@@ -117,7 +184,25 @@ def get_summary_metrics():
 
 
 def get_pii_summary():
-    """Get PII detection summary"""
+    """Get PII detection summary, from the pre-aggregated view when it exists"""
+    order_by = """
+        ORDER BY
+            CASE risk_level
+                WHEN 'HIGH' THEN 1
+                WHEN 'MEDIUM' THEN 2
+                WHEN 'LOW' THEN 3
+                ELSE 4
+            END
+    """
+    try:
+        query = f"""
+        SELECT risk_level, table_count, total_pii_columns
+        FROM `{PROJECT_ID}.{ML_DATASET}.pii_summary_by_risk_level`
+        {order_by}
+        """
+        return run_query(query)
+    except Exception:
+        pass
     try:
         query = f"""
         SELECT
@@ -126,13 +211,7 @@ def get_pii_summary():
             SUM(pii_columns_count) as total_pii_columns
         FROM `{PROJECT_ID}.{ML_DATASET}.pii_summary_by_table`
         GROUP BY risk_level
-        ORDER BY
-            CASE risk_level
-                WHEN 'HIGH' THEN 1
-                WHEN 'MEDIUM' THEN 2
-                WHEN 'LOW' THEN 3
-                ELSE 4
-            END
+        {order_by}
         """
         return run_query(query)
     except Exception:
@@ -217,6 +296,158 @@ def get_table_clusters():
         return pd.DataFrame()
 
 
+@st.cache_data(ttl=1800, show_spinner=False)
+def get_documentation_stats():
+    """Get documentation coverage per schema; changes only when tables sync"""
+    query = f"""
+    SELECT
+        schema_name,
+        COUNT(*) as total_tables,
+        COUNTIF(comment IS NOT NULL) as documented_tables,
+        ROUND(100.0 * COUNTIF(comment IS NOT NULL) / COUNT(*), 1) as documentation_pct
+    FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
+    GROUP BY schema_name
+    ORDER BY documentation_pct DESC
+    """
+    return run_query(query)
+
+
+# Agent results are cached like query results; the leading underscore keeps
+# Streamlit from hashing the agent, so entries are keyed on the other args
+
+@st.cache_data(ttl=300)
+def cached_query(_agent, question: str) -> str:
+    """Answer a discovery question"""
+    return _agent.query(question)
+
+
+@st.cache_data(ttl=300)
+def cached_table_details(_agent, table_name: str) -> dict:
+    """Get table details from the discovery agent"""
+    return _agent.get_table_details(table_name)
+
+
+@st.cache_data(ttl=300)
+def cached_compliance_score(_agent) -> dict:
+    """Get the compliance score"""
+    return _agent.get_compliance_score()
+
+
+@st.cache_data(ttl=300)
+def cached_high_risk_tables(_agent) -> list:
+    """Get high-risk tables needing attention"""
+    return _agent.get_high_risk_tables()
+
+
+@st.cache_data(ttl=300)
+def cached_undocumented_tables(_agent, limit: int) -> list:
+    """Get up to limit tables without a description"""
+    return _agent.get_undocumented_tables(limit)
+
+
+@st.cache_data(ttl=300)
+def cached_overview_bundle(_agent) -> dict:
+    """Get metadata freshness and the compliance score from one query"""
+    return _agent.get_overview_bundle()
+
+
+@st.cache_data(ttl=1800, show_spinner=False)
+def cached_data_dictionary(_agent, schema_name: str) -> pd.DataFrame:
+    """Generate a schema's data dictionary"""
+    return _agent.generate_data_dictionary(schema_name)
+
+
+# Figures are cached on the values they plot, so reruns that don't change the
+# data skip rebuilding them; each chart also has a stable key, so the browser
+# updates the existing plot instead of mounting a new one
+
+@st.cache_resource(max_entries=128, show_spinner=False)
+def build_compliance_gauge(score: float):
+    """Gauge figure for the overall compliance score
+
+    The figure depends on nothing but the score, so it is memoized without
+    expiry; hits return the shared figure rather than unpickling a copy.
+    """
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=score,
+        title={'text': "Compliance Score"},
+        gauge={
+            'axis': {'range': [0, 100]},
+            'bar': {'color': "darkblue"},
+            'steps': [
+                {'range': [0, 50], 'color': "lightgray"},
+                {'range': [50, 75], 'color': "gray"},
+                {'range': [75, 100], 'color': "lightgreen"}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 90
+            }
+        }
+    ))
+
+    fig.update_layout(height=300)
+    return fig
+
+
+@st.cache_data(ttl=300)
+def build_forecast_fig(dates: tuple, predicted: tuple, lower: tuple, upper: tuple):
+    """Forecast line with its prediction interval shaded"""
+    fig = go.Figure()
+
+    # Predicted values
+    fig.add_trace(go.Scatter(
+        x=dates,
+        y=predicted,
+        mode='lines',
+        name='Predicted Tables',
+        line=dict(color='blue', width=3)
+    ))
+
+    # Confidence interval
+    fig.add_trace(go.Scatter(
+        x=dates,
+        y=upper,
+        mode='lines',
+        name='Upper Bound',
+        line=dict(width=0),
+        showlegend=False
+    ))
+
+    fig.add_trace(go.Scatter(
+        x=dates,
+        y=lower,
+        mode='lines',
+        name='Lower Bound',
+        line=dict(width=0),
+        fillcolor='rgba(0, 100, 255, 0.2)',
+        fill='tonexty',
+        showlegend=True
+    ))
+
+    fig.update_layout(
+        title='30-Day Table Growth Forecast',
+        xaxis_title='Date',
+        yaxis_title='Cumulative Tables',
+        hovermode='x unified',
+        height=500
+    )
+    return fig
+
+
+def render_metrics(container, metrics: list, n: int = 3):
+    """Lay out a row of metric cards, wrapping after n columns
+
+    Each entry is a tuple of st.metric's positional args: (label, value) or
+    (label, value, delta).
+    """
+    columns = container.columns(n)
+    for idx, metric in enumerate(metrics):
+        columns[idx % n].metric(*metric)
+
+
 # ============================================================================
 # Sidebar Navigation
 # ============================================================================
@@ -235,6 +466,12 @@ page = st.sidebar.radio(
     ]
 )
 
+if st.sidebar.button("🔄 Refresh data", help="Clear cached query and AI results"):
+    st.cache_data.clear()
+    # The agents outlive st.cache_data, so drop their own caches too
+    agents['compliance'].invalidate()
+    vertex_ai_agents.clear_response_caches()
+
 st.sidebar.markdown("---")
 st.sidebar.markdown("### About SyncFlow")
 st.sidebar.info(
@@ -256,6 +493,13 @@ st.sidebar.info(
     """
 )
 
+# Date stamp for CSV export file names, formatted once per session and day
+today = date.today()
+if st.session_state.get('export_date') != today:
+    st.session_state['export_date'] = today
+    st.session_state['export_stamp'] = today.strftime('%Y%m%d')
+export_stamp = st.session_state['export_stamp']
+
 
 # ============================================================================
 # Page: Overview Dashboard
@@ -266,9 +510,22 @@ if page == "📊 Overview":
     st.markdown("**Real-time insights from your Unity Catalog metadata**")
     st.markdown("*🤖 Powered by Google Gemini 2.5 Flash*")
 
+    # The page's BigQuery loads are independent, so run them concurrently;
+    # worker threads share this session's script context for st.cache_data
+    ctx = get_script_run_ctx()
+    tasks = {
+        'metrics': get_summary_metrics,
+        'bundle': lambda: cached_overview_bundle(agents['compliance']),
+        'pii_summary': get_pii_summary,
+        'clusters': get_table_clusters,
+    }
+    with ThreadPoolExecutor(max_workers=len(tasks), initializer=add_script_run_ctx, initargs=(None, ctx)) as ex:
+        futures = {name: ex.submit(fn) for name, fn in tasks.items()}
+        results = {name: f.result() for name, f in futures.items()}
+
     # Get metrics
-    metrics = get_summary_metrics()
-    freshness = agents['quality'].check_metadata_freshness()
+    metrics = results['metrics']
+    freshness = results['bundle']['freshness']
 
     # Freshness indicator
     col1, col2, col3 = st.columns([2, 1, 1])
@@ -290,21 +547,21 @@ if page == "📊 Overview":
     # Create metric cards
     metric_cols = st.columns(4)
 
-    for idx, row in metrics.iterrows():
-        col_idx = idx % 4
-        with metric_cols[col_idx]:
-            st.metric(
-                label=row['metric'],
-                value=f"{int(row['value']):,}",
-                help=f"{row['unit']}"
-            )
+    for idx, (metric, value, unit) in enumerate(
+        zip(metrics['metric'], metrics['value'], metrics['unit'], strict=True)
+    ):
+        metric_cols[idx % 4].metric(
+            label=metric,
+            value=f"{int(value):,}",
+            help=f"{unit}"
+        )
 
     st.markdown("---")
 
     # PII Risk Summary
     st.subheader("🔒 PII Risk Summary")
 
-    pii_summary = get_pii_summary()
+    pii_summary = results['pii_summary']
 
     col1, col2 = st.columns(2)
 
@@ -323,7 +580,7 @@ if page == "📊 Overview":
                 'NONE': '#cccccc'
             }
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="pii_risk_pie")
 
     with col2:
         # PII columns bar chart
@@ -340,7 +597,7 @@ if page == "📊 Overview":
                 'NONE': '#cccccc'
             }
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="pii_columns_bar")
 
     st.markdown("---")
 
@@ -348,7 +605,7 @@ if page == "📊 Overview":
     st.subheader("📊 Table Clusters")
     st.markdown("Tables grouped by ML clustering based on characteristics")
 
-    clusters = get_table_clusters()
+    clusters = results['clusters']
 
     if not clusters.empty:
         fig = px.bar(
@@ -359,7 +616,7 @@ if page == "📊 Overview":
             color='table_count',
             color_continuous_scale='Blues'
         )
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="table_clusters")
     else:
         st.info("📊 ML-based table clustering not yet available. Run ML models to enable this feature.")
 
@@ -367,7 +624,7 @@ if page == "📊 Overview":
     st.markdown("---")
     st.subheader("✅ Compliance Score")
 
-    compliance_score = agents['compliance'].get_compliance_score()
+    compliance_score = results['bundle']['compliance']
 
     col1, col2, col3 = st.columns(3)
 
@@ -436,18 +693,13 @@ elif False and page == "🔍 PII Discovery":
     # Display summary
     st.markdown("---")
 
-    col1, col2, col3 = st.columns(3)
-
-    with col1:
-        st.metric("Tables with PII", len(filtered_tables))
-
-    with col2:
-        high_risk_count = len(filtered_tables[filtered_tables['risk_level'] == 'HIGH'])
-        st.metric("High Risk Tables", high_risk_count)
-
-    with col3:
-        total_pii_cols = filtered_tables['pii_columns_count'].sum()
-        st.metric("Total PII Columns", int(total_pii_cols))
+    high_risk_count = len(filtered_tables[filtered_tables['risk_level'] == 'HIGH'])
+    total_pii_cols = filtered_tables['pii_columns_count'].sum()
+    render_metrics(st, [
+        ("Tables with PII", len(filtered_tables)),
+        ("High Risk Tables", high_risk_count),
+        ("Total PII Columns", int(total_pii_cols)),
+    ])
 
     st.markdown("---")
 
@@ -491,11 +743,11 @@ elif False and page == "🔍 PII Discovery":
     col1, col2 = st.columns([1, 3])
 
     with col1:
-        csv = display_df.to_csv(index=False)
+        csv = to_csv_bytes(display_df)
         st.download_button(
             label="📥 Download as CSV",
             data=csv,
-            file_name=f"pii_discovery_{datetime.now().strftime('%Y%m%d')}.csv",
+            file_name=f"pii_discovery_{export_stamp}.csv",
             mime="text/csv"
         )
 
@@ -519,7 +771,7 @@ elif page == "🔎 Table Search":
 
     if st.button("🔍 Search") and question:
         with st.spinner("Searching with AI..."):
-            answer = agents['discovery'].query(question)
+            answer = cached_query(agents['discovery'], question)
 
         st.markdown("---")
         st.subheader("Results")
@@ -534,23 +786,23 @@ elif page == "🔎 Table Search":
     with col1:
         if st.button("🔍 Find customer tables"):
             with st.spinner("Searching..."):
-                answer = agents['discovery'].query("Find tables with customer in the name")
+                answer = cached_query(agents['discovery'], "Find tables with customer in the name")
             st.markdown(answer)
 
         if st.button("🔒 Show PII tables"):
             with st.spinner("Searching..."):
-                answer = agents['discovery'].query("Show tables with PII")
+                answer = cached_query(agents['discovery'], "Show tables with PII")
             st.markdown(answer)
 
     with col2:
         if st.button("📊 List gold layer tables"):
             with st.spinner("Searching..."):
-                answer = agents['discovery'].query("Find tables in gold schema")
+                answer = cached_query(agents['discovery'], "Find tables in gold schema")
             st.markdown(answer)
 
         if st.button("🔗 Similar to dim_customer"):
             with st.spinner("Searching..."):
-                answer = agents['discovery'].query("Find tables similar to dim_customer")
+                answer = cached_query(agents['discovery'], "Find tables similar to dim_customer")
             st.markdown(answer)
 
     # Manual table lookup
@@ -565,7 +817,7 @@ elif page == "🔎 Table Search":
 
     if st.button("Get Details") and table_name:
         with st.spinner("Fetching details..."):
-            details = agents['discovery'].get_table_details(table_name)
+            details = cached_table_details(agents['discovery'], table_name)
 
         if 'error' in details:
             st.error(details['error'])
@@ -586,21 +838,17 @@ elif page == "🔎 Table Search":
                 st.markdown("---")
                 st.markdown("### 🔒 PII Detection")
 
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    risk_color = {
-                        'HIGH': '🔴',
-                        'MEDIUM': '🟡',
-                        'LOW': '🟢',
-                        'NONE': '⚪'
-                    }.get(pii['risk_level'], '⚪')
-                    st.metric("Risk Level", f"{risk_color} {pii['risk_level']}")
-
-                with col2:
-                    st.metric("PII Columns", pii['pii_columns_count'])
-
-                with col3:
-                    st.metric("Confidence", f"{pii['avg_pii_score_pct']:.1f}%")
+                risk_color = {
+                    'HIGH': '🔴',
+                    'MEDIUM': '🟡',
+                    'LOW': '🟢',
+                    'NONE': '⚪'
+                }.get(pii['risk_level'], '⚪')
+                render_metrics(st, [
+                    ("Risk Level", f"{risk_color} {pii['risk_level']}"),
+                    ("PII Columns", pii['pii_columns_count']),
+                    ("Confidence", f"{pii['avg_pii_score_pct']:.1f}%"),
+                ])
 
                 if pii['pii_columns']:
                     st.markdown(f"**PII Columns:** {pii['pii_columns']}")
@@ -626,75 +874,36 @@ elif False and page == "📈 Growth Forecast":
 
     if not forecast_df.empty:
         # Create forecast visualization
-        fig = go.Figure()
-
-        # Predicted values
-        fig.add_trace(go.Scatter(
-            x=forecast_df['date'],
-            y=forecast_df['predicted_tables'],
-            mode='lines',
-            name='Predicted Tables',
-            line=dict(color='blue', width=3)
-        ))
-
-        # Confidence interval
-        fig.add_trace(go.Scatter(
-            x=forecast_df['date'],
-            y=forecast_df['prediction_interval_upper_bound'],
-            mode='lines',
-            name='Upper Bound',
-            line=dict(width=0),
-            showlegend=False
-        ))
-
-        fig.add_trace(go.Scatter(
-            x=forecast_df['date'],
-            y=forecast_df['prediction_interval_lower_bound'],
-            mode='lines',
-            name='Lower Bound',
-            line=dict(width=0),
-            fillcolor='rgba(0, 100, 255, 0.2)',
-            fill='tonexty',
-            showlegend=True
-        ))
-
-        fig.update_layout(
-            title='30-Day Table Growth Forecast',
-            xaxis_title='Date',
-            yaxis_title='Cumulative Tables',
-            hovermode='x unified',
-            height=500
+        fig = build_forecast_fig(
+            tuple(forecast_df['date']),
+            tuple(forecast_df['predicted_tables']),
+            tuple(forecast_df['prediction_interval_lower_bound']),
+            tuple(forecast_df['prediction_interval_upper_bound']),
         )
 
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="growth_forecast")
 
         # Forecast summary
         st.markdown("---")
         st.subheader("Forecast Summary")
 
-        col1, col2, col3 = st.columns(3)
-
         current_tables = forecast_df.iloc[0]['predicted_tables']
         final_tables = forecast_df.iloc[-1]['predicted_tables']
         growth = final_tables - current_tables
 
-        with col1:
-            st.metric("Current Tables", f"{int(current_tables):,}")
-
-        with col2:
-            st.metric("Predicted (30 days)", f"{int(final_tables):,}")
-
-        with col3:
-            st.metric("Expected Growth", f"+{int(growth):,}", delta=f"+{(growth/current_tables*100):.1f}%")
+        render_metrics(st, [
+            ("Current Tables", f"{int(current_tables):,}"),
+            ("Predicted (30 days)", f"{int(final_tables):,}"),
+            ("Expected Growth", f"+{int(growth):,}", f"+{(growth/current_tables*100):.1f}%"),
+        ])
 
         # Show forecast table
         st.markdown("---")
         st.subheader("Detailed Forecast Data")
 
         display_forecast = forecast_df.copy()
-        display_forecast['predicted_tables'] = display_forecast['predicted_tables'].round(0).astype(int)
-        display_forecast['prediction_interval_lower_bound'] = display_forecast['prediction_interval_lower_bound'].round(0).astype(int)
-        display_forecast['prediction_interval_upper_bound'] = display_forecast['prediction_interval_upper_bound'].round(0).astype(int)
+        counts = ['predicted_tables', 'prediction_interval_lower_bound', 'prediction_interval_upper_bound']
+        display_forecast[counts] = display_forecast[counts].round(0).astype('int64')
 
         st.dataframe(display_forecast, use_container_width=True)
 
@@ -715,18 +924,13 @@ elif False and page == "⚠️ Anomalies":
 
     if not anomalies.empty:
         # Summary metrics
-        col1, col2, col3 = st.columns(3)
-
-        with col1:
-            st.metric("Total Anomalies", len(anomalies))
-
-        with col2:
-            high_count = len(anomalies[anomalies['anomaly_level'] == 'HIGH'])
-            st.metric("High Severity", high_count)
-
-        with col3:
-            avg_score = anomalies['anomaly_score'].mean()
-            st.metric("Avg Anomaly Score", f"{avg_score:.2f}")
+        high_count = len(anomalies[anomalies['anomaly_level'] == 'HIGH'])
+        avg_score = anomalies['anomaly_score'].mean()
+        render_metrics(st, [
+            ("Total Anomalies", len(anomalies)),
+            ("High Severity", high_count),
+            ("Avg Anomaly Score", f"{avg_score:.2f}"),
+        ])
 
         st.markdown("---")
 
@@ -745,8 +949,10 @@ elif False and page == "⚠️ Anomalies":
             },
             hover_data=['table_count']
         )
+        # Keep zoom and pan across reruns instead of resetting the view
+        fig.update_layout(uirevision="anomaly_scores")
 
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="anomaly_scores")
 
         # Anomaly table
         st.markdown("---")
@@ -766,11 +972,11 @@ elif False and page == "⚠️ Anomalies":
 
         # Export
         st.markdown("---")
-        csv = display_anomalies.to_csv(index=False)
+        csv = to_csv_bytes(display_anomalies)
         st.download_button(
             label="📥 Download Anomalies",
             data=csv,
-            file_name=f"schema_anomalies_{datetime.now().strftime('%Y%m%d')}.csv",
+            file_name=f"schema_anomalies_{export_stamp}.csv",
             mime="text/csv"
         )
 
@@ -786,10 +992,15 @@ elif page == "✅ Compliance":
     st.title("✅ Compliance Monitoring")
     st.markdown("Data governance compliance tracking and reporting")
 
-    # Get compliance data
-    compliance_score = agents['compliance'].get_compliance_score()
-    high_risk_tables = agents['compliance'].get_high_risk_tables()
-    undocumented = agents['compliance'].get_undocumented_tables(30)
+    # Get compliance data; the three lookups are independent BigQuery jobs
+    ctx = get_script_run_ctx()
+    with ThreadPoolExecutor(max_workers=3, initializer=add_script_run_ctx, initargs=(None, ctx)) as ex:
+        score_future = ex.submit(cached_compliance_score, agents['compliance'])
+        high_risk_future = ex.submit(cached_high_risk_tables, agents['compliance'])
+        undocumented_future = ex.submit(cached_undocumented_tables, agents['compliance'], 30)
+        compliance_score = score_future.result()
+        high_risk_tables = high_risk_future.result()
+        undocumented = undocumented_future.result()
 
     # Overall score
     st.subheader("Overall Compliance Score")
@@ -800,81 +1011,63 @@ elif page == "✅ Compliance":
 
     with col1:
         # Score gauge
-        fig = go.Figure(go.Indicator(
-            mode="gauge+number",
-            value=score,
-            title={'text': "Compliance Score"},
-            gauge={
-                'axis': {'range': [0, 100]},
-                'bar': {'color': "darkblue"},
-                'steps': [
-                    {'range': [0, 50], 'color': "lightgray"},
-                    {'range': [50, 75], 'color': "gray"},
-                    {'range': [75, 100], 'color': "lightgreen"}
-                ],
-                'threshold': {
-                    'line': {'color': "red", 'width': 4},
-                    'thickness': 0.75,
-                    'value': 90
-                }
-            }
-        ))
-
-        fig.update_layout(height=300)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(build_compliance_gauge(score), use_container_width=True, key="compliance_gauge")
 
     with col2:
         st.markdown("### Key Metrics")
 
-        metric_col1, metric_col2 = st.columns(2)
-
-        with metric_col1:
-            st.metric("Total Tables", compliance_score['total_tables'])
-            st.metric("Tables with PII", compliance_score['tables_with_pii'])
+        render_metrics(st, [
+            ("Total Tables", compliance_score['total_tables']),
+            ("Documentation Rate", f"{compliance_score['documentation_pct']:.1f}%"),
+            ("Tables with PII", compliance_score['tables_with_pii']),
+            ("High Risk Tables", compliance_score['high_risk_tables']),
+        ], n=2)
 
-        with metric_col2:
-            st.metric("Documentation Rate", f"{compliance_score['documentation_pct']:.1f}%")
-            st.metric("High Risk Tables", compliance_score['high_risk_tables'])
-
-    # High risk tables
+    # High risk and undocumented tables share one tabbed panel
     st.markdown("---")
-    st.subheader("🔴 High Risk Tables Requiring Attention")
+    tab_risk, tab_undoc = st.tabs(["🔴 High Risk", "📝 Undocumented"])
 
-    if high_risk_tables:
-        risk_df = pd.DataFrame(high_risk_tables)
-        display_risk = risk_df[[
-            'full_table_name',
-            'risk_level',
-            'pii_columns_count',
-            'undocumented'
-        ]].head(20)
+    with tab_risk:
+        st.subheader("🔴 High Risk Tables Requiring Attention")
 
-        display_risk.columns = ['Table', 'Risk', 'PII Columns', 'Undocumented']
-        display_risk['Undocumented'] = display_risk['Undocumented'].map({True: '❌', False: '✓'})
+        if high_risk_tables:
+            # Build only the 20 shown rows, column by column
+            # Arrow tables go to the browser as-is, without pandas conversion
+            shown = high_risk_tables[:20]
+            display_risk = pa.table({
+                'Table': [t['full_table_name'] for t in shown],
+                'Risk': [t['risk_level'] for t in shown],
+                'PII Columns': [t['pii_columns_count'] for t in shown],
+                'Undocumented': np.where([bool(t['undocumented']) for t in shown], '❌', '✓'),
+            })
 
-        st.dataframe(display_risk, use_container_width=True)
+            st.dataframe(display_risk, use_container_width=True)
 
-    # Undocumented tables
-    st.markdown("---")
-    st.subheader("📝 Undocumented Tables")
+    with tab_undoc:
+        st.subheader("📝 Undocumented Tables")
 
-    if undocumented:
-        undoc_df = pd.DataFrame(undocumented)
-        display_undoc = undoc_df[['full_name', 'table_type', 'created']].head(20)
-        display_undoc.columns = ['Table', 'Type', 'Created']
+        if undocumented:
+            shown = undocumented[:20]
+            display_undoc = pa.table({
+                'Table': [t['full_name'] for t in shown],
+                'Type': [t['table_type'] for t in shown],
+                'Created': [t['created'] for t in shown],
+            })
 
-        st.dataframe(display_undoc, use_container_width=True)
+            st.dataframe(display_undoc, use_container_width=True)
 
-        st.info(f"💡 {len(undocumented)} tables found without documentation. Use the Documentation page to generate AI descriptions.")
+            st.info(f"💡 {len(undocumented)} tables found without documentation. Use the Documentation page to generate AI descriptions.")
 
     # Generate compliance report
     st.markdown("---")
     if st.button("📄 Generate Full Compliance Report"):
-        with st.spinner("Generating AI-powered compliance report..."):
-            report = agents['compliance'].generate_compliance_report()
-
         st.markdown("### Compliance Report")
-        st.markdown(report)
+        report_placeholder = st.empty()
+        report = ""
+        with st.spinner("Generating AI-powered compliance report..."):
+            for chunk in agents['compliance'].stream_compliance_report():
+                report += chunk
+                report_placeholder.markdown(report)
 
 
 # ============================================================================
@@ -895,12 +1088,14 @@ elif page == "📝 Documentation":
     )
 
     if st.button("✨ Generate Description") and table_name:
-        with st.spinner("Generating AI description..."):
-            description = agents['documentation'].generate_table_description(table_name)
-
         st.markdown("---")
         st.subheader("Generated Description")
-        st.success(description)
+        description_placeholder = st.empty()
+        description = ""
+        with st.spinner("Generating AI description..."):
+            for chunk in agents['documentation'].stream_table_description(table_name):
+                description += chunk
+                description_placeholder.success(description)
 
         # Copy button
         st.code(description, language=None)
@@ -918,7 +1113,7 @@ elif page == "📝 Documentation":
     if st.button("📚 Generate Data Dictionary") and schema_name:
         with st.spinner("Generating data dictionary... This may take a few minutes for large schemas."):
             try:
-                dictionary_df = agents['documentation'].generate_data_dictionary(schema_name)
+                dictionary_df = cached_data_dictionary(agents['documentation'], schema_name)
 
                 st.markdown("---")
                 st.subheader(f"Data Dictionary: {schema_name}")
@@ -926,11 +1121,11 @@ elif page == "📝 Documentation":
                 st.dataframe(dictionary_df, use_container_width=True)
 
                 # Download option
-                csv = dictionary_df.to_csv(index=False)
+                csv = to_csv_bytes(dictionary_df)
                 st.download_button(
                     label="📥 Download Data Dictionary",
                     data=csv,
-                    file_name=f"data_dictionary_{schema_name}_{datetime.now().strftime('%Y%m%d')}.csv",
+                    file_name=f"data_dictionary_{schema_name}_{export_stamp}.csv",
                     mime="text/csv"
                 )
 
@@ -941,30 +1136,29 @@ elif page == "📝 Documentation":
     st.markdown("---")
     st.subheader("Documentation Statistics")
 
-    query = f"""
-    SELECT
-        schema_name,
-        COUNT(*) as total_tables,
-        SUM(CASE WHEN comment IS NOT NULL THEN 1 ELSE 0 END) as documented_tables,
-        ROUND(100.0 * SUM(CASE WHEN comment IS NOT NULL THEN 1 ELSE 0 END) / COUNT(*), 1) as documentation_pct
-    FROM `{PROJECT_ID}.{METADATA_DATASET}.tables`
-    GROUP BY schema_name
-    ORDER BY documentation_pct DESC
-    """
-
-    doc_stats = run_query(query)
+    doc_stats = get_documentation_stats()
 
     if not doc_stats.empty:
+        # Chart only the largest schemas; the table below keeps all of them
+        chart_stats = doc_stats.nlargest(DOC_STATS_CHART_SCHEMAS, 'total_tables').sort_values(
+            'documentation_pct', ascending=False
+        )
         fig = px.bar(
-            doc_stats,
+            chart_stats,
             x='schema_name',
             y='documentation_pct',
-            title='Documentation Rate by Schema',
+            title=(
+                'Documentation Rate by Schema'
+                if len(chart_stats) == len(doc_stats)
+                else f'Documentation Rate for the {len(chart_stats)} Largest Schemas'
+            ),
             color='documentation_pct',
             color_continuous_scale='Greens'
         )
+        # Keep zoom and pan across reruns instead of resetting the view
+        fig.update_layout(uirevision="documentation_by_schema")
 
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key="documentation_by_schema")
 
         st.dataframe(doc_stats, use_container_width=True)
 
@@ -974,15 +1168,4 @@ elif page == "📝 Documentation":
 # ============================================================================
 
 st.markdown("---")
-st.markdown(
-    """
-    <div style='text-align: center; color: #888; padding: 20px;'>
-        <p><strong>🌊 SyncFlow - Data Engineering Excellence</strong></p>
-        <p>Powered by Fivetran • Databricks Unity Catalog • Google Cloud</p>
-        <p style='font-size: 0.9em; margin-top: 10px;'>
-            🤖 Google Gemini 2.5 Flash
-        </p>
-    </div>
-    """,
-    unsafe_allow_html=True
-)
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
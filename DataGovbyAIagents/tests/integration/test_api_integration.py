@@ -25,9 +25,10 @@ from app.server import app
 class TestAPIIntegration(unittest.TestCase):
     """Integration tests for API endpoints."""
 
-    def setUp(self) -> None:
-        """Set up test client."""
-        self.client = TestClient(app)
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up one test client shared by every test."""
+        cls.client = TestClient(app)
 
     def test_health_check_integration(self) -> None:
         """Test health check returns valid response."""
@@ -18,10 +18,15 @@ Run with: locust -f tests/load_test/load_test.py --host=http://localhost:8080
 """
 
 import random
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
 from locust import HttpUser, between, task
 
+# Request bodies for the discover task, built once and shared by all users
+DISCOVER_QUERIES: Tuple[Dict[str, Any], ...] = tuple(
+    {"query": q} for q in ("customer", "sales", "product", "order")
+)
+
 
 class SyncFlowUser(HttpUser):
     """Simulated SyncFlow user for load testing."""
@@ -36,14 +41,7 @@ class SyncFlowUser(HttpUser):
     @task(2)
     def discover_data(self) -> None:
         """Task: Discover data."""
-        queries = [
-            {"query": "customer"},
-            {"query": "sales"},
-            {"query": "product"},
-            {"query": "order"},
-        ]
-        query = random.choice(queries)
-        self.client.post("/discover", json=query)
+        self.client.post("/discover", json=random.choice(DISCOVER_QUERIES))
 
     @task(1)
     def get_compliance(self) -> None:
@@ -0,0 +1,143 @@
+# Copyright 2025 SyncFlow Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Unit tests for the frontend API client."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from frontend.utils.api_client import APIClient
+
+
+class TestAPIClient(unittest.TestCase):
+    """Test APIClient class."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.client = APIClient(base_url="http://backend/")
+        self.client.session = MagicMock()
+        self.client.session.get.return_value.content = (
+            b'{"overall_compliance_score": 77.0}'
+        )
+
+    def test_get_requests_are_cached(self) -> None:
+        """Test repeated GETs are served from the client cache."""
+        first = self.client.get_compliance()
+        first["overall_compliance_score"] = 0
+        second = self.client.get_compliance()
+
+        self.client.session.get.assert_called_once_with(
+            "http://backend/compliance"
+        )
+        self.assertEqual(second["overall_compliance_score"], 77.0)
+        self.assertEqual(self.client.cache_stats, {"hits": 1, "misses": 1})
+
+    def test_table_details_keyed_by_table(self) -> None:
+        """Test table details are cached per table and invalidated by prefix."""
+        self.client.get_table_details("c.s.a")
+        self.client.get_table_details("c.s.b")
+        self.client.get_table_details("c.s.a")
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+        self.client.invalidate("table-details")
+        self.client.get_table_details("c.s.a")
+        self.assertEqual(self.client.session.get.call_count, 3)
+
+    def test_expired_entries_are_refetched(self) -> None:
+        """Test entries older than the endpoint TTL trigger a new request."""
+        with patch("frontend.utils.api_client.time.monotonic") as monotonic:
+            monotonic.return_value = 0.0
+            self.client.health_check()
+            monotonic.return_value = 10.0
+            self.client.health_check()
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+    def test_stale_entries_revalidate_in_background(self) -> None:
+        """Test stale dashboard data is served while it is refreshed."""
+        self.client._executor = MagicMock()
+        with patch("frontend.utils.api_client.time.monotonic") as monotonic:
+            monotonic.return_value = 0.0
+            self.client.get_compliance()
+            monotonic.return_value = 60.0
+            result = self.client.get_compliance()
+            self.client.get_compliance()
+
+        self.assertEqual(result["overall_compliance_score"], 77.0)
+        self.assertEqual(self.client.session.get.call_count, 1)
+        self.client._executor.submit.assert_called_once_with(
+            self.client._refresh, "/compliance", ("compliance",)
+        )
+
+        self.client._refresh("/compliance", ("compliance",))
+        self.assertEqual(self.client.session.get.call_count, 2)
+        self.assertFalse(self.client._refreshing)
+
+    def test_bulk(self) -> None:
+        """Test bulk calls are sent in one request and unpacked in order."""
+        self.client.session.post.return_value.status_code = 200
+        self.client.session.post.return_value.content = (
+            b'[{"status": 200, "body": {"status": "healthy"}},'
+            b' {"status": 500, "body": {"detail": "Agent not initialized"}}]'
+        )
+
+        result = self.client.bulk(
+            [("GET", "/health", None), ("POST", "/discover", {"query": "x"})]
+        )
+
+        self.assertEqual(
+            result,
+            [{"status": "healthy"}, {"error": "Agent not initialized"}],
+        )
+        specs = self.client.session.post.call_args.kwargs["json"]
+        self.assertEqual(specs[1]["body"], {"query": "x"})
+
+    def test_bulk_falls_back_without_endpoint(self) -> None:
+        """Test bulk issues individual requests when /bulk is missing."""
+        self.client.session.post.return_value.status_code = 404
+        self.client.session.request.return_value.content = b'{"ok": true}'
+        result = self.client.bulk(
+            [("GET", "/health", None), ("POST", "/discover", {"query": "x"})]
+        )
+
+        self.assertEqual(result, [{"ok": True}, {"ok": True}])
+        self.client.session.request.assert_any_call(
+            "POST", "http://backend/discover", json={"query": "x"}
+        )
+        self.assertEqual(self.client.session.request.call_count, 2)
+
+    def test_call_decodes_json(self) -> None:
+        """Test uncached calls decode the body or return an error dict."""
+        self.client.session.request.return_value.content = b'{"answer": "42"}'
+        self.assertEqual(self.client.query_ai("?"), {"answer": "42"})
+        self.client.session.request.assert_called_once_with(
+            "POST", "http://backend/query", json={"question": "?"}
+        )
+
+        self.client.session.request.side_effect = requests.ConnectionError("down")
+        self.assertEqual(self.client.query_ai("?"), {"error": "down"})
+
+    def test_errors_are_not_cached(self) -> None:
+        """Test failed requests return an error and are retried next call."""
+        self.client.session.get.side_effect = requests.ConnectionError("down")
+        self.assertIn("error", self.client.analyze_pii())
+
+        self.client.session.get.side_effect = None
+        self.assertNotIn("error", self.client.analyze_pii())
+        self.assertEqual(self.client.session.get.call_count, 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
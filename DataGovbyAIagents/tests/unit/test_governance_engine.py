@@ -25,7 +25,7 @@ class TestGovernanceEngine(unittest.TestCase):
 
     def setUp(self) -> None:
         """Set up test fixtures."""
-        with patch("app.governance_engine.bigquery.Client"):
+        with patch("app.governance_engine.get_bq_client"):
             self.engine = GovernanceEngine(
                 project_id="test-project",
                 metadata_dataset="metadata",
@@ -41,33 +41,85 @@ class TestGovernanceEngine(unittest.TestCase):
 
     def test_get_compliance_score(self) -> None:
         """Test compliance score calculation."""
-        # Mock BigQuery response
-        mock_df = MagicMock()
-        mock_df.to_dataframe.return_value.to_dict.return_value = [
-            {
-                "total_tables": 100,
-                "tables_with_pii": 20,
-                "high_risk_tables": 5,
-                "documented_tables": 80,
-                "documentation_pct": 80.0,
-                "high_risk_pct": 25.0,
-            }
+        # Mock BigQuery responses: one job per base table
+        tables_job = MagicMock()
+        tables_job.result.return_value = [
+            {"total_tables": 100, "documented_tables": 80, "documentation_pct": 80.0}
         ]
-        self.engine.bq_client.query.return_value = mock_df.to_dataframe.return_value
+        pii_job = MagicMock()
+        pii_job.result.return_value = [
+            {"tables_with_pii": 20, "high_risk_tables": 5, "high_risk_pct": 25.0}
+        ]
+        self.engine.bq_client.query.side_effect = [tables_job, pii_job]
+
+        result = self.engine.get_compliance_score()
+        self.assertEqual(self.engine.bq_client.query.call_count, 2)
+        self.assertEqual(result["total_tables"], 100)
+        self.assertEqual(result["high_risk_tables"], 5)
+        self.assertEqual(result["overall_compliance_score"], 77.0)
+
+    def test_get_compliance_score_without_ml_dataset(self) -> None:
+        """Test compliance score falls back to metadata-only metrics."""
+        self.engine.ml_dataset = None
+        tables_job = MagicMock()
+        tables_job.result.return_value = [
+            {"total_tables": 10, "documented_tables": 5, "documentation_pct": 50.0}
+        ]
+        self.engine.bq_client.query.return_value = tables_job
 
-        # This test shows the expected structure
         result = self.engine.get_compliance_score()
-        self.assertIn("overall_compliance_score", result)
-        self.assertTrue(0 <= result["overall_compliance_score"] <= 100)
+        self.assertEqual(self.engine.bq_client.query.call_count, 1)
+        self.assertEqual(result["tables_with_pii"], 0)
+        self.assertEqual(result["overall_compliance_score"], 80.0)
+
+    def test_get_compliance_score_from_materialized_views(self) -> None:
+        """Test compliance score reads pre-aggregated views when enabled."""
+        self.engine.use_materialized_views = True
+        tables_job = MagicMock()
+        tables_job.result.return_value = [
+            {"total_tables": 100, "documented_tables": 80, "documentation_pct": 80.0}
+        ]
+        pii_job = MagicMock()
+        pii_job.result.return_value = [
+            {"tables_with_pii": 20, "high_risk_tables": 5, "high_risk_pct": 25.0}
+        ]
+        self.engine.bq_client.query.side_effect = [tables_job, pii_job]
+
+        result = self.engine.get_compliance_score()
+        queries = [c.args[0] for c in self.engine.bq_client.query.call_args_list]
+        self.assertIn("metadata.compliance_metrics", queries[0])
+        self.assertIn("ml_models.pii_compliance_metrics", queries[1])
+        self.assertEqual(result["overall_compliance_score"], 77.0)
 
     def test_validate_table_exists(self) -> None:
         """Test table existence validation."""
+        self.engine.bq_client.query.return_value.result.return_value = [
+            {"table_exists": True}
+        ]
+
         # Valid format
         self.assertTrue(self.engine.validate_table_exists("catalog.schema.table"))
 
+        # Table names are bound as query parameters, not inlined
+        query = self.engine.bq_client.query.call_args.args[0]
+        self.assertNotIn("'table'", query)
+        job_config = self.engine.bq_client.query.call_args.kwargs["job_config"]
+        self.assertEqual(
+            [p.value for p in job_config.query_parameters],
+            ["catalog", "schema", "table"],
+        )
+
+        # Confirmed tables are served from cache
+        self.assertTrue(self.engine.validate_table_exists("catalog.schema.table"))
+        self.assertEqual(self.engine.bq_client.query.call_count, 1)
+
         # Invalid format
         self.assertFalse(self.engine.validate_table_exists("catalog.table"))
         self.assertFalse(self.engine.validate_table_exists("table"))
+        self.assertFalse(self.engine.validate_table_exists("a..b"))
+        self.assertFalse(self.engine.validate_table_exists(".a.b"))
+        self.assertFalse(self.engine.validate_table_exists("a.b."))
+        self.assertEqual(self.engine.bq_client.query.call_count, 1)
 
     def test_get_high_risk_tables(self) -> None:
         """Test getting high-risk tables."""
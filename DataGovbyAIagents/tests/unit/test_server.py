@@ -19,15 +19,17 @@ from unittest.mock import MagicMock, patch
 
 from fastapi.testclient import TestClient
 
-from app.server import app
+from app.server import MAX_DISCOVER_LIMIT, app
+from app.utils.typing import MAX_BULK_CALLS
 
 
 class TestServer(unittest.TestCase):
     """Test FastAPI server endpoints."""
 
-    def setUp(self) -> None:
-        """Set up test client."""
-        self.client = TestClient(app)
+    @classmethod
+    def setUpClass(cls) -> None:
+        """Set up one test client shared by every test."""
+        cls.client = TestClient(app)
 
     def test_root_redirect(self) -> None:
         """Test root redirect to docs."""
@@ -49,12 +51,70 @@ class TestServer(unittest.TestCase):
         # Should fail with 400 or 500 depending on error handling
         self.assertIn(response.status_code, [400, 500])
 
+    def test_stream_description_missing_table_name(self) -> None:
+        """Test streaming description endpoint with missing table name."""
+        response = self.client.post("/generate-description/stream", json={})
+        self.assertIn(response.status_code, [400, 500])
+
     def test_compliance_endpoint(self) -> None:
         """Test compliance endpoint."""
         response = self.client.get("/compliance")
         # Will fail if agent not initialized, which is expected in test
         self.assertIn(response.status_code, [200, 500])
 
+    def test_overview_endpoint(self) -> None:
+        """Test overview endpoint."""
+        response = self.client.get("/overview")
+        self.assertIn(response.status_code, [200, 500])
+
+    def test_pii_status_missing_table_names(self) -> None:
+        """Test bulk PII status endpoint with missing table names."""
+        response = self.client.post("/pii-status", json={})
+        self.assertIn(response.status_code, [400, 500])
+
+    def test_discover_rejects_out_of_range_limit(self) -> None:
+        """Test /discover returns 400 for a limit outside 1..MAX_DISCOVER_LIMIT."""
+        with patch("app.server.agent") as agent:
+            for limit in (0, -5, MAX_DISCOVER_LIMIT + 1):
+                response = self.client.post(
+                    "/discover", json={"query": "customer", "limit": limit}
+                )
+                self.assertEqual(response.status_code, 400)
+            agent.discover_data.assert_not_called()
+
+    def test_bulk_endpoint(self) -> None:
+        """Test bulk endpoint returns sub-responses in request order."""
+        response = self.client.post(
+            "/bulk",
+            json=[
+                {"method": "GET", "path": "/health"},
+                {"method": "GET", "path": "/compliance"},
+                {"method": "DELETE", "path": "/health"},
+            ],
+        )
+        self.assertEqual(response.status_code, 200)
+
+        data = response.json()
+        self.assertEqual(len(data), 3)
+        self.assertEqual(data[0]["status"], 200)
+        self.assertIn("service", data[0]["body"])
+        self.assertIn(data[1]["status"], [200, 500])
+        self.assertEqual(data[2]["status"], 404)
+
+    def test_bulk_rejects_malformed_items_individually(self) -> None:
+        """Test a malformed bulk item gets its own 422 instead of failing the batch."""
+        response = self.client.post(
+            "/bulk", json=[{"method": "GET", "path": "/health"}, "/health", {"method": "GET"}]
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([r["status"] for r in response.json()], [200, 422, 422])
+
+    def test_bulk_limits_batch_size(self) -> None:
+        """Test oversized bulk requests are rejected."""
+        calls = [{"method": "GET", "path": "/health"}] * (MAX_BULK_CALLS + 1)
+        response = self.client.post("/bulk", json=calls)
+        self.assertEqual(response.status_code, 422)
+
     def test_pii_analysis_endpoint(self) -> None:
         """Test PII analysis endpoint."""
         response = self.client.get("/pii-analysis")
@@ -65,6 +125,43 @@ class TestServer(unittest.TestCase):
         response = self.client.get("/metadata-health")
         self.assertIn(response.status_code, [200, 500])
 
+    def test_error_responses_are_not_cacheable(self) -> None:
+        """Test only successful governance responses get a Cache-Control header."""
+        with patch("app.server.agent") as agent:
+            agent.get_metadata_health.return_value = {"freshness_status": "FRESH"}
+            response = self.client.get("/metadata-health")
+            self.assertIn("max-age", response.headers.get("Cache-Control", ""))
+
+            agent.get_metadata_health.return_value = {"error": "backend error"}
+            response = self.client.get("/metadata-health")
+            self.assertNotIn("Cache-Control", response.headers)
+
+    def test_flush_cache_disabled_by_default(self) -> None:
+        """Test cache flush is refused when no admin token is configured."""
+        with patch("app.server.ADMIN_TOKEN", ""):
+            response = self.client.post(
+                "/admin/flush-cache", headers={"X-Admin-Token": ""}
+            )
+        self.assertEqual(response.status_code, 403)
+
+    def test_flush_cache_endpoint(self) -> None:
+        """Test cache flush requires the configured admin token."""
+        with (
+            patch("app.server.ADMIN_TOKEN", "secret"),
+            patch("app.server.agent") as agent,
+        ):
+            response = self.client.post(
+                "/admin/flush-cache", headers={"X-Admin-Token": "wrong"}
+            )
+            self.assertEqual(response.status_code, 401)
+            agent.clear_cache.assert_not_called()
+
+            response = self.client.post(
+                "/admin/flush-cache", headers={"X-Admin-Token": "secret"}
+            )
+            self.assertEqual(response.status_code, 200)
+            agent.clear_cache.assert_called_once()
+
 
 if __name__ == "__main__":
     unittest.main()
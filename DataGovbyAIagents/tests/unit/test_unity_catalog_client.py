@@ -0,0 +1,242 @@
+# Copyright 2025 SyncFlow Contributors
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+"""Unit tests for Unity Catalog client."""
+
+import unittest
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pyarrow as pa
+
+from app.unity_catalog_client import UnityCatalogClient
+
+
+def _arrow_rows(records: list) -> MagicMock:
+    """Build a result iterator whose Arrow conversion yields ``records``."""
+    rows = MagicMock()
+    rows.to_arrow.return_value.to_pylist.return_value = records
+    return rows
+
+
+class TestUnityCatalogClient(unittest.TestCase):
+    """Test UnityCatalogClient class."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        with patch("app.unity_catalog_client.get_bq_client"):
+            self.client = UnityCatalogClient(
+                project_id="test-project",
+                metadata_dataset="metadata",
+                ml_dataset="ml_models",
+            )
+        self.bq_client = self.client.bq_client
+        # Large catalog by default, so keyword searches go to BigQuery
+        self.bq_client.get_table.return_value.num_rows = 1_000_000
+        for target in (
+            "app.utils.bigquery.get_bqstorage_client",
+            "app.unity_catalog_client.get_bqstorage_client",
+        ):
+            patcher = patch(target)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_search_tables_by_schema_is_cached(self) -> None:
+        """Test repeated lookups are served from cache until invalidated."""
+        self.bq_client.query_and_wait.return_value = _arrow_rows(
+            [{"schema_name": "sales", "table_name": "orders"}]
+        )
+
+        first = self.client.search_tables_by_schema("sales")
+        second = self.client.search_tables_by_schema("sales")
+        self.assertEqual(first, second)
+        self.assertEqual(self.bq_client.query_and_wait.call_count, 1)
+
+        self.client.invalidate()
+        self.client.search_tables_by_schema("sales")
+        self.assertEqual(self.bq_client.query_and_wait.call_count, 2)
+
+    def test_failed_lookups_are_not_cached(self) -> None:
+        """Test a failed query is retried instead of served from cache."""
+        self.bq_client.query_and_wait.side_effect = [
+            RuntimeError("backend error"),
+            _arrow_rows([{"schema_name": "sales", "table_name": "orders"}]),
+        ]
+
+        self.assertEqual(self.client.search_tables_by_schema("sales"), [])
+        self.assertEqual(len(self.client.search_tables_by_schema("sales")), 1)
+        self.assertEqual(self.bq_client.query_and_wait.call_count, 2)
+
+    def test_failed_freshness_is_not_cached(self) -> None:
+        """Test an UNKNOWN freshness result is not kept for the TTL."""
+        self.bq_client.query_and_wait.side_effect = [
+            RuntimeError("backend error"),
+            iter([{"latest_sync": datetime.now(timezone.utc), "tables_synced": 1}]),
+        ]
+
+        result = self.client.get_metadata_freshness()
+        self.assertEqual(result["freshness_status"], "UNKNOWN")
+        self.assertIn("error", result)
+        self.assertEqual(
+            self.client.get_metadata_freshness()["freshness_status"], "FRESH"
+        )
+
+    def test_search_tables_by_keyword_binds_parameters(self) -> None:
+        """Test user input is bound as query parameters, not inlined."""
+        self.bq_client.query_and_wait.return_value = _arrow_rows([])
+
+        self.client.search_tables_by_keyword("Cust'omer", limit=5)
+        call = self.bq_client.query_and_wait.call_args
+        self.assertNotIn("cust'omer", call.args[0])
+        self.assertEqual(
+            {p.name: p.value for p in call.kwargs["job_config"].query_parameters},
+            {"pattern": "%cust'omer%", "limit": 5},
+        )
+
+    def test_search_tables_by_keyword_in_memory(self) -> None:
+        """Test small catalogs are searched in memory without SQL LIKE."""
+        self.bq_client.get_table.return_value.num_rows = 3
+        self.bq_client.query_and_wait.return_value.to_arrow.return_value = pa.table(
+            {
+                "table_name": ["dim_customer", "orders", "events"],
+                "comment": [None, "Customer orders", "Click stream"],
+            }
+        )
+
+        result = self.client.search_tables_by_keyword("CUSTOMER", limit=10)
+        self.assertEqual(
+            [row["table_name"] for row in result], ["dim_customer", "orders"]
+        )
+        self.assertNotIn("_search_text", result[0])
+
+        # The snapshot is reused for later keywords
+        self.client.search_tables_by_keyword("events")
+        self.assertEqual(self.bq_client.query_and_wait.call_count, 1)
+
+    def test_search_tables_by_keyword_uses_search_index(self) -> None:
+        """Test keyword lookups use SEARCH() when the index is enabled."""
+        self.client.use_search_index = True
+        self.bq_client.query_and_wait.return_value = _arrow_rows([])
+
+        self.client.search_tables_by_keyword("customer")
+        call = self.bq_client.query_and_wait.call_args
+        self.assertIn("SEARCH(table_name, @keyword)", call.args[0])
+        self.assertNotIn("LIKE", call.args[0])
+        self.assertEqual(
+            call.kwargs["job_config"].query_parameters[0].value, "`customer`"
+        )
+
+    def test_get_pii_status_reads_clustered_view(self) -> None:
+        """Test PII status reads the clustered view when views are enabled."""
+        self.client.use_materialized_views = True
+        self.bq_client.query_and_wait.return_value = _arrow_rows([])
+
+        self.client.get_pii_status("sales")
+        query = self.bq_client.query_and_wait.call_args.args[0]
+        self.assertIn("ml_models.pii_summary_by_risk", query)
+
+    def test_get_pii_for_tables_single_query(self) -> None:
+        """Test PII status for many tables is fetched in one query."""
+        self.bq_client.query_and_wait.return_value = _arrow_rows(
+            [{"full_table_name": "main.sales.orders", "risk_level": "LOW"}]
+        )
+
+        result = self.client.get_pii_for_tables(
+            ["main.sales.orders", "main.sales.customers"]
+        )
+        self.assertEqual(self.bq_client.query_and_wait.call_count, 1)
+        self.assertEqual(result["main.sales.orders"]["risk_level"], "LOW")
+        param = self.bq_client.query_and_wait.call_args.kwargs[
+            "job_config"
+        ].query_parameters[0]
+        self.assertEqual(param.values, ["main.sales.orders", "main.sales.customers"])
+
+    def test_get_table_details_submits_jobs_concurrently(self) -> None:
+        """Test table, column and PII jobs are all submitted up front."""
+        table_job, columns_job, pii_job = MagicMock(), MagicMock(), MagicMock()
+        table_job.result.return_value = [{"table_name": "orders"}]
+        columns_job.result.return_value = _arrow_rows([{"column_name": "id"}])
+        pii_job.result.return_value = [{"risk_level": "LOW"}]
+        self.bq_client.query.side_effect = [table_job, columns_job, pii_job]
+
+        result = self.client.get_table_details("main.sales.orders")
+        self.assertEqual(self.bq_client.query.call_count, 3)
+        self.assertEqual(result["column_count"], 1)
+        self.assertEqual(result["pii_info"], {"risk_level": "LOW"})
+
+    def test_get_table_details_not_found_cancels_jobs(self) -> None:
+        """Test pending lookups are cancelled when the table is missing."""
+        table_job, columns_job, pii_job = MagicMock(), MagicMock(), MagicMock()
+        table_job.result.return_value = []
+        self.bq_client.query.side_effect = [table_job, columns_job, pii_job]
+
+        result = self.client.get_table_details("main.sales.missing")
+        self.assertIn("error", result)
+        columns_job.cancel.assert_called_once()
+        pii_job.cancel.assert_called_once()
+
+    def test_get_overview_bundle(self) -> None:
+        """Test overview metrics come from a single query."""
+        self.bq_client.query_and_wait.return_value = iter(
+            [
+                {
+                    "metadata": {
+                        "latest_sync": datetime.now(timezone.utc)
+                        - timedelta(minutes=90),
+                        "tables_synced": 10,
+                        "documented_tables": 8,
+                    },
+                    "pii": {
+                        "tables_with_pii": 4,
+                        "high_risk_tables": 1,
+                        "risk_tables_count": 3,
+                        "high_risk_pct": 25.0,
+                        "risk_tables": None,
+                    },
+                }
+            ]
+        )
+
+        result = self.client.get_overview_bundle()
+        self.assertEqual(self.bq_client.query_and_wait.call_count, 1)
+        query = self.bq_client.query_and_wait.call_args.args[0]
+        self.assertIn("metadata.sync_status", query)
+        self.assertEqual(result["freshness"]["freshness_status"], "STALE")
+        self.assertEqual(result["documentation"]["documentation_pct"], 80.0)
+        self.assertEqual(result["pii"]["high_risk_tables"], 1)
+        self.assertEqual(result["pii"]["risk_tables_count"], 3)
+        self.assertEqual(result["pii"]["risk_tables"], [])
+
+    def test_get_metadata_freshness(self) -> None:
+        """Test freshness status is derived from minutes since sync."""
+        self.bq_client.query_and_wait.return_value = iter(
+            [
+                {
+                    "latest_sync": datetime.now(timezone.utc) - timedelta(minutes=5),
+                    "tables_synced": 10,
+                }
+            ]
+        )
+
+        result = self.client.get_metadata_freshness()
+        query = self.bq_client.query_and_wait.call_args.args[0]
+        self.assertIn("metadata.sync_status", query)
+        self.assertEqual(result["freshness_status"], "FRESH")
+        self.assertEqual(result["minutes_since_sync"], 5)
+        self.assertEqual(result["tables_synced"], 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
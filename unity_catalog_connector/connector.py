@@ -4,19 +4,81 @@
 # See the Technical Reference documentation (https://fivetran.com/docs/connectors/connector-sdk/technical-reference#update)
 # and the Best Practices documentation (https://fivetran.com/docs/connectors/connector-sdk/best-practices) for details
 
+import functools
 import json
+import queue
+import threading
+import time
 import requests
-from datetime import datetime
-from typing import Dict, List, Optional
+from collections import OrderedDict, defaultdict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from itertools import repeat
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
 
 # Import required classes from fivetran_connector_sdk
 from fivetran_connector_sdk import Connector
 from fivetran_connector_sdk import Logging as log
 from fivetran_connector_sdk import Operations as op
 
+try:
+    # orjson parses API responses several times faster when it is installed
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 # Constants
 TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+EPOCH_STR = "1970-01-01T00:00:00Z"
 API_VERSION = "2.1"
+# Page size for list endpoints; 0 asks for the server's largest page
+MAX_RESULTS = 0
+# Table metadata requests in flight at once; requests releases the GIL while
+# waiting on the socket, so threads overlap the API round trips
+MAX_WORKERS = 16
+# Catalogs traversed at once; their table details share the MAX_WORKERS pool
+CATALOG_WORKERS = 8
+# Rows buffered per destination table before they are handed to op.upsert
+UPSERT_BATCH_SIZE = 500
+# Table details kept in process, keyed by the table's updated_at version
+TABLE_DETAILS_CACHE_SIZE = 4096
+
+# Row templates for the high-volume destination tables; copying a template
+# of the right size and filling it is cheaper than building a dict literal
+TABLE_ROW = dict.fromkeys(
+    (
+        "full_name",
+        "catalog_name",
+        "schema_name",
+        "table_name",
+        "table_type",
+        "data_source_format",
+        "storage_location",
+        "comment",
+        "owner",
+        "created_at",
+        "created_by",
+        "updated_at",
+        "updated_by",
+    )
+)
+COLUMN_ROW = dict.fromkeys(
+    (
+        "table_full_name",
+        "column_name",
+        "position",
+        "data_type",
+        "nullable",
+        "comment",
+        "partition_index",
+    )
+)
+# Error codes returned when the workspace does not serve the volumes API
+VOLUMES_UNSUPPORTED_ERRORS = frozenset(
+    ("ENDPOINT_NOT_FOUND", "FEATURE_DISABLED", "NOT_IMPLEMENTED")
+)
 
 
 class UnityCatalogClient:
@@ -38,6 +100,22 @@ class UnityCatalogClient:
             "Authorization": f"Bearer {self.access_token}",
             "Content-Type": "application/json",
         }
+        # Cleared the first time the workspace reports volumes as unsupported
+        self._volumes_supported = True
+        # One keep-alive session for the whole sync, so requests reuse pooled
+        # TLS connections; the pool is sized for the catalog and metadata workers
+        self._session = requests.Session()
+        self._session.headers.update(self.headers)
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=MAX_WORKERS + CATALOG_WORKERS,
+                pool_maxsize=MAX_WORKERS + CATALOG_WORKERS,
+                max_retries=Retry(
+                    total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504]
+                ),
+            ),
+        )
 
     def _make_request(
         self, endpoint: str, method: str = "GET", params: Optional[Dict] = None
@@ -53,34 +131,72 @@ class UnityCatalogClient:
         """
         url = f"{self.base_url}/{endpoint}"
         try:
-            response = requests.request(
-                method=method, url=url, headers=self.headers, params=params, timeout=30
+            response = self._session.request(
+                method=method, url=url, params=params, timeout=30
             )
             response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
+            return json_loads(response.content)
+        except (requests.exceptions.RequestException, ValueError) as e:
             log.warning(f"API request failed for {endpoint}: {str(e)}")
             raise
 
+    def _pages(
+        self, endpoint: str, key: str, params: Optional[Dict] = None
+    ) -> Iterator[List[Dict]]:
+        """
+        Yield each page of a paginated list endpoint
+        Args:
+            endpoint: API endpoint
+            key: Response field holding the page's items
+            params: Query parameters
+        Returns:
+            One list of items per page; the next page is only requested
+            once the caller is done with the current one
+        """
+        params = dict(params or {}, max_results=MAX_RESULTS)
+        while True:
+            response = self._make_request(endpoint, params=params)
+            yield response.get(key, [])
+            next_page_token = response.get("next_page_token")
+            if not next_page_token:
+                return
+            params["page_token"] = next_page_token
+
+    def _paginate(
+        self, endpoint: str, key: str, params: Optional[Dict] = None
+    ) -> Iterator[Dict]:
+        """Yield every item of a paginated list endpoint"""
+        for page in self._pages(endpoint, key, params):
+            yield from page
+
     def list_catalogs(self) -> List[Dict]:
         """List all catalogs in Unity Catalog"""
         log.info("Fetching catalogs from Unity Catalog")
-        response = self._make_request("catalogs")
-        return response.get("catalogs", [])
+        return list(self._paginate("catalogs", "catalogs"))
 
     def list_schemas(self, catalog_name: str) -> List[Dict]:
         """List all schemas in a catalog"""
         log.fine(f"Fetching schemas for catalog: {catalog_name}")
-        response = self._make_request("schemas", params={"catalog_name": catalog_name})
-        return response.get("schemas", [])
+        return list(self._paginate("schemas", "schemas", {"catalog_name": catalog_name}))
 
     def list_tables(self, catalog_name: str, schema_name: str) -> List[Dict]:
         """List all tables in a schema"""
         log.fine(f"Fetching tables for {catalog_name}.{schema_name}")
-        response = self._make_request(
-            "tables", params={"catalog_name": catalog_name, "schema_name": schema_name}
+        return list(
+            self._paginate(
+                "tables", "tables", {"catalog_name": catalog_name, "schema_name": schema_name}
+            )
+        )
+
+    def list_table_pages(self, catalog_name: str, schema_name: str) -> Iterator[List[Dict]]:
+        """List the tables in a schema one page at a time"""
+        log.fine(f"Fetching tables for {catalog_name}.{schema_name}")
+        # Table properties are not synced, so leave them out of the listing
+        return self._pages(
+            "tables",
+            "tables",
+            {"catalog_name": catalog_name, "schema_name": schema_name, "omit_properties": "true"},
         )
-        return response.get("tables", [])
 
     def get_table_metadata(self, full_table_name: str) -> Dict:
         """Get detailed metadata for a specific table"""
@@ -89,16 +205,144 @@ class UnityCatalogClient:
 
     def list_volumes(self, catalog_name: str, schema_name: str) -> List[Dict]:
         """List all volumes in a schema"""
+        if not self._volumes_supported:
+            return []
         log.fine(f"Fetching volumes for {catalog_name}.{schema_name}")
         try:
-            response = self._make_request(
-                "volumes", params={"catalog_name": catalog_name, "schema_name": schema_name}
+            return list(
+                self._paginate(
+                    "volumes",
+                    "volumes",
+                    {"catalog_name": catalog_name, "schema_name": schema_name},
+                )
             )
-            return response.get("volumes", [])
-        except Exception:
-            # Volumes might not be available in all Unity Catalog installations
+        except requests.exceptions.HTTPError as e:
+            # Volumes might not be available in all Unity Catalog installations;
+            # once the workspace says so, skip the call for every other schema.
+            # Any other failure is raised so the caller can retry the schema.
+            if not self._volumes_unsupported(e.response):
+                raise
+            self._volumes_supported = False
+            log.info("Volumes are not supported by this workspace, skipping them")
             return []
 
+    @staticmethod
+    def _volumes_unsupported(response: Optional[requests.Response]) -> bool:
+        """Whether an error response means the volumes API is unavailable"""
+        if response is None:
+            return False
+        if response.status_code == 501:
+            return True
+        try:
+            error_code = json_loads(response.content).get("error_code")
+        except (ValueError, AttributeError):
+            return False
+        return error_code in VOLUMES_UNSUPPORTED_ERRORS
+
+
+class UpsertBuffer:
+    """
+    Buffer rows per destination table and upsert them in batches
+    """
+
+    def __init__(self, size: int = UPSERT_BATCH_SIZE):
+        """
+        Initialize upsert buffer
+        Args:
+            size: Rows held per table before they are flushed
+        """
+        self.size = size
+        self.rows = defaultdict(list)
+
+    def add(self, table: str, data: Dict):
+        """Queue a row, flushing its table once the batch is full"""
+        rows = self.rows[table]
+        rows.append(data)
+        if len(rows) >= self.size:
+            self._flush_table(table)
+
+    def flush(self):
+        """Upsert every buffered row; call before each checkpoint"""
+        for table in list(self.rows):
+            self._flush_table(table)
+
+    def _flush_table(self, table: str):
+        upsert = op.upsert
+        for data in self.rows.pop(table):
+            upsert(table=table, data=data)
+
+
+class TableDetailsCache:
+    """
+    Thread-safe LRU cache of table details shared by the metadata workers
+    """
+
+    def __init__(self, size: int = TABLE_DETAILS_CACHE_SIZE):
+        """
+        Initialize table details cache
+        Args:
+            size: Maximum number of tables kept
+        """
+        self.size = size
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    def get(self, key: Tuple) -> Optional[Dict]:
+        """Return cached details, or None on a miss"""
+        with self.lock:
+            details = self.entries.get(key)
+            if details is not None:
+                self.entries.move_to_end(key)
+            return details
+
+    def put(self, key: Tuple, details: Dict):
+        """Store details, evicting the least recently used table when full"""
+        with self.lock:
+            self.entries[key] = details
+            self.entries.move_to_end(key)
+            if len(self.entries) > self.size:
+                self.entries.popitem(last=False)
+
+
+# Lives for the process, so retries and repeated syncs in one process reuse it
+table_details_cache = TableDetailsCache()
+
+
+def fetch_table_details(
+    client: UnityCatalogClient, full_table_name: str, table: Dict
+) -> Tuple[Optional[Dict], Optional[Exception]]:
+    """
+    Fetch metadata for one table on a worker thread
+    Args:
+        client: Unity Catalog client
+        full_table_name: catalog.schema.table name
+        table: The table as listed; listings normally include the full
+            details, so the per-table request is only made when columns
+            are missing
+    Returns:
+        (table_details, None) on success, (None, error) on failure
+    """
+    if "columns" in table:
+        return table, None
+
+    # Altering a table changes its updated_at, so cached details for an
+    # older version are never used
+    version = table.get("updated_at")
+    key = (client.base_url, full_table_name, version)
+    if version:
+        table_details = table_details_cache.get(key)
+        if table_details is not None:
+            return table_details, None
+
+    try:
+        table_details = client.get_table_metadata(full_table_name)
+    except Exception as e:
+        return None, e
+
+    if version:
+        table_details_cache.put(key, table_details)
+    return table_details, None
+
 
 def dt2str(incoming: datetime) -> str:
     """Convert datetime to ISO format string"""
@@ -107,6 +351,39 @@ def dt2str(incoming: datetime) -> str:
     return incoming.strftime(TIMESTAMP_FORMAT)
 
 
+@functools.lru_cache(maxsize=100_000)
+def ms2str(incoming: Optional[int]) -> str:
+    """Convert epoch milliseconds to ISO format string in UTC; missing stamps map to the epoch"""
+    if not incoming:
+        return EPOCH_STR
+    return time.strftime(TIMESTAMP_FORMAT, time.gmtime(incoming // 1000))
+
+
+def str2ms(incoming: str) -> int:
+    """Convert ISO format string to epoch milliseconds"""
+    parsed = datetime.strptime(incoming, TIMESTAMP_FORMAT).replace(tzinfo=timezone.utc)
+    return int(parsed.timestamp() * 1000)
+
+
+def is_unchanged(obj: Dict, since_ms: Optional[int]) -> bool:
+    """
+    Check whether a Unity Catalog object was last modified before a cursor
+    Args:
+        obj: Catalog, schema, table or volume as returned by the API
+        since_ms: Epoch milliseconds of the last sync, or None for a full sync
+    Returns:
+        True if the object can be skipped
+    """
+    if since_ms is None:
+        return False
+    return (obj.get("updated_at") or obj.get("created_at") or 0) <= since_ms
+
+
+def columns_as_json(configuration: dict) -> bool:
+    """Whether columns are synced as one JSON row per table instead of one row each"""
+    return configuration.get("columns_as_json", "false").lower() == "true"
+
+
 def schema(configuration: dict):
     """
     Define the schema function which lets you configure the schema your connector delivers.
@@ -115,7 +392,7 @@ def schema(configuration: dict):
     Args:
         configuration: a dictionary that holds the configuration settings for the connector.
     """
-    return [
+    tables = [
         {
             "table": "catalogs",
             "primary_key": ["catalog_name"],
@@ -196,7 +473,209 @@ def schema(configuration: dict):
                 "updated_by": "STRING",
             },
         },
+        {
+            "table": "sync_status",
+            "primary_key": ["catalog_name"],
+            "columns": {
+                "catalog_name": "STRING",
+                "synced_at": "UTC_DATETIME",
+                "table_count": "INT",
+                "complete": "BOOLEAN",
+            },
+        },
     ]
+    if columns_as_json(configuration):
+        tables.append(
+            {
+                "table": "table_columns",
+                "primary_key": ["table_full_name"],
+                "columns": {
+                    "table_full_name": "STRING",
+                    "columns": "JSON",
+                },
+            }
+        )
+    return tables
+
+
+def fetch_catalog(
+    client: UnityCatalogClient,
+    catalog: Dict,
+    since_ms: Optional[int],
+    executor: ThreadPoolExecutor,
+    emit: Callable[[str, Dict], None],
+    schema_done: Callable[[str, int, int], None],
+    resume_after: Optional[str] = None,
+    column_json: bool = False,
+):
+    """
+    Fetch one catalog's changed objects on a catalog worker thread
+    Args:
+        client: Unity Catalog client
+        catalog: Catalog as returned by list_catalogs
+        since_ms: Epoch milliseconds of the catalog's last sync, or None for a full sync
+        executor: Pool that fetches table details
+        emit: Called with (table, data) for every row; rows are upserted by the caller
+        schema_done: Called with each schema's name, table count and number of
+            tables and volumes that failed to sync, once all its rows are emitted
+        resume_after: Last schema finished by an interrupted sync; schemas up to
+            and including it are skipped
+        column_json: Emit each table's columns as one table_columns row
+            holding a JSON array, instead of one columns row per column
+    """
+    catalog_name = catalog.get("name")
+
+    # Sync catalog metadata; unchanged catalogs may still hold changed schemas
+    if not is_unchanged(catalog, since_ms):
+        emit(
+            table="catalogs",
+            data={
+                "catalog_name": catalog_name,
+                "catalog_type": catalog.get("catalog_type", "MANAGED_CATALOG"),
+                "comment": catalog.get("comment"),
+                "owner": catalog.get("owner"),
+                "created_at": ms2str(catalog.get("created_at")),
+                "created_by": catalog.get("created_by"),
+                "updated_at": ms2str(catalog.get("updated_at")),
+                "updated_by": catalog.get("updated_by"),
+                "metastore_id": catalog.get("metastore_id"),
+            },
+        )
+
+    # Fetch schemas for this catalog, in name order so a sync can resume
+    schemas = sorted(
+        client.list_schemas(catalog_name), key=lambda schema: schema.get("name") or ""
+    )
+
+    for schema in schemas:
+        schema_name = schema.get("name")
+        full_schema_name = f"{catalog_name}.{schema_name}"
+
+        if resume_after is not None and schema_name <= resume_after:
+            continue
+
+        # Sync schema metadata; unchanged schemas may still hold changed tables
+        if not is_unchanged(schema, since_ms):
+            emit(
+                table="schemas",
+                data={
+                    "full_name": full_schema_name,
+                    "catalog_name": catalog_name,
+                    "schema_name": schema_name,
+                    "comment": schema.get("comment"),
+                    "owner": schema.get("owner"),
+                    "created_at": ms2str(schema.get("created_at")),
+                    "created_by": schema.get("created_by"),
+                    "updated_at": ms2str(schema.get("updated_at")),
+                    "updated_by": schema.get("updated_by"),
+                },
+            )
+
+        # Volumes are listed alongside the tables rather than after them
+        volumes_future = executor.submit(client.list_volumes, catalog_name, schema_name)
+        table_count = 0
+        failed = 0
+
+        # Fetch tables for this schema a page at a time; listings carry every
+        # column, so only one page is held. Only changed tables need details.
+        for page in client.list_table_pages(catalog_name, schema_name):
+            table_count += len(page)
+            tables = [table for table in page if not is_unchanged(table, since_ms)]
+            full_table_names = [
+                f"{catalog_name}.{schema_name}.{table.get('name')}" for table in tables
+            ]
+
+            # Get detailed table metadata concurrently, in list order
+            results = executor.map(fetch_table_details, repeat(client), full_table_names, tables)
+
+            for table, full_table_name, (table_details, error) in zip(
+                tables, full_table_names, results
+            ):
+                table_name = table.get("name")
+
+                try:
+                    if error:
+                        raise error
+
+                    # Sync table metadata
+                    table_get = table_details.get
+                    row = TABLE_ROW.copy()
+                    row["full_name"] = full_table_name
+                    row["catalog_name"] = catalog_name
+                    row["schema_name"] = schema_name
+                    row["table_name"] = table_name
+                    row["table_type"] = table_get("table_type")
+                    row["data_source_format"] = table_get("data_source_format")
+                    row["storage_location"] = table_get("storage_location")
+                    row["comment"] = table_get("comment")
+                    row["owner"] = table_get("owner")
+                    row["created_at"] = ms2str(table_get("created_at"))
+                    row["created_by"] = table_get("created_by")
+                    row["updated_at"] = ms2str(table_get("updated_at"))
+                    row["updated_by"] = table_get("updated_by")
+                    emit("tables", row)
+
+                    # Sync column metadata; bound methods keep attribute
+                    # lookups out of the per-column work
+                    new_column_row = COLUMN_ROW.copy
+                    column_rows = []
+                    for idx, column in enumerate(table_get("columns", [])):
+                        column_get = column.get
+                        row = new_column_row()
+                        row["table_full_name"] = full_table_name
+                        row["column_name"] = column_get("name")
+                        row["position"] = column_get("position", idx)
+                        row["data_type"] = column_get("type_text") or column_get("type_name")
+                        row["nullable"] = column_get("nullable", True)
+                        row["comment"] = column_get("comment")
+                        row["partition_index"] = column_get("partition_index")
+                        if column_json:
+                            column_rows.append(row)
+                        else:
+                            emit("columns", row)
+
+                    if column_json:
+                        emit(
+                            "table_columns",
+                            {"table_full_name": full_table_name, "columns": column_rows},
+                        )
+
+                except Exception as e:
+                    failed += 1
+                    log.warning(f"Failed to fetch details for table {full_table_name}: {str(e)}")
+
+        # Sync volumes for this schema
+        try:
+            volumes = volumes_future.result()
+        except Exception as e:
+            failed += 1
+            volumes = []
+            log.warning(f"Failed to fetch volumes for schema {full_schema_name}: {str(e)}")
+        for volume in volumes:
+            if is_unchanged(volume, since_ms):
+                continue
+            volume_name = volume.get("name")
+            full_volume_name = f"{catalog_name}.{schema_name}.{volume_name}"
+
+            emit(
+                table="volumes",
+                data={
+                    "full_name": full_volume_name,
+                    "catalog_name": catalog_name,
+                    "schema_name": schema_name,
+                    "volume_name": volume_name,
+                    "volume_type": volume.get("volume_type"),
+                    "storage_location": volume.get("storage_location"),
+                    "comment": volume.get("comment"),
+                    "owner": volume.get("owner"),
+                    "created_at": ms2str(volume.get("created_at")),
+                    "created_by": volume.get("created_by"),
+                    "updated_at": ms2str(volume.get("updated_at")),
+                    "updated_by": volume.get("updated_by"),
+                },
+            )
+
+        schema_done(schema_name, table_count, failed)
 
 
 def update(configuration: dict, state: dict):
@@ -223,162 +702,144 @@ def update(configuration: dict, state: dict):
         access_token=configuration["access_token"],
     )
 
+    column_json = columns_as_json(configuration)
+
     # Get optional catalog filter from configuration
     catalog_filter = (
-        configuration.get("catalog_filter", "").split(",")
+        frozenset(name.strip() for name in configuration["catalog_filter"].split(","))
         if configuration.get("catalog_filter")
         else None
     )
 
-    # Track last update time for incremental sync
+    # Track last update time for incremental sync. Each catalog keeps the
+    # start time of its last completed sync; objects not modified since then
+    # are skipped. Catalogs without one (first sync, or newly added to the
+    # filter) are synced in full.
     last_sync_time = state.get("last_sync_time", "1990-01-01T00:00:00Z")
-    current_sync_time = datetime.utcnow()
+    catalog_sync_times = state.setdefault("catalog_sync_times", {})
+    current_sync_time = dt2str(datetime.now(timezone.utc))
+
+    # Catalogs interrupted mid-sync, with their last finished schema and the
+    # start time of the sync that began them; resuming keeps that start time,
+    # so changes made while the earlier sync ran are not skipped next time.
+    # The cursor also carries the tables counted and whether anything failed
+    # in the schemas already finished.
+    cursors = state.setdefault("cursor", {})
+    progress = {}
 
     log.info(f"Last sync time: {last_sync_time}")
 
-    # Fetch and sync catalogs
+    # Fetch and sync catalogs. This runs before the worker pools start, so it
+    # also resolves DNS and opens the first keep-alive connection for them
     catalogs = client.list_catalogs()
     catalog_count = 0
+    buffer = UpsertBuffer()
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor, ThreadPoolExecutor(
+        max_workers=CATALOG_WORKERS
+    ) as catalog_executor:
+        # Catalogs are fetched in parallel; op.upsert is not thread-safe, so
+        # workers only fetch and queue rows, and this thread upserts them
+        rows = queue.Queue()
+
+        put = rows.put
+
+        def emit(table: str, data: Dict):
+            put((table, data))
+
+        # Progress markers share the queue so they stay behind their rows
+        def schema_done(catalog_name: str, schema_name: str, table_count: int, failed: int):
+            rows.put((None, (catalog_name, (schema_name, table_count, failed), None)))
+
+        pending = 0
+        for catalog in catalogs:
+            catalog_name = catalog.get("name")
+
+            # Apply catalog filter if specified
+            if catalog_filter and catalog_name not in catalog_filter:
+                log.fine(f"Skipping catalog {catalog_name} (not in filter)")
+                continue
+
+            synced_at = catalog_sync_times.get(catalog_name)
+            since_ms = str2ms(synced_at) if synced_at else None
+            cursor = cursors.get(catalog_name)
+            progress[catalog_name] = {
+                "started": cursor["started"] if cursor else current_sync_time,
+                "tables": cursor.get("tables", 0) if cursor else 0,
+                "failed": cursor.get("failed", False) if cursor else False,
+            }
+
+            future = catalog_executor.submit(
+                fetch_catalog,
+                client,
+                catalog,
+                since_ms,
+                executor,
+                emit,
+                functools.partial(schema_done, catalog_name),
+                cursor["schema"] if cursor else None,
+                column_json,
+            )
+            # Queued after the catalog's last row, so it marks the catalog done
+            future.add_done_callback(
+                lambda future, catalog_name=catalog_name: rows.put(
+                    (None, (catalog_name, None, future))
+                )
+            )
+            pending += 1
+
+        while pending:
+            table, data = rows.get()
+            if table is not None:
+                buffer.add(table=table, data=data)
+                continue
+
+            catalog_name, schema, future = data
+            catalog_progress = progress[catalog_name]
+            if future is None:
+                schema_name, table_count, failed = schema
+                catalog_progress["tables"] += table_count
+                catalog_progress["failed"] = catalog_progress["failed"] or failed > 0
+
+                # Checkpoint after each schema so a failed sync resumes mid-catalog
+                cursors[catalog_name] = dict(catalog_progress, schema=schema_name)
+                buffer.flush()
+                op.checkpoint(state)
+                continue
+
+            future.result()
+            pending -= 1
+            catalog_count += 1
+
+            # Objects that failed were skipped, so the catalog keeps its old
+            # sync time and the next sync picks them up again
+            complete = not catalog_progress["failed"]
+            if complete:
+                catalog_sync_times[catalog_name] = catalog_progress["started"]
+            else:
+                log.warning(
+                    f"Some objects in catalog {catalog_name} failed to sync; "
+                    "they will be retried on the next sync"
+                )
 
-    for catalog in catalogs:
-        catalog_name = catalog.get("name")
-
-        # Apply catalog filter if specified
-        if catalog_filter and catalog_name not in catalog_filter:
-            log.fine(f"Skipping catalog {catalog_name} (not in filter)")
-            continue
-
-        catalog_count += 1
-
-        # Sync catalog metadata
-        op.upsert(
-            table="catalogs",
-            data={
-                "catalog_name": catalog_name,
-                "catalog_type": catalog.get("catalog_type", "MANAGED_CATALOG"),
-                "comment": catalog.get("comment"),
-                "owner": catalog.get("owner"),
-                "created_at": dt2str(datetime.fromtimestamp(catalog.get("created_at", 0) / 1000)),
-                "created_by": catalog.get("created_by"),
-                "updated_at": dt2str(datetime.fromtimestamp(catalog.get("updated_at", 0) / 1000)),
-                "updated_by": catalog.get("updated_by"),
-                "metastore_id": catalog.get("metastore_id"),
-            },
-        )
-
-        # Fetch schemas for this catalog
-        schemas = client.list_schemas(catalog_name)
-
-        for schema in schemas:
-            schema_name = schema.get("name")
-            full_schema_name = f"{catalog_name}.{schema_name}"
-
-            # Sync schema metadata
-            op.upsert(
-                table="schemas",
+            # One status row per catalog and sync, so the destination shows
+            # when each catalog last synced even if none of its objects changed
+            buffer.add(
+                table="sync_status",
                 data={
-                    "full_name": full_schema_name,
                     "catalog_name": catalog_name,
-                    "schema_name": schema_name,
-                    "comment": schema.get("comment"),
-                    "owner": schema.get("owner"),
-                    "created_at": dt2str(
-                        datetime.fromtimestamp(schema.get("created_at", 0) / 1000)
-                    ),
-                    "created_by": schema.get("created_by"),
-                    "updated_at": dt2str(
-                        datetime.fromtimestamp(schema.get("updated_at", 0) / 1000)
-                    ),
-                    "updated_by": schema.get("updated_by"),
+                    "synced_at": current_sync_time,
+                    "table_count": catalog_progress["tables"],
+                    "complete": complete,
                 },
             )
 
-            # Fetch tables for this schema
-            tables = client.list_tables(catalog_name, schema_name)
-
-            for table in tables:
-                table_name = table.get("name")
-                full_table_name = f"{catalog_name}.{schema_name}.{table_name}"
-
-                # Get detailed table metadata
-                try:
-                    table_details = client.get_table_metadata(full_table_name)
-
-                    # Sync table metadata
-                    op.upsert(
-                        table="tables",
-                        data={
-                            "full_name": full_table_name,
-                            "catalog_name": catalog_name,
-                            "schema_name": schema_name,
-                            "table_name": table_name,
-                            "table_type": table_details.get("table_type"),
-                            "data_source_format": table_details.get("data_source_format"),
-                            "storage_location": table_details.get("storage_location"),
-                            "comment": table_details.get("comment"),
-                            "owner": table_details.get("owner"),
-                            "created_at": dt2str(
-                                datetime.fromtimestamp(table_details.get("created_at", 0) / 1000)
-                            ),
-                            "created_by": table_details.get("created_by"),
-                            "updated_at": dt2str(
-                                datetime.fromtimestamp(table_details.get("updated_at", 0) / 1000)
-                            ),
-                            "updated_by": table_details.get("updated_by"),
-                        },
-                    )
-
-                    # Sync column metadata
-                    columns = table_details.get("columns", [])
-                    for idx, column in enumerate(columns):
-                        op.upsert(
-                            table="columns",
-                            data={
-                                "table_full_name": full_table_name,
-                                "column_name": column.get("name"),
-                                "position": column.get("position", idx),
-                                "data_type": column.get("type_text", column.get("type_name")),
-                                "nullable": column.get("nullable", True),
-                                "comment": column.get("comment"),
-                                "partition_index": column.get("partition_index"),
-                            },
-                        )
-
-                except Exception as e:
-                    log.warning(f"Failed to fetch details for table {full_table_name}: {str(e)}")
-
-            # Fetch volumes for this schema
-            volumes = client.list_volumes(catalog_name, schema_name)
-            for volume in volumes:
-                volume_name = volume.get("name")
-                full_volume_name = f"{catalog_name}.{schema_name}.{volume_name}"
-
-                op.upsert(
-                    table="volumes",
-                    data={
-                        "full_name": full_volume_name,
-                        "catalog_name": catalog_name,
-                        "schema_name": schema_name,
-                        "volume_name": volume_name,
-                        "volume_type": volume.get("volume_type"),
-                        "storage_location": volume.get("storage_location"),
-                        "comment": volume.get("comment"),
-                        "owner": volume.get("owner"),
-                        "created_at": dt2str(
-                            datetime.fromtimestamp(volume.get("created_at", 0) / 1000)
-                        ),
-                        "created_by": volume.get("created_by"),
-                        "updated_at": dt2str(
-                            datetime.fromtimestamp(volume.get("updated_at", 0) / 1000)
-                        ),
-                        "updated_by": volume.get("updated_by"),
-                    },
-                )
-
-        # Checkpoint after each catalog
-        state["last_sync_time"] = dt2str(current_sync_time)
-        state["catalogs_synced"] = catalog_count
-        op.checkpoint(state)
+            # Checkpoint after each catalog
+            cursors.pop(catalog_name, None)
+            state["last_sync_time"] = current_sync_time
+            state["catalogs_synced"] = catalog_count
+            buffer.flush()
+            op.checkpoint(state)
 
     log.info(f"Sync completed. Processed {catalog_count} catalogs")
 
@@ -389,7 +850,7 @@ connector = Connector(update=update, schema=schema)
 # Check if the script is being run as the main module.
 if __name__ == "__main__":
     # Open the configuration.json file and load its contents into a dictionary.
-    with open("configuration.json", "r") as f:
-        configuration = json.load(f)
+    with open("configuration.json", "rb") as f:
+        configuration = json_loads(f.read())
     # Test the connector locally
     connector.debug(configuration=configuration)
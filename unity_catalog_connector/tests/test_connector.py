@@ -0,0 +1,188 @@
+"""Unit tests for the Unity Catalog connector's incremental sync."""
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+import connector
+
+OLD = 1_000_000
+NEW = 3_000_000
+SYNCED_AT = connector.ms2str(2_000_000)
+
+
+def _api() -> dict:
+    """One catalog, one schema, one changed and one unchanged table."""
+    return {
+        "catalogs": [{"name": "main", "created_at": OLD, "updated_at": OLD}],
+        "schemas": {"main": [{"name": "sales", "updated_at": OLD}]},
+        "tables": {
+            ("main", "sales"): [
+                {"name": "orders", "updated_at": NEW, "columns": [{"name": "id"}]},
+                {"name": "stale", "updated_at": OLD, "columns": [{"name": "id"}]},
+            ],
+        },
+        "volumes": [{"name": "raw", "updated_at": NEW}],
+    }
+
+
+class TestIncrementalSync(unittest.TestCase):
+    """Test update() against a fake Unity Catalog API."""
+
+    def setUp(self) -> None:
+        """Set up test fixtures."""
+        self.api = _api()
+        self.calls = []
+        patcher = patch.object(
+            connector.UnityCatalogClient, "_make_request", autospec=True, side_effect=self._request
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.op = MagicMock()
+        for name, mock in (("op", self.op), ("log", MagicMock())):
+            patcher = patch.object(connector, name, mock)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _request(self, client, endpoint, method="GET", params=None):
+        self.calls.append(endpoint)
+        params = params or {}
+        if endpoint == "catalogs":
+            return {"catalogs": self.api["catalogs"]}
+        if endpoint == "schemas":
+            return {"schemas": self.api["schemas"][params["catalog_name"]]}
+        if endpoint == "tables":
+            key = (params["catalog_name"], params["schema_name"])
+            return {"tables": self.api["tables"][key]}
+        if endpoint.startswith("tables/"):
+            raise requests.exceptions.ConnectionError("connection reset")
+        if endpoint == "volumes":
+            volumes = self.api["volumes"]
+            if isinstance(volumes, Exception):
+                raise volumes
+            return {"volumes": volumes}
+        raise AssertionError(f"unexpected endpoint {endpoint}")
+
+    def _sync(self, state: dict) -> dict:
+        self.op.reset_mock()
+        self.calls.clear()
+        connector.update({"workspace_url": "https://uc", "access_token": "t"}, state)
+        return state
+
+    def _upserted(self, table: str) -> list:
+        return [
+            c.kwargs["data"] for c in self.op.upsert.call_args_list if c.kwargs["table"] == table
+        ]
+
+    def test_full_sync_emits_everything(self) -> None:
+        """Test a first sync emits every object and records the catalog."""
+        state = self._sync({})
+
+        self.assertEqual(len(self._upserted("catalogs")), 1)
+        self.assertEqual(len(self._upserted("schemas")), 1)
+        self.assertEqual(
+            [t["table_name"] for t in self._upserted("tables")], ["orders", "stale"]
+        )
+        self.assertEqual(len(self._upserted("volumes")), 1)
+        self.assertIn("main", state["catalog_sync_times"])
+        self.assertEqual(state["cursor"], {})
+
+    def test_incremental_sync_skips_unchanged(self) -> None:
+        """Test objects not modified since the catalog's last sync are skipped."""
+        state = self._sync({"catalog_sync_times": {"main": SYNCED_AT}})
+
+        self.assertEqual(self._upserted("catalogs"), [])
+        self.assertEqual(self._upserted("schemas"), [])
+        self.assertEqual([t["table_name"] for t in self._upserted("tables")], ["orders"])
+        self.assertEqual(
+            [c["table_full_name"] for c in self._upserted("columns")], ["main.sales.orders"]
+        )
+        self.assertEqual(len(self._upserted("volumes")), 1)
+        self.assertGreater(state["catalog_sync_times"]["main"], SYNCED_AT)
+
+    def test_sync_status_written_every_sync(self) -> None:
+        """Test each sync upserts a status row even when nothing changed."""
+        for table in self.api["tables"][("main", "sales")]:
+            table["updated_at"] = OLD
+        self.api["volumes"] = []
+
+        self._sync({"catalog_sync_times": {"main": SYNCED_AT}})
+
+        self.assertEqual(self._upserted("tables"), [])
+        [status] = self._upserted("sync_status")
+        self.assertEqual(status["catalog_name"], "main")
+        self.assertEqual(status["table_count"], 2)
+        self.assertTrue(status["complete"])
+
+    def test_failed_table_keeps_catalog_cursor(self) -> None:
+        """Test a table whose details fail is retried by the next sync."""
+        del self.api["tables"][("main", "sales")][0]["columns"]
+
+        state = self._sync({"catalog_sync_times": {"main": SYNCED_AT}})
+
+        self.assertEqual(self._upserted("tables"), [])
+        self.assertEqual(state["catalog_sync_times"]["main"], SYNCED_AT)
+        self.assertFalse(self._upserted("sync_status")[0]["complete"])
+
+        self.api = _api()
+        state = self._sync(state)
+        self.assertEqual([t["table_name"] for t in self._upserted("tables")], ["orders"])
+        self.assertGreater(state["catalog_sync_times"]["main"], SYNCED_AT)
+
+    def test_failed_volumes_keep_catalog_cursor(self) -> None:
+        """Test a transient volume listing error does not advance the catalog."""
+        self.api["volumes"] = requests.exceptions.HTTPError(
+            "503", response=MagicMock(status_code=503, content=b"{}")
+        )
+
+        state = self._sync({"catalog_sync_times": {"main": SYNCED_AT}})
+
+        self.assertEqual(len(self._upserted("tables")), 1)
+        self.assertEqual(state["catalog_sync_times"]["main"], SYNCED_AT)
+
+    def test_unsupported_volumes_are_skipped(self) -> None:
+        """Test workspaces without volumes still advance and stop asking."""
+        self.api["schemas"]["main"].append({"name": "support", "updated_at": OLD})
+        self.api["tables"][("main", "support")] = []
+        self.api["volumes"] = requests.exceptions.HTTPError(
+            "404",
+            response=MagicMock(status_code=404, content=b'{"error_code": "ENDPOINT_NOT_FOUND"}'),
+        )
+
+        state = self._sync({"catalog_sync_times": {"main": SYNCED_AT}})
+
+        self.assertEqual(self.calls.count("volumes"), 1)
+        self.assertGreater(state["catalog_sync_times"]["main"], SYNCED_AT)
+        self.assertTrue(self._upserted("sync_status")[0]["complete"])
+
+    def test_resume_skips_finished_schemas(self) -> None:
+        """Test an interrupted catalog resumes after its last finished schema."""
+        self.api["schemas"]["main"].insert(0, {"name": "analytics", "updated_at": NEW})
+        started = connector.ms2str(2_500_000)
+        cursor = {"schema": "analytics", "started": started, "tables": 4, "failed": False}
+
+        state = self._sync(
+            {"catalog_sync_times": {"main": SYNCED_AT}, "cursor": {"main": cursor}}
+        )
+
+        # analytics has no tables in the fake API, so listing it would fail
+        self.assertEqual(self._upserted("schemas"), [])
+        self.assertEqual(state["catalog_sync_times"]["main"], started)
+        self.assertEqual(self._upserted("sync_status")[0]["table_count"], 6)
+
+    def test_resume_keeps_earlier_failures(self) -> None:
+        """Test failures before an interruption still hold the catalog back."""
+        cursor = {"schema": "", "started": SYNCED_AT, "tables": 0, "failed": True}
+
+        state = self._sync(
+            {"catalog_sync_times": {"main": connector.ms2str(OLD)}, "cursor": {"main": cursor}}
+        )
+
+        self.assertEqual([t["table_name"] for t in self._upserted("tables")], ["orders"])
+        self.assertEqual(state["catalog_sync_times"]["main"], connector.ms2str(OLD))
+        self.assertEqual(state["cursor"], {})
+
+
+if __name__ == "__main__":
+    unittest.main()